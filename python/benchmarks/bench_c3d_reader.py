@@ -0,0 +1,157 @@
+"""Benchmark C3D ingestion, tidy tables and exports on synthetic captures.
+
+Run with ``python -m pytest python/benchmarks/bench_c3d_reader.py
+--benchmark-only`` (requires ``pytest-benchmark``). Each benchmark runs once
+per capture size (``--capture-sizes=small,medium,huge``); see ``conftest.py``
+for saving baselines and failing on regressions with ``--benchmark-compare``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.c3d_reader import C3DDataReader, C3DPointArray
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+    from benchmarks.conftest import BenchmarkCapture
+
+pytest.importorskip("pytest_benchmark")
+
+EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+BACKENDS = ["native"] + (["ezc3d"] if EZC3D_AVAILABLE else [])
+EXPORT_FORMATS = ["csv", "json", "npz", "parquet", "feather"]
+
+POINT_TABLES = {
+    "all": {},
+    "club": {"markers": "club"},
+    "residual": {"residual_nan_threshold": 2.0},
+    "meters": {"target_units": "m"},
+}
+
+
+def _decoded_reader(capture: BenchmarkCapture) -> C3DDataReader:
+    """A reader whose points and analogs are already decoded."""
+    reader = C3DDataReader(capture.path)
+    reader.points_array()
+    reader.analog_dataframe()
+    return reader
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_load_points(
+    benchmark: BenchmarkFixture, synthetic_capture: BenchmarkCapture, backend: str
+) -> None:
+    """Open a capture and decode every marker trajectory."""
+
+    def load() -> C3DPointArray:
+        return C3DDataReader(synthetic_capture.path, backend=backend).points_array()
+
+    points = benchmark.pedantic(load, rounds=synthetic_capture.rounds)
+    assert points.frame_count == synthetic_capture.spec.frame_count
+
+
+@pytest.mark.parametrize("variant", POINT_TABLES)
+def test_points_dataframe(
+    benchmark: BenchmarkFixture, synthetic_capture: BenchmarkCapture, variant: str
+) -> None:
+    """Tidy marker table with marker, residual and unit options."""
+    reader = _decoded_reader(synthetic_capture)
+    frame = benchmark.pedantic(
+        reader.points_dataframe,
+        kwargs=POINT_TABLES[variant],
+        rounds=synthetic_capture.rounds,
+    )
+    assert len(frame) > 0
+
+
+def test_analog_dataframe(
+    benchmark: BenchmarkFixture, synthetic_capture: BenchmarkCapture
+) -> None:
+    """Tidy analog table over every channel and subframe."""
+    reader = _decoded_reader(synthetic_capture)
+    frame = benchmark.pedantic(reader.analog_dataframe, rounds=synthetic_capture.rounds)
+    spec = synthetic_capture.spec
+    assert len(frame) == spec.frame_count * spec.analog_subframes * spec.analog_channels
+
+
+@pytest.mark.parametrize("file_format", EXPORT_FORMATS)
+def test_export_points(
+    benchmark: BenchmarkFixture,
+    synthetic_capture: BenchmarkCapture,
+    tmp_path: Path,
+    file_format: str,
+) -> None:
+    """Whole-table marker export in every supported format."""
+    if file_format in ("parquet", "feather"):
+        pytest.importorskip("pyarrow")
+    reader = _decoded_reader(synthetic_capture)
+    output = tmp_path / f"points.{file_format}"
+    path = benchmark.pedantic(
+        reader.export_points,
+        args=(output,),
+        rounds=synthetic_capture.rounds,
+    )
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson"])
+def test_stream_points(
+    benchmark: BenchmarkFixture,
+    synthetic_capture: BenchmarkCapture,
+    tmp_path: Path,
+    file_format: str,
+) -> None:
+    """Chunked marker export in the line-oriented formats."""
+    reader = _decoded_reader(synthetic_capture)
+    output = tmp_path / f"points.{file_format}"
+    path = benchmark.pedantic(
+        reader.stream_points,
+        args=(output,),
+        kwargs={"chunk_frames": 10_000},
+        rounds=synthetic_capture.rounds,
+    )
+    assert path.stat().st_size > 0
+
+
+@pytest.mark.parametrize("file_format", ["csv", "parquet"])
+def test_export_analog(
+    benchmark: BenchmarkFixture,
+    synthetic_capture: BenchmarkCapture,
+    tmp_path: Path,
+    file_format: str,
+) -> None:
+    """Whole-table analog export."""
+    if file_format == "parquet":
+        pytest.importorskip("pyarrow")
+    reader = _decoded_reader(synthetic_capture)
+    output = tmp_path / f"analog.{file_format}"
+    path = benchmark.pedantic(
+        reader.export_analog,
+        args=(output,),
+        rounds=synthetic_capture.rounds,
+    )
+    assert path.stat().st_size > 0
+
+
+def test_compute_marker_statistics(
+    benchmark: BenchmarkFixture, synthetic_capture: BenchmarkCapture
+) -> None:
+    """Viewer path length and speed statistics over every marker."""
+    viewer = pytest.importorskip("src.apps.c3d_viewer")
+    points = _decoded_reader(synthetic_capture).points_array()
+    time = points.time
+
+    def statistics() -> list[dict[str, float]]:
+        return [
+            viewer.compute_marker_statistics(time, points.coordinates[:, marker])
+            for marker in range(points.coordinates.shape[1])
+        ]
+
+    results = benchmark.pedantic(statistics, rounds=synthetic_capture.rounds)
+    assert len(results) == synthetic_capture.spec.marker_count
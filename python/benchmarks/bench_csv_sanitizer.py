@@ -0,0 +1,62 @@
+"""Benchmark the vectorized CSV injection sanitizer against per-cell apply.
+
+Run with ``python -m pytest python/benchmarks/bench_csv_sanitizer.py
+--benchmark-only`` (requires ``pytest-benchmark``). The tidy table mirrors a
+long capture: 38 markers, a few of them formula-like, over 50,000 frames.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.c3d_reader import C3DDataReader
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+MARKER_COUNT = 38
+FRAME_COUNT = 50_000
+
+
+@pytest.fixture(scope="module")
+def marker_column() -> pd.Series:
+    """Object-dtype marker column with some labels that need escaping."""
+    labels = np.array(
+        [f"-Marker{idx}" if idx % 5 == 0 else f"Marker{idx}" for idx in range(38)],
+        dtype=object,
+    )
+    return pd.Series(np.tile(labels, FRAME_COUNT), dtype=object)
+
+
+def test_legacy_per_cell_apply(
+    benchmark: BenchmarkFixture, marker_column: pd.Series
+) -> None:
+    """Baseline: ``Series.apply`` of the scalar sanitizer."""
+    benchmark(marker_column.apply, C3DDataReader._sanitize_for_csv)
+
+
+def test_vectorized_object_column(
+    benchmark: BenchmarkFixture, marker_column: pd.Series
+) -> None:
+    """Prefix-mask sanitizer over an object column."""
+    result = benchmark(C3DDataReader._sanitize_series, marker_column)
+    np.testing.assert_array_equal(
+        result, marker_column.apply(C3DDataReader._sanitize_for_csv)
+    )
+
+
+def test_vectorized_categorical_column(
+    benchmark: BenchmarkFixture, marker_column: pd.Series
+) -> None:
+    """Sanitizer over a categorical column only touches the categories."""
+    categorical = marker_column.astype("category")
+    result = benchmark(C3DDataReader._sanitize_series, categorical)
+    np.testing.assert_array_equal(
+        result.astype(object), marker_column.apply(C3DDataReader._sanitize_for_csv)
+    )
@@ -0,0 +1,64 @@
+"""Benchmark package import time against a start-up budget.
+
+Run with ``python -m pytest python/benchmarks/bench_import_time.py
+--benchmark-only`` (requires ``pytest-benchmark``). Each round imports the
+module in a fresh interpreter under ``python -X importtime`` and records the
+cumulative time the interpreter reports for it, so short-lived batch tools
+notice when a heavy dependency (pandas, pyarrow, ezc3d) creeps back into
+``import src``.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+PYTHON_ROOT = Path(__file__).resolve().parents[1]
+ROUNDS = 10
+
+# Cumulative import budgets in milliseconds; the fastest round must fit.
+IMPORT_BUDGETS_MS = {
+    "src": 25.0,
+    "src.c3d_reader": 2000.0,
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s?( *)(\S+)")
+
+
+def _import_time_ms(module: str) -> float:
+    """Cumulative import time of ``module`` in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PYTHON_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match and not match.group(2) and match.group(3) == module:
+            return int(match.group(1)) / 1000.0
+    raise AssertionError(f"No importtime record for {module!r}")
+
+
+@pytest.mark.parametrize("module", IMPORT_BUDGETS_MS)
+def test_import_time(benchmark: BenchmarkFixture, module: str) -> None:
+    """Import each module in a fresh interpreter within its budget."""
+    timings: list[float] = []
+
+    def measure() -> None:
+        timings.append(_import_time_ms(module))
+
+    benchmark.pedantic(measure, rounds=ROUNDS)
+    benchmark.extra_info["import_ms"] = min(timings)
+    assert min(timings) <= IMPORT_BUDGETS_MS[module]
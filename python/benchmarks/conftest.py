@@ -0,0 +1,141 @@
+"""Synthetic captures and the regression gate of the benchmark suite.
+
+Benchmarks that request the ``synthetic_capture`` fixture run once per capture
+size selected with ``--capture-sizes`` (``small`` and ``medium`` by default;
+``huge`` is opt-in). Captures are written by :mod:`src.synthetic`, so every
+machine benchmarks byte-identical files. Pass ``--capture-directory`` to keep
+the generated files between runs instead of rewriting them.
+
+Runs are saved as pytest-benchmark JSON under ``python/benchmarks/baselines``
+unless ``--benchmark-storage`` says otherwise. pytest-benchmark files them per
+machine id (e.g. ``Linux-CPython-3.11-64bit``) and compares against the latest
+run for the current one; the committed baseline covers the ``small`` size::
+
+    python -m pytest python/benchmarks --benchmark-only --benchmark-save=baseline
+    python -m pytest python/benchmarks --benchmark-only --benchmark-compare
+
+A comparison fails the run when a benchmark regresses by more than
+``--max-regression`` (``mean:20%`` by default), unless an explicit
+``--benchmark-compare-fail`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from src.synthetic import SyntheticCapture, write_synthetic_c3d
+
+CAPTURE_SIZES = {
+    "small": SyntheticCapture(
+        analog_channels=4, analog_subframes=10, gaps_per_marker=2
+    ),
+    "medium": SyntheticCapture(
+        marker_count=60,
+        frame_count=10_000,
+        analog_channels=8,
+        analog_subframes=10,
+        gaps_per_marker=10,
+    ),
+    "huge": SyntheticCapture(
+        marker_count=100,
+        frame_count=200_000,
+        analog_channels=32,
+        analog_subframes=10,
+        gaps_per_marker=50,
+    ),
+}
+
+# Timed rounds per capture size; large captures are too slow for calibration.
+ROUNDS = {"small": 20, "medium": 3, "huge": 1}
+
+DEFAULT_SIZES = "small,medium"
+DEFAULT_MAX_REGRESSION = "mean:20%"
+BASELINE_DIRECTORY = Path(__file__).resolve().parent / "baselines"
+
+# pytest-benchmark's default storage, replaced by BASELINE_DIRECTORY.
+_DEFAULT_STORAGE = "file://./.benchmarks"
+
+
+@dataclass(frozen=True)
+class BenchmarkCapture:
+    """A synthetic capture written to disk for one benchmark size."""
+
+    size: str
+    path: Path
+    spec: SyntheticCapture
+    rounds: int
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("c3d benchmarks")
+    group.addoption(
+        "--capture-sizes",
+        default=DEFAULT_SIZES,
+        help=f"Comma-separated capture sizes out of {sorted(CAPTURE_SIZES)}.",
+    )
+    group.addoption(
+        "--capture-directory",
+        default=None,
+        help="Directory reused for the generated captures across runs.",
+    )
+    group.addoption(
+        "--max-regression",
+        default=DEFAULT_MAX_REGRESSION,
+        help="pytest-benchmark --benchmark-compare-fail expressions applied to "
+        "--benchmark-compare runs, comma-separated (e.g. 'mean:10%,min:5%').",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs before pytest-benchmark reads its options (its hook is trylast).
+    if not hasattr(config.option, "benchmark_storage"):
+        return
+    if config.option.benchmark_storage == _DEFAULT_STORAGE:
+        config.option.benchmark_storage = f"file://{BASELINE_DIRECTORY}"
+    if config.option.benchmark_compare and not config.option.benchmark_compare_fail:
+        from pytest_benchmark.utils import parse_compare_fail
+
+        expressions = config.getoption("max_regression").split(",")
+        try:
+            config.option.benchmark_compare_fail = [
+                parse_compare_fail(expression.strip())
+                for expression in expressions
+                if expression.strip()
+            ]
+        except argparse.ArgumentTypeError as exc:
+            raise pytest.UsageError(f"--max-regression: {exc}") from exc
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    if "synthetic_capture" not in metafunc.fixturenames:
+        return
+    sizes = [
+        size.strip()
+        for size in metafunc.config.getoption("capture_sizes").split(",")
+        if size.strip()
+    ]
+    unknown = sorted(set(sizes) - set(CAPTURE_SIZES))
+    if unknown:
+        raise pytest.UsageError(f"Unknown capture sizes: {', '.join(unknown)}")
+    metafunc.parametrize("synthetic_capture", sizes, indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def synthetic_capture(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> BenchmarkCapture:
+    """The synthetic capture of the requested size, written once per session."""
+    size = request.param
+    spec = CAPTURE_SIZES[size]
+    directory = request.config.getoption("capture_directory")
+    root = Path(directory) if directory else tmp_path_factory.mktemp("captures")
+    digest = hashlib.blake2b(repr(spec).encode("utf-8"), digest_size=6).hexdigest()
+    path = root / f"{size}-{digest}.c3d"
+    if not path.exists():
+        write_synthetic_c3d(path, spec)
+    return BenchmarkCapture(size=size, path=path, spec=spec, rounds=ROUNDS[size])
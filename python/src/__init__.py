@@ -1,41 +1,50 @@
-"""Project package init."""
-
-from typing import Any, List
-
-# Define stubs first to avoid MyPy redefinition errors
-_C3D_AVAILABLE = False
-_C3DDataReader: Any = None
-_C3DEvent: Any = None
-_C3DMetadata: Any = None
-_load_tour_average_reader: Any = None
-
-try:
-    from .c3d_reader import (
-        C3DDataReader as _C3DDataReader_imported,
-        C3DEvent as _C3DEvent_imported,
-        C3DMetadata as _C3DMetadata_imported,
-        load_tour_average_reader as _load_tour_average_reader_imported,
-    )
-
-    _C3D_AVAILABLE = True
-    _C3DDataReader = _C3DDataReader_imported
-    _C3DEvent = _C3DEvent_imported
-    _C3DMetadata = _C3DMetadata_imported
-    _load_tour_average_reader = _load_tour_average_reader_imported
-except ImportError:
-    # ezc3d not available (e.g., Python 3.9)
-    # Stubs remain as None - will raise RuntimeError when used
-    pass
-
-# Export the names (either imported or None stubs)
-C3DDataReader = _C3DDataReader
-C3DEvent = _C3DEvent
-C3DMetadata = _C3DMetadata
-load_tour_average_reader = _load_tour_average_reader
-
-__all__: List[str] = [
+"""Project package init.
+
+The C3D reader exports are resolved on first attribute access (PEP 562), so
+importing ``src`` or one of its lightweight submodules does not pay for
+pandas, pyarrow and ezc3d until a reader is actually used.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# Not imported from typing, which alone costs more than the rest of the package.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .c3d_reader import C3DDataReader as C3DDataReader
+    from .c3d_reader import C3DEvent as C3DEvent
+    from .c3d_reader import C3DMetadata as C3DMetadata
+    from .c3d_reader import load_tour_average_reader as load_tour_average_reader
+
+__all__ = [
     "C3DDataReader",
     "C3DEvent",
     "C3DMetadata",
     "load_tour_average_reader",
 ]
+
+# Public name -> submodule that defines it.
+_LAZY_EXPORTS = {
+    "C3DDataReader": "c3d_reader",
+    "C3DEvent": "c3d_reader",
+    "C3DMetadata": "c3d_reader",
+    "load_tour_average_reader": "c3d_reader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # An ImportError (e.g. ezc3d missing) propagates, so a broken optional
+    # dependency is reported where the export is used instead of as ``None``.
+    module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
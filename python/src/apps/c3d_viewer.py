@@ -29,6 +29,15 @@ from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
 
+try:
+    from ..kinematics import Kinematics, compute_kinematics
+except ImportError:
+    # Run as a script or imported as ``apps.c3d_viewer`` from python/src.
+    sys.path.insert(
+        0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+    from src.kinematics import Kinematics, compute_kinematics
+
 
 # ---------------------------------------------------------------------------
 # Data model for C3D content
@@ -59,11 +68,25 @@ class C3DDataModel:
     point_time: Optional[npt.NDArray[np.float64]] = None
     analog_time: Optional[npt.NDArray[np.float64]] = None
     metadata: Dict[str, str] = field(default_factory=dict)
+    _kinematics: Kinematics | None = field(default=None, init=False, repr=False)
 
     def marker_names(self) -> List[str]:
         """Return list of marker names."""
         return list(self.markers.keys())
 
+    def kinematics(self) -> Kinematics | None:
+        """Return the kinematics of every marker, computed once per model.
+
+        Returns None when there are no markers or the point rate is unknown.
+        """
+        if self._kinematics is None and self.markers and self.point_rate > 0:
+            self._kinematics = compute_kinematics(
+                np.stack([m.position for m in self.markers.values()], axis=1),
+                self.point_rate,
+                marker_labels=self.marker_names(),
+            )
+        return self._kinematics
+
     def analog_names(self) -> List[str]:
         """Return list of analog channel names."""
         return list(self.analog.keys())
@@ -113,30 +136,20 @@ def compute_marker_statistics(
     - total path length
     - max speed
     - mean speed
+
+    The values come from :meth:`Kinematics.summary`, with the frame rate
+    taken from the (uniform) time vector.
     """
+    statistics = {"path_length": np.nan, "max_speed": np.nan, "mean_speed": np.nan}
     if pos.shape[0] < 2 or time is None or len(time) != pos.shape[0]:
-        return {
-            "path_length": np.nan,
-            "max_speed": np.nan,
-            "mean_speed": np.nan,
-        }
+        return statistics
+    duration = float(time[-1] - time[0])
+    if not np.isfinite(duration) or duration <= 0:
+        return statistics
 
-    dt = np.diff(time)
-    dt[dt <= 0] = np.nan  # avoid division by zero
-
-    disp = np.diff(pos, axis=0)  # (N-1, 3)
-    segment_length = np.linalg.norm(disp, axis=1)
-    speed = segment_length / dt
-
-    path_length = np.nansum(segment_length)
-    max_speed = np.nanmax(speed)
-    mean_speed = np.nanmean(speed)
-
-    return {
-        "path_length": float(path_length),
-        "max_speed": float(max_speed),
-        "mean_speed": float(mean_speed),
-    }
+    frame_rate = (len(time) - 1) / duration
+    summary = compute_kinematics(pos[:, np.newaxis, :], frame_rate).summary()
+    return {key: float(summary[key].iloc[0]) for key in statistics}
 
 
 # ---------------------------------------------------------------------------
@@ -625,12 +638,9 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
             ax.legend()
         else:
             # Speed magnitude
-            disp = np.diff(pos, axis=0)
-            dt = np.diff(t)
-            dt[dt <= 0] = np.nan
-            speed = np.linalg.norm(disp, axis=1) / dt
-            # Align length with t (N-1)
-            ax.plot(t[1:], speed, label="Speed magnitude")
+            kinematics = self.model.kinematics()
+            if kinematics is not None:
+                ax.plot(t, kinematics.marker(name, "speed"), label="Speed magnitude")
             ax.set_ylabel("Speed (units/s)")
             ax.legend()
 
@@ -763,8 +773,14 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
 
         t = self.model.point_time
         pos = marker.position
+        kinematics = self.model.kinematics()
+        if kinematics is None:
+            self.text_analysis.setPlainText("No marker / time data available.")
+            self.canvas_analysis.clear_axes()
+            return
 
-        stats = compute_marker_statistics(t, pos)
+        stats = kinematics.summary().loc[marker_name]
+        speed = kinematics.marker(marker_name, "speed")
 
         # Text summary
         text_lines = [
@@ -775,42 +791,28 @@ class C3DViewerMainWindow(QtWidgets.QMainWindow):
             f"  Total path length: {stats['path_length']:.4f} (position units)",
             f"  Max speed:         {stats['max_speed']:.4f} (position units/s)",
             f"  Mean speed:        {stats['mean_speed']:.4f} (position units/s)",
+            "",
         ]
-
-        # Find approximate peak speed frame, if sensible
-        if pos.shape[0] > 2:
-            disp = np.diff(pos, axis=0)
-            dt = np.diff(t)
-            dt[dt <= 0] = np.nan
-            speed = np.linalg.norm(disp, axis=1) / dt
-            if np.all(np.isnan(speed)):
-                text_lines.append("")
-                text_lines.append("  Peak speed: N/A (all speeds are NaN)")
-            else:
-                peak_idx = int(np.nanargmax(speed))
-                peak_time = t[peak_idx + 1]
-                text_lines.append("")
-                text_lines.append(
-                    f"  Peak speed at time: {peak_time:.4f} s (frame {peak_idx + 1})"
-                )
+        if stats["peak_frame"] < 0:
+            text_lines.append("  Peak speed: N/A (all speeds are NaN)")
+        else:
+            text_lines.append(
+                f"  Peak speed at time: {stats['peak_time']:.4f} s "
+                f"(frame {int(stats['peak_frame'])})"
+            )
 
         self.text_analysis.setPlainText("\n".join(text_lines))
 
         # Speed plot
         self.canvas_analysis.fig.clear()
         ax = self.canvas_analysis.add_subplot(111)
-        if pos.shape[0] > 2:
-            disp = np.diff(pos, axis=0)
-            dt = np.diff(t)
-            dt[dt <= 0] = np.nan
-            speed = np.linalg.norm(disp, axis=1) / dt
-            ax.plot(t[1:], speed, label="Speed magnitude")
-            ax.set_xlabel("Time (s)")
-            ax.set_ylabel("Speed (units/s)")
-            ax.set_title(f"Speed profile: {marker_name}")
-            ax.grid(True)
-            ax.legend()
-            self.canvas_analysis.fig.tight_layout()
+        ax.plot(t, speed, label="Speed magnitude")
+        ax.set_xlabel("Time (s)")
+        ax.set_ylabel("Speed (units/s)")
+        ax.set_title(f"Speed profile: {marker_name}")
+        ax.grid(True)
+        ax.legend()
+        self.canvas_analysis.fig.tight_layout()
 
         self.canvas_analysis.draw()  # type: ignore
 
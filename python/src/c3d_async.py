@@ -0,0 +1,281 @@
+"""Asyncio front end for C3D loading in service-style deployments.
+
+Parsing a capture blocks for the whole decode, which would stall an event
+loop. :class:`AsyncC3DLoader` runs parses on a bounded thread pool, coalesces
+concurrent requests for the same file into a single parse, and limits the
+number of captures being decoded or accessed at once so a burst of uploads
+queues. Readers keep their decoded arrays between calls unless the loader is
+created with ``retain="none"``, which bounds resident memory by the same limit.
+:class:`AsyncC3DReader` exposes awaitable counterparts of the
+:class:`~src.c3d_reader.C3DDataReader` accessors on top of a loader.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TypeVar
+
+import pandas as pd
+
+from .c3d_cache import C3DCache
+from .c3d_reader import C3DDataReader, C3DMetadata, C3DPointArray, MarkerSelection
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 4
+
+
+@dataclass
+class _LoopState:
+    """Per-event-loop synchronization primitives of a loader."""
+
+    semaphore: asyncio.Semaphore
+    inflight: dict[Path, asyncio.Future[C3DDataReader]] = field(default_factory=dict)
+
+
+class AsyncC3DLoader:
+    """Bounded, coalescing executor for C3D parses.
+
+    A loader may be shared by many :class:`AsyncC3DReader` instances and by
+    several event loops; each loop gets its own concurrency limit and set of
+    in-flight parses. Coalesced readers are shared, so calls on one reader are
+    serialized through :meth:`access`.
+
+    The concurrency limit bounds memory only with ``retain="none"``. With the
+    default ``retain="all"`` every loaded reader keeps its decoded arrays for
+    as long as it is referenced, however many slots there are.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_concurrent_loads: int | None = None,
+        *,
+        backend: str = "ezc3d",
+        cache: C3DCache | None = None,
+        retain: str = "all",
+    ) -> None:
+        """Create a loader.
+
+        Args:
+            max_workers: Size of the thread pool running parses and accessors.
+            max_concurrent_loads: Maximum number of captures decoded or accessed
+                at the same time. Further loads and accessor calls wait for a
+                slot. Defaults to ``max_workers``.
+            backend: ``C3DDataReader`` backend used for parsing.
+            cache: Optional persistent cache shared by all readers.
+            retain: ``C3DDataReader`` retain mode of loaded readers. With
+                ``"none"`` decoded data is dropped after every accessor call,
+                so only captures holding a slot stay in memory; later calls
+                decode the file again.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        if max_concurrent_loads is not None and max_concurrent_loads < 1:
+            raise ValueError("max_concurrent_loads must be a positive integer.")
+        self.backend = backend
+        self.cache = cache
+        self.retain = retain
+        self.max_concurrent_loads = max_concurrent_loads or max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="c3d-load"
+        )
+        self._states: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _LoopState
+        ] = weakref.WeakKeyDictionary()
+        self._reader_locks: weakref.WeakKeyDictionary[C3DDataReader, threading.Lock] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._reader_locks_guard = threading.Lock()
+
+    async def load(self, file_path: Path | str) -> C3DDataReader:
+        """Return a reader whose point and analog data are already decoded.
+
+        Concurrent calls for the same file share one parse.
+        """
+
+        path = Path(file_path).resolve()
+        state = self._state()
+        future = state.inflight.get(path)
+        if future is None:
+            future = asyncio.ensure_future(self._parse(path, state))
+            state.inflight[path] = future
+            future.add_done_callback(lambda _: state.inflight.pop(path, None))
+        else:
+            logger.debug("Coalescing load of %s", path)
+        return await asyncio.shield(future)
+
+    async def access(
+        self,
+        reader: C3DDataReader,
+        func: Callable[..., T],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run a ``reader`` accessor on the thread pool, holding a load slot.
+
+        Calls on the same reader run one at a time, because the reader's
+        caches are not thread-safe and coalesced readers are shared.
+        """
+
+        lock = self._reader_lock(reader)
+
+        def locked() -> T:
+            with lock:
+                return func(*args, **kwargs)
+
+        async with self._state().semaphore:
+            return await self.run(locked)
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the loader's thread pool."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def close(self) -> None:
+        """Shut down the thread pool, waiting for running jobs to finish."""
+
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> AsyncC3DLoader:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    def _state(self) -> _LoopState:
+        """Synchronization state for the running event loop."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopState(asyncio.Semaphore(self.max_concurrent_loads))
+            self._states[loop] = state
+        return state
+
+    def _reader_lock(self, reader: C3DDataReader) -> threading.Lock:
+        """Lock serializing calls on ``reader`` across threads and loops."""
+        with self._reader_locks_guard:
+            lock = self._reader_locks.get(reader)
+            if lock is None:
+                lock = threading.Lock()
+                self._reader_locks[reader] = lock
+            return lock
+
+    async def _parse(self, path: Path, state: _LoopState) -> C3DDataReader:
+        """Decode ``path`` once a load slot is free."""
+        async with state.semaphore:
+            reader = C3DDataReader(
+                path, backend=self.backend, cache=self.cache, retain=self.retain
+            )
+            await self.run(reader._load)
+            return reader
+
+
+_default_loader: AsyncC3DLoader | None = None
+
+
+def default_loader() -> AsyncC3DLoader:
+    """Process-wide loader used by readers created without one."""
+
+    global _default_loader
+    if _default_loader is None:
+        _default_loader = AsyncC3DLoader()
+    return _default_loader
+
+
+class AsyncC3DReader:
+    """Awaitable counterpart of :class:`~src.c3d_reader.C3DDataReader`.
+
+    Example:
+        >>> points = await AsyncC3DReader("capture.c3d").points_array()
+    """
+
+    def __init__(
+        self, file_path: Path | str, loader: AsyncC3DLoader | None = None
+    ) -> None:
+        """Create an async reader.
+
+        Args:
+            file_path: Path to the C3D file.
+            loader: Loader providing the executor, concurrency limit and
+                backend. The shared :func:`default_loader` is used when omitted.
+        """
+        self.file_path = Path(file_path)
+        self.loader = loader or default_loader()
+        self._reader: C3DDataReader | None = None
+
+    async def get_metadata(self) -> C3DMetadata:
+        """Return capture metadata, reading only the header when not yet loaded."""
+
+        if self._reader is not None:
+            return await self.loader.access(self._reader, self._reader.get_metadata)
+        reader = C3DDataReader(
+            self.file_path, backend=self.loader.backend, cache=self.loader.cache
+        )
+        return await self.loader.access(reader, reader.get_metadata)
+
+    async def points_array(
+        self,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+    ) -> C3DPointArray:
+        """Awaitable :meth:`C3DDataReader.points_array`."""
+
+        reader = await self._loaded()
+        return await self.loader.access(
+            reader,
+            reader.points_array,
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+            start_frame=start_frame,
+            end_frame=end_frame,
+        )
+
+    async def points_dataframe(self, **kwargs: Any) -> pd.DataFrame:
+        """Awaitable :meth:`C3DDataReader.points_dataframe`."""
+
+        reader = await self._loaded()
+        return await self.loader.access(reader, reader.points_dataframe, **kwargs)
+
+    async def analog_dataframe(self, **kwargs: Any) -> pd.DataFrame:
+        """Awaitable :meth:`C3DDataReader.analog_dataframe`."""
+
+        reader = await self._loaded()
+        return await self.loader.access(reader, reader.analog_dataframe, **kwargs)
+
+    async def export_points(self, output_path: Path | str, **kwargs: Any) -> Path:
+        """Awaitable :meth:`C3DDataReader.export_points`."""
+
+        reader = await self._loaded()
+        return await self.loader.access(
+            reader, reader.export_points, output_path, **kwargs
+        )
+
+    async def _loaded(self) -> C3DDataReader:
+        """Parse the file through the loader on first use."""
+        if self._reader is None:
+            self._reader = await self.loader.load(self.file_path)
+        return self._reader
@@ -0,0 +1,288 @@
+"""Parallel loading of many C3D captures.
+
+:class:`C3DBatchReader` fans :class:`~src.c3d_reader.C3DDataReader` loads out
+over a :class:`~concurrent.futures.ProcessPoolExecutor`. Workers do not pickle
+decoded arrays back to the parent; they spill them to ``.npy`` files in a shared
+directory and the parent opens them with ``np.load(..., mmap_mode="r")``, so the
+transfer costs a page-cache write instead of a serialization round trip. A
+failure while reading one capture is reported on its result and never aborts
+the rest of the batch.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import tempfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .c3d_reader import C3DDataReader, C3DMetadata, C3DPointArray, MarkerSelection
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+ProgressCallback = Callable[[int, int, Path], None]
+
+_COORDINATES_FILE = "coordinates.npy"
+_RESIDUALS_FILE = "residuals.npy"
+_ANALOGS_FILE = "analogs.npy"
+
+
+@dataclass(frozen=True)
+class C3DBatchResult:
+    """Outcome of loading one capture in a batch."""
+
+    path: Path
+    metadata: C3DMetadata | None = None
+    points: C3DPointArray | None = None
+    analogs: npt.NDArray[np.float64] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the capture was loaded successfully."""
+
+        return self.error is None
+
+
+class C3DBatchReader:
+    """Load many C3D files in parallel with per-file error isolation.
+
+    Arrays in the results are read-only memory maps into the reader's spill
+    directory. When the directory was created by the reader it is deleted by
+    :meth:`close`, so use the reader as a context manager and copy any arrays
+    that must outlive it.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        *,
+        backend: str = "native",
+        markers: MarkerSelection | None = None,
+        target_units: str | None = None,
+        include_analogs: bool = True,
+        spill_directory: Path | str | None = None,
+    ) -> None:
+        """Configure the batch reader.
+
+        Args:
+            workers: Number of worker processes. Defaults to the CPU count;
+                ``1`` loads the files sequentially in the calling process.
+            backend: ``C3DDataReader`` backend used by the workers.
+            markers: Optional marker selection passed to ``points_array``.
+            target_units: Optional unit conversion passed to ``points_array``.
+            include_analogs: Also return the ezc3d-layout ``(1, channels, samples)``
+                analog array of each capture.
+            spill_directory: Directory for the spilled ``.npy`` files; each
+                :meth:`read` call writes to a new subdirectory of it. A
+                temporary directory owned by the reader is used when omitted.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be a positive integer.")
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.markers = markers
+        self.target_units = target_units
+        self.include_analogs = include_analogs
+        self._owns_spill_directory = spill_directory is None
+        self.spill_directory = Path(
+            tempfile.mkdtemp(prefix="c3d-batch-")
+            if spill_directory is None
+            else spill_directory
+        )
+        self.spill_directory.mkdir(parents=True, exist_ok=True)
+
+    def read(
+        self,
+        paths: Iterable[Path | str],
+        progress: ProgressCallback | None = None,
+    ) -> list[C3DBatchResult]:
+        """Load every capture in ``paths``.
+
+        Args:
+            paths: Capture files to read.
+            progress: Optional callback invoked as ``progress(completed, total,
+                path)`` in the calling process each time a file finishes.
+
+        Returns:
+            One result per input path, in input order.
+        """
+
+        file_paths = [Path(path) for path in paths]
+        options = {
+            "backend": self.backend,
+            "markers": self.markers,
+            "target_units": self.target_units,
+            "include_analogs": self.include_analogs,
+        }
+        # A fresh directory per call, so repeated reads into a caller-provided
+        # spill directory never overwrite files that earlier results still map.
+        call_directory = Path(
+            tempfile.mkdtemp(prefix="read-", dir=self.spill_directory)
+        )
+        jobs = [
+            (path, call_directory / _spill_name(path, index))
+            for index, path in enumerate(file_paths)
+        ]
+        payloads: list[dict[str, Any] | None] = [None] * len(jobs)
+
+        if self.workers == 1 or len(jobs) <= 1:
+            for index, (path, spill) in enumerate(jobs):
+                payloads[index] = _load_capture(path, spill, options)
+                if progress is not None:
+                    progress(index + 1, len(jobs), path)
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                futures: dict[Future[dict[str, Any]], int] = {
+                    pool.submit(_load_capture, path, spill, options): index
+                    for index, (path, spill) in enumerate(jobs)
+                }
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    index = futures[future]
+                    try:
+                        payloads[index] = future.result()
+                    except Exception as error:  # worker process died
+                        payloads[index] = {"error": f"{type(error).__name__}: {error}"}
+                    if progress is not None:
+                        progress(completed, len(jobs), jobs[index][0])
+
+        results = [
+            _result_from_payload(path, payload or {"error": "No result"})
+            for (path, _), payload in zip(jobs, payloads, strict=True)
+        ]
+        failures = sum(not result.ok for result in results)
+        logger.info("Loaded %s of %s C3D files", len(results) - failures, len(results))
+        return results
+
+    def close(self) -> None:
+        """Delete the spill directory if the reader created it."""
+
+        if self._owns_spill_directory:
+            shutil.rmtree(self.spill_directory, ignore_errors=True)
+
+    def __enter__(self) -> C3DBatchReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def read_many(
+    paths: Iterable[Path | str],
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+    **options: Any,
+) -> list[C3DBatchResult]:
+    """Load many C3D files in parallel and return in-memory results.
+
+    A convenience wrapper around :class:`C3DBatchReader` for callers that do
+    not want to manage the spill directory: arrays are copied out of the
+    spilled files before they are removed. Pass ``spill_directory`` to keep the
+    files and receive memory-mapped arrays instead.
+
+    Args:
+        paths: Capture files to read.
+        workers: Number of worker processes.
+        progress: Optional ``progress(completed, total, path)`` callback.
+        **options: Further keyword arguments for :class:`C3DBatchReader`.
+
+    Returns:
+        One :class:`C3DBatchResult` per input path, in input order.
+    """
+
+    keep_spill = options.get("spill_directory") is not None
+    with C3DBatchReader(workers, **options) as batch:
+        results = batch.read(paths, progress)
+        if keep_spill:
+            return results
+        return [_materialize(result) for result in results]
+
+
+def _spill_name(path: Path, index: int) -> str:
+    """Unique, filesystem-safe spill subdirectory name for a capture."""
+    digest = hashlib.blake2b(str(path).encode("utf-8"), digest_size=6).hexdigest()
+    return f"{index:05d}-{digest}"
+
+
+def _load_capture(path: Path, spill: Path, options: dict[str, Any]) -> dict[str, Any]:
+    """Worker entry point: read one capture and spill its arrays to ``spill``."""
+    try:
+        reader = C3DDataReader(path, backend=options["backend"])
+        metadata = reader.get_metadata()
+        point_array = reader.points_array(
+            markers=options["markers"], target_units=options["target_units"]
+        )
+        spill.mkdir(parents=True, exist_ok=True)
+        np.save(spill / _COORDINATES_FILE, point_array.coordinates)
+        np.save(spill / _RESIDUALS_FILE, point_array.residuals)
+        if options["include_analogs"]:
+            np.save(spill / _ANALOGS_FILE, reader.analog_array())
+    except Exception as error:
+        logger.warning("Failed to load %s: %s", path, error)
+        return {"error": f"{type(error).__name__}: {error}"}
+
+    return {
+        "spill": str(spill),
+        "metadata": metadata,
+        "marker_labels": point_array.marker_labels,
+        "frame_rate": point_array.frame_rate,
+        "units": point_array.units,
+    }
+
+
+def _result_from_payload(path: Path, payload: dict[str, Any]) -> C3DBatchResult:
+    """Open the spilled arrays described by a worker payload."""
+    if "error" in payload:
+        return C3DBatchResult(path=path, error=payload["error"])
+
+    spill = Path(payload["spill"])
+    marker_labels = list(payload["marker_labels"])
+    points = C3DPointArray(
+        coordinates=np.load(spill / _COORDINATES_FILE, mmap_mode="r"),
+        residuals=np.load(spill / _RESIDUALS_FILE, mmap_mode="r"),
+        marker_labels=marker_labels,
+        label_index={label: idx for idx, label in enumerate(marker_labels)},
+        frame_rate=payload["frame_rate"],
+        units=payload["units"],
+    )
+    analogs = None
+    if (spill / _ANALOGS_FILE).exists():
+        analogs = np.load(spill / _ANALOGS_FILE, mmap_mode="r")
+    return C3DBatchResult(
+        path=path, metadata=payload["metadata"], points=points, analogs=analogs
+    )
+
+
+def _materialize(result: C3DBatchResult) -> C3DBatchResult:
+    """Copy the memory-mapped arrays of a result into memory."""
+    if not result.ok or result.points is None:
+        return result
+    points = result.points
+    return C3DBatchResult(
+        path=result.path,
+        metadata=result.metadata,
+        points=C3DPointArray(
+            coordinates=np.array(points.coordinates),
+            residuals=np.array(points.residuals),
+            marker_labels=points.marker_labels,
+            label_index=points.label_index,
+            frame_rate=points.frame_rate,
+            units=points.units,
+        ),
+        analogs=None if result.analogs is None else np.array(result.analogs),
+    )
@@ -0,0 +1,280 @@
+"""Persistent on-disk cache of decoded C3D captures.
+
+Each cache entry is a directory holding ``points.npy``, ``residuals.npy``,
+``analogs.npy`` and a JSON dump of the parameter tree. Entries are keyed by the
+capture's resolved path, size, modification time and a BLAKE2 digest of its
+contents, so an edited or replaced file never returns stale data. Cache hits
+are loaded with ``np.load(..., mmap_mode="r")`` and therefore cost a few page
+faults instead of a full parse. The total size of the cache directory is
+bounded by evicting the least recently used entries."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from .c3d_native import C3DMemmap
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+_POINTS_FILE = "points.npy"
+_ANALOGS_FILE = "analogs.npy"
+_RESIDUALS_FILE = "residuals.npy"
+_PARAMETERS_FILE = "parameters.json"
+# Cache file of each block of the ezc3d-style ``data`` mapping.
+_BLOCK_FILES = {
+    "points": _POINTS_FILE,
+    "meta_points": _RESIDUALS_FILE,
+    "analogs": _ANALOGS_FILE,
+}
+_HASH_CHUNK_BYTES = 1024 * 1024
+# Content digests remembered per (path, size, mtime) fingerprint.
+_DIGEST_CACHE_SIZE = 256
+# Frames decoded per step when a memory-mapped capture is written to the cache.
+_WRITE_CHUNK_FRAMES = 4096
+
+# Part of every key, so entries written in an older layout are never read.
+_FORMAT_VERSION = "2"
+
+
+class C3DCache:
+    """Size-bounded LRU cache of decoded C3D point, analog and parameter data."""
+
+    def __init__(
+        self, directory: Path | str, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Create a cache rooted at ``directory``.
+
+        Args:
+            directory: Directory holding the cache entries. Created if missing.
+            max_bytes: Upper bound on the total size of all entries. The least
+                recently used entries are evicted after every insertion.
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, file_path: Path | str) -> str:
+        """Return the cache key for the current contents of ``file_path``."""
+
+        path = Path(file_path).resolve()
+        stat = path.stat()
+        fingerprint = (str(path), stat.st_size, stat.st_mtime_ns)
+        content_digest = _content_digest(*fingerprint)
+
+        key = hashlib.blake2b(digest_size=16)
+        for part in (_FORMAT_VERSION, *map(str, fingerprint), content_digest):
+            key.update(part.encode("utf-8"))
+            key.update(b"\0")
+        return key.hexdigest()
+
+    def get(self, file_path: Path | str) -> dict[str, Any] | None:
+        """Return the cached ezc3d-style mapping for ``file_path``, if present.
+
+        Point, residual and analog arrays are read-only memory maps.
+        """
+
+        entry = self.directory / self.key_for(file_path)
+        try:
+            parameters = _decode_json(
+                json.loads((entry / _PARAMETERS_FILE).read_text(encoding="utf-8"))
+            )
+            points = np.load(entry / _POINTS_FILE, mmap_mode="r")
+            residuals = np.load(entry / _RESIDUALS_FILE, mmap_mode="r")
+            analogs = np.load(entry / _ANALOGS_FILE, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+        os.utime(entry)
+        logger.debug("C3D cache hit for %s", file_path)
+        return {
+            "parameters": parameters,
+            "data": {
+                "points": points,
+                "meta_points": {"residuals": residuals},
+                "analogs": analogs,
+            },
+        }
+
+    def put(self, file_path: Path | str, c3d_data: Any) -> Path:
+        """Store the decoded data of ``file_path`` and enforce the size bound.
+
+        Blocks the caller has already decoded are written as they are. Blocks
+        of a memory-mapped native capture that are still undecoded are decoded
+        a window of frames at a time straight into the entry, so caching never
+        holds a second, fully decoded copy of the capture in memory.
+
+        Args:
+            file_path: The capture the data was decoded from.
+            c3d_data: An ezc3d-style mapping with ``parameters`` and
+                ``data["points"]``, ``data["meta_points"]["residuals"]`` and
+                ``data["analogs"]`` entries.
+
+        Returns:
+            The directory of the cache entry.
+        """
+
+        entry = self.directory / self.key_for(file_path)
+        if not entry.exists():
+            staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.directory))
+            try:
+                _save_blocks(staging, c3d_data["data"])
+                parameters = _encode_json(c3d_data["parameters"])
+                (staging / _PARAMETERS_FILE).write_text(
+                    json.dumps(parameters), encoding="utf-8"
+                )
+                os.replace(staging, entry)
+            except OSError:
+                # Another process published the same entry first.
+                shutil.rmtree(staging, ignore_errors=True)
+                if not entry.exists():
+                    raise
+
+        self.evict()
+        return entry
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits ``max_bytes``."""
+
+        entries = []
+        for entry in self.directory.iterdir():
+            if entry.is_dir() and not entry.name.startswith("."):
+                size = sum(item.stat().st_size for item in entry.iterdir())
+                entries.append((entry.stat().st_mtime_ns, size, entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            logger.debug("Evicted C3D cache entry %s", entry.name)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+
+        for entry in self.directory.iterdir():
+            if entry.is_dir():
+                shutil.rmtree(entry, ignore_errors=True)
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of all cache entries in bytes."""
+
+        return sum(
+            item.stat().st_size
+            for entry in self.directory.iterdir()
+            if entry.is_dir()
+            for item in entry.iterdir()
+        )
+
+
+def _save_blocks(entry: Path, data: Any) -> None:
+    """Write the point, residual and analog blocks of an ezc3d-style mapping."""
+    memmap = getattr(data, "memmap", None)
+    for key, file_name in _BLOCK_FILES.items():
+        if isinstance(memmap, C3DMemmap) and not data.is_decoded(key):
+            _save_in_windows(
+                entry / file_name,
+                functools.partial(_decode_window, memmap, key),
+                memmap.frame_count,
+            )
+        else:
+            block = data[key]["residuals"] if key == "meta_points" else data[key]
+            np.save(entry / file_name, np.asarray(block))
+
+
+def _decode_window(memmap: C3DMemmap, key: str, start: int, stop: int) -> Any:
+    """Decode frames ``[start, stop)`` of one block in ezc3d's layout."""
+    if key == "meta_points":
+        # ezc3d layout: residuals shaped (1, markers, frames).
+        return memmap.residuals(start, stop).T[np.newaxis]
+    return getattr(memmap, key)(start, stop)
+
+
+def _save_in_windows(
+    path: Path, decode: Callable[[int, int], Any], frame_count: int
+) -> None:
+    """Save an array decoded by frame window; frames run along its last axis."""
+    window = min(frame_count, _WRITE_CHUNK_FRAMES)
+    first = np.asarray(decode(0, window))
+    if window == frame_count:
+        np.save(path, first)
+        return
+
+    samples_per_frame = first.shape[-1] // window
+    output = np.lib.format.open_memmap(
+        path,
+        mode="w+",
+        dtype=first.dtype,
+        shape=first.shape[:-1] + (frame_count * samples_per_frame,),
+    )
+    output[..., : first.shape[-1]] = first
+    for start in range(window, frame_count, window):
+        stop = min(start + window, frame_count)
+        output[..., start * samples_per_frame : stop * samples_per_frame] = decode(
+            start, stop
+        )
+    output.flush()
+    del output
+
+
+@functools.lru_cache(maxsize=_DIGEST_CACHE_SIZE)
+def _content_digest(path: str, size: int, mtime_ns: int) -> str:
+    """Digest of ``path``, remembered while its size and mtime are unchanged."""
+    return _file_digest(Path(path))
+
+
+def _file_digest(path: Path) -> str:
+    """BLAKE2 digest of a file's contents, read in fixed-size chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _encode_json(value: Any) -> Any:
+    """Convert a parameter tree into JSON-serializable structures."""
+    if isinstance(value, np.ndarray):
+        return {
+            "__ndarray__": value.tolist(),
+            "dtype": value.dtype.str,
+            "shape": list(value.shape),
+        }
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, dict) or hasattr(value, "items"):
+        return {str(key): _encode_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_json(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def _decode_json(value: Any) -> Any:
+    """Inverse of :func:`_encode_json`."""
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            return np.asarray(value["__ndarray__"], dtype=value["dtype"]).reshape(
+                value["shape"]
+            )
+        return {key: _decode_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_json(item) for item in value]
+    return value
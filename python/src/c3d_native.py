@@ -0,0 +1,432 @@
+"""Pure NumPy parsing of the C3D binary layout.
+
+The helpers in this module understand just enough of the C3D specification to
+read the file header and the parameter section without decoding the data
+section. They are used for cheap metadata queries where a full ``ezc3d`` parse
+would be wasted work, and by :class:`C3DMemmap`, which exposes the data section
+as memory-mapped NumPy views.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO
+
+import numpy as np
+
+BLOCK_SIZE = 512
+C3D_KEY = 0x50
+
+PROCESSOR_INTEL = 84
+PROCESSOR_DEC = 85
+PROCESSOR_MIPS = 86
+
+ParameterTree = dict[str, dict[str, dict[str, Any]]]
+FloatArray = np.ndarray[Any, np.dtype[np.float64]]
+
+
+@dataclass(frozen=True)
+class C3DHeader:
+    """Values stored in the 512-byte header block of a C3D file."""
+
+    parameter_block: int
+    processor: int
+    point_count: int
+    analog_per_frame: int
+    first_frame: int
+    last_frame: int
+    scale_factor: float
+    data_block: int
+    analog_subframes: int
+    frame_rate: float
+
+    @property
+    def byte_order(self) -> str:
+        """NumPy byte-order character for integers stored in the file."""
+
+        return ">" if self.processor == PROCESSOR_MIPS else "<"
+
+    @property
+    def is_float(self) -> bool:
+        """Whether point and analog samples are stored as floats."""
+
+        return self.scale_factor < 0
+
+    @property
+    def analog_channel_count(self) -> int:
+        """Number of analog channels sampled in every frame."""
+
+        if self.analog_subframes <= 0:
+            return 0
+        return self.analog_per_frame // self.analog_subframes
+
+
+def read_c3d_parameters(file_path: Path | str) -> tuple[C3DHeader, ParameterTree]:
+    """Read the header and parameter section of a C3D file.
+
+    Only the first block and the parameter blocks are read from disk; the data
+    section is left untouched.
+
+    Args:
+        file_path: Path to the C3D file.
+
+    Returns:
+        The parsed header and a parameter tree laid out like ``ezc3d``'s
+        ``c3d["parameters"]`` mapping (``tree[group][name]["value"]``).
+
+    Raises:
+        FileNotFoundError: If ``file_path`` does not exist.
+        ValueError: If the file does not look like a C3D file.
+    """
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+
+    with path.open("rb") as handle:
+        header_block = _read_exact(handle, BLOCK_SIZE, path)
+        parameter_block = header_block[0]
+        if header_block[1] != C3D_KEY or parameter_block < 2:
+            raise ValueError(f"Not a C3D file: {path}")
+
+        handle.seek((parameter_block - 1) * BLOCK_SIZE)
+        preamble = _read_exact(handle, 4, path)
+        processor = preamble[3]
+        if processor not in (PROCESSOR_INTEL, PROCESSOR_DEC, PROCESSOR_MIPS):
+            raise ValueError(f"Unknown C3D processor type {processor} in {path}")
+
+        block_count = max(preamble[2], 1)
+        parameter_bytes = preamble + handle.read(block_count * BLOCK_SIZE - 4)
+
+    header = _parse_header(header_block, parameter_block, processor)
+    parameters = _parse_parameters(parameter_bytes, processor)
+    return header, parameters
+
+
+class C3DMemmap:
+    """Memory-mapped access to the point and analog blocks of a C3D file.
+
+    The data section is mapped read-only with a structured per-frame dtype, so
+    :attr:`raw_points` and :attr:`raw_analogs` are strided views over the OS page
+    cache rather than Python-owned copies. Scale factors, offsets and invalid
+    sample masking are only applied when :meth:`points` or :meth:`analogs` is
+    called, and only for the requested frame window.
+    """
+
+    def __init__(self, file_path: Path | str) -> None:
+        """Map the data section of ``file_path``.
+
+        Raises:
+            FileNotFoundError: If ``file_path`` does not exist.
+            ValueError: If the file is not a C3D file or stores DEC floats,
+                which cannot be viewed without conversion.
+        """
+        self.file_path = Path(file_path)
+        self.header, self.parameters = read_c3d_parameters(self.file_path)
+        header = self.header
+        if header.processor == PROCESSOR_DEC and header.is_float:
+            raise ValueError(
+                f"DEC floating-point data cannot be memory-mapped: {self.file_path}"
+            )
+
+        byte_order = header.byte_order
+        point_dtype = f"{byte_order}f4" if header.is_float else f"{byte_order}i2"
+        analog_dtype = point_dtype
+        if not header.is_float and self._analog_format() == "UNSIGNED":
+            analog_dtype = f"{byte_order}u2"
+
+        subframes = max(header.analog_subframes, 1)
+        self.frame_dtype = np.dtype(
+            [
+                ("points", point_dtype, (header.point_count, 4)),
+                ("analogs", analog_dtype, (subframes, header.analog_channel_count)),
+            ]
+        )
+        self.data_offset = max(header.data_block - 1, 0) * BLOCK_SIZE
+        self.frame_count = self._frame_count()
+
+        self._frames: np.ndarray[Any, Any]
+        if self.frame_count > 0:
+            self._frames = np.memmap(
+                self.file_path,
+                dtype=self.frame_dtype,
+                mode="r",
+                offset=self.data_offset,
+                shape=(self.frame_count,),
+            )
+        else:
+            self._frames = np.zeros(0, dtype=self.frame_dtype)
+
+    @property
+    def raw_points(self) -> np.ndarray[Any, Any]:
+        """Unscaled point samples shaped ``(frames, markers, 4)``."""
+
+        return self._frames["points"]
+
+    @property
+    def raw_analogs(self) -> np.ndarray[Any, Any]:
+        """Unscaled analog samples shaped ``(frames, subframes, channels)``."""
+
+        return self._frames["analogs"]
+
+    @property
+    def point_scale(self) -> float:
+        """Multiplier converting stored coordinates to file units."""
+
+        return 1.0 if self.header.is_float else abs(self.header.scale_factor)
+
+    def points(self, start: int | None = None, stop: int | None = None) -> FloatArray:
+        """Decode points in ezc3d's ``(4, markers, frames)`` layout.
+
+        The first three rows hold scaled coordinates and the fourth row the
+        homogeneous coordinate (always ``1``). Coordinates flagged invalid by a
+        negative residual word are returned as ``NaN``, matching ezc3d.
+        """
+
+        raw = self.raw_points[start:stop]
+        coordinates = raw[:, :, :3].astype(np.float64)
+        if not self.header.is_float:
+            coordinates *= self.point_scale
+
+        coordinates[self._residual_words(raw) < 0] = np.nan
+
+        decoded = np.ones((4, raw.shape[1], raw.shape[0]))
+        decoded[:3] = coordinates.transpose(2, 1, 0)
+        return decoded
+
+    def residuals(
+        self, start: int | None = None, stop: int | None = None
+    ) -> FloatArray:
+        """Return per-sample marker residuals shaped ``(frames, markers)``.
+
+        The fourth point word is decoded as ezc3d decodes it, so both backends
+        report the same residuals: its high byte is the residual in units of
+        ``|POINT:SCALE|`` and its low byte the camera mask, which is ignored.
+        Invalid samples are reported as ``-1``.
+        """
+
+        words = self._residual_words(self.raw_points[start:stop])
+        residuals = (words >> 8).astype(np.float64) * abs(self.header.scale_factor)
+        residuals[words < 0] = -1.0
+        return residuals
+
+    def analogs(self, start: int | None = None, stop: int | None = None) -> FloatArray:
+        """Decode analogs in ezc3d's ``(1, channels, samples)`` layout.
+
+        Subframes are interleaved into the sample axis, so ``samples`` is
+        ``frames * subframes``. Samples are converted with
+        ``(raw - OFFSET) * SCALE * GEN_SCALE``.
+        """
+
+        raw = self.raw_analogs[start:stop]
+        channel_count = raw.shape[2]
+        analog_parameters = self.parameters.get("ANALOG", {})
+        offsets = _channel_values(analog_parameters, "OFFSET", channel_count, 0.0)
+        scales = _channel_values(analog_parameters, "SCALE", channel_count, 1.0)
+        general_scale = _channel_values(analog_parameters, "GEN_SCALE", 1, 1.0)[0]
+
+        values = (raw.astype(np.float64) - offsets) * (scales * general_scale)
+        samples = values.reshape(raw.shape[0] * raw.shape[1], channel_count)
+        return np.ascontiguousarray(samples.T[np.newaxis, :, :])
+
+    def close(self) -> None:
+        """Release the memory map."""
+
+        mapping = getattr(self._frames, "_mmap", None)
+        self._frames = np.zeros(0, dtype=self.frame_dtype)
+        if mapping is not None:
+            mapping.close()
+
+    def _residual_words(self, raw: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        """Return the fourth point word as signed integers."""
+        words: np.ndarray[Any, Any] = raw[:, :, 3]
+        if self.header.is_float:
+            words = np.trunc(words)
+        return words.astype(np.int32)
+
+    def _analog_format(self) -> str:
+        """Return the ANALOG:FORMAT parameter, defaulting to signed samples."""
+        values = self.parameters.get("ANALOG", {}).get("FORMAT", {}).get("value")
+        return str(values[0]).strip().upper() if values else "SIGNED"
+
+    def _frame_count(self) -> int:
+        """Number of frames, reconciling the header with the parameters.
+
+        The header stores frame numbers as 16-bit words, so long captures rely
+        on ``TRIAL:ACTUAL_*_FIELD`` (two words each) or ``POINT:FRAMES``.
+        """
+        header = self.header
+        candidates = [
+            header.last_frame - header.first_frame + 1,
+            parameter_frame_count(self.parameters),
+        ]
+        frame_size = self.frame_dtype.itemsize
+        if frame_size == 0:
+            return 0
+        available = (self.file_path.stat().st_size - self.data_offset) // frame_size
+        return int(max(0, min(max(candidates), available)))
+
+
+def parameter_frame_count(parameters: ParameterTree) -> int:
+    """Number of frames recorded in the parameter section.
+
+    ``POINT:FRAMES`` is an unsigned 16-bit word; longer captures store their
+    first and last frame in ``TRIAL:ACTUAL_START_FIELD`` / ``ACTUAL_END_FIELD``
+    as two words each. The larger of both counts is returned, or ``0``.
+    """
+
+    candidates = [0]
+    trial = parameters.get("TRIAL", {})
+    start_field = trial.get("ACTUAL_START_FIELD", {}).get("value")
+    end_field = trial.get("ACTUAL_END_FIELD", {}).get("value")
+    if start_field is not None and end_field is not None:
+        if len(start_field) >= 2 and len(end_field) >= 2:
+            start = _combine_words(start_field)
+            end = _combine_words(end_field)
+            candidates.append(end - start + 1)
+
+    frames = parameters.get("POINT", {}).get("FRAMES", {}).get("value")
+    if frames is not None and len(frames) > 0:
+        candidates.append(int(frames[0]) & 0xFFFF)
+    return max(candidates)
+
+
+def _combine_words(values: Any) -> int:
+    """Combine a low/high pair of 16-bit parameter words into one integer."""
+    return (int(values[0]) & 0xFFFF) + (int(values[1]) & 0xFFFF) * 65536
+
+
+def _channel_values(
+    group: dict[str, Any], name: str, count: int, default: float
+) -> FloatArray:
+    """Return a per-channel parameter padded with ``default`` to ``count``."""
+    values = np.full(count, default, dtype=np.float64)
+    provided = np.asarray(group.get(name, {}).get("value", []), dtype=np.float64)
+    provided = provided.reshape(-1)[:count]
+    values[: provided.size] = provided
+    return values
+
+
+def _read_exact(handle: BinaryIO, size: int, path: Path) -> bytes:
+    """Read ``size`` bytes or fail with a descriptive error."""
+    data = handle.read(size)
+    if len(data) != size:
+        raise ValueError(f"Truncated C3D file: {path}")
+    return data
+
+
+def _parse_header(block: bytes, parameter_block: int, processor: int) -> C3DHeader:
+    """Decode the fixed-layout fields of the header block."""
+    byte_order = ">" if processor == PROCESSOR_MIPS else "<"
+    words = np.frombuffer(block, dtype=f"{byte_order}u2", count=12)
+    floats = _decode_floats(block[12:16] + block[20:24], processor)
+    return C3DHeader(
+        parameter_block=parameter_block,
+        processor=processor,
+        point_count=int(words[1]),
+        analog_per_frame=int(words[2]),
+        first_frame=int(words[3]),
+        last_frame=int(words[4]),
+        scale_factor=float(floats[0]),
+        data_block=int(words[8]),
+        analog_subframes=int(words[9]),
+        frame_rate=float(floats[1]),
+    )
+
+
+def _signed_byte(value: int) -> int:
+    """Interpret an unsigned byte as a two's-complement ``int8``."""
+    return value - 256 if value > 127 else value
+
+
+def _decode_floats(raw: bytes, processor: int) -> FloatArray:
+    """Convert 4-byte floats from the file's processor format to float64."""
+    if processor == PROCESSOR_MIPS:
+        return np.frombuffer(raw, dtype=">f4").astype(np.float64)
+    if processor == PROCESSOR_DEC:
+        # DEC F-floats swap the 16-bit words of an IEEE single and carry an
+        # exponent bias that is two larger.
+        swapped = np.frombuffer(raw, dtype="<u2").reshape(-1, 2)[:, ::-1].copy()
+        return swapped.view("<f4").reshape(-1).astype(np.float64) / 4.0
+    return np.frombuffer(raw, dtype="<f4").astype(np.float64)
+
+
+def _parse_parameters(buffer: bytes, processor: int) -> ParameterTree:
+    """Walk the linked list of groups and parameters in the parameter section."""
+    byte_order = ">" if processor == PROCESSOR_MIPS else "<"
+    group_names: dict[int, str] = {}
+    entries: list[tuple[int, str, Any]] = []
+
+    position = 4
+    while position + 2 <= len(buffer):
+        name_length = abs(_signed_byte(buffer[position]))
+        group_id = _signed_byte(buffer[position + 1])
+        if name_length == 0 or group_id == 0:
+            break
+
+        cursor = position + 2
+        name = buffer[cursor : cursor + name_length].decode("latin-1")
+        cursor += name_length
+        offset = int(np.frombuffer(buffer, f"{byte_order}i2", 1, cursor)[0])
+        next_position = cursor + offset
+
+        if group_id < 0:
+            group_names[-group_id] = name
+        else:
+            value = _parse_parameter_value(buffer, cursor + 2, processor)
+            entries.append((group_id, name, value))
+
+        if offset <= 0:
+            break
+        position = next_position
+
+    tree: ParameterTree = {name: {} for name in group_names.values()}
+    for group_id, name, value in entries:
+        group_name = group_names.get(group_id)
+        if group_name is not None:
+            tree[group_name][name] = {"value": value}
+    return tree
+
+
+def _parse_parameter_value(buffer: bytes, cursor: int, processor: int) -> Any:
+    """Decode a single parameter payload starting at its data-type byte."""
+    byte_order = ">" if processor == PROCESSOR_MIPS else "<"
+    data_type = _signed_byte(buffer[cursor])
+    dimension_count = buffer[cursor + 1]
+    dimensions = tuple(buffer[cursor + 2 : cursor + 2 + dimension_count])
+    cursor += 2 + dimension_count
+
+    element_count = int(np.prod(dimensions)) if dimensions else 1
+    raw = buffer[cursor : cursor + abs(data_type) * element_count]
+
+    if data_type == -1:
+        return _decode_strings(raw, dimensions)
+
+    values: np.ndarray[Any, Any]
+    if data_type == 1:
+        values = np.frombuffer(raw, dtype=np.int8).astype(np.int64)
+    elif data_type == 2:
+        values = np.frombuffer(raw, dtype=f"{byte_order}i2").astype(np.int64)
+    elif data_type == 4:
+        values = _decode_floats(raw, processor)
+    else:
+        raise ValueError(f"Unsupported C3D parameter data type: {data_type}")
+
+    if not dimensions:
+        return values.reshape(1)
+    return values.reshape(dimensions, order="F")
+
+
+def _decode_strings(raw: bytes, dimensions: tuple[int, ...]) -> list[str]:
+    """Split a character parameter into right-stripped strings."""
+    text = raw.decode("latin-1")
+    if len(dimensions) < 2:
+        return [text.rstrip(" \x00")]
+
+    width = dimensions[0]
+    count = int(np.prod(dimensions[1:]))
+    return [
+        text[index * width : (index + 1) * width].rstrip(" \x00")
+        for index in range(count)
+    ]
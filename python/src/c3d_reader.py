@@ -2,24 +2,106 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import fnmatch
+import gzip
+import re
+from collections.abc import Callable, Iterator, Mapping
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any, Dict, Iterable, Sequence, cast
+from types import TracebackType
+from typing import IO, Any, Dict, Iterable, Sequence, cast
 
 try:
     import ezc3d
 except ImportError:
     ezc3d = None  # type: ignore[assignment, unused-ignore]
 
+try:
+    import pyarrow as pa
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None  # type: ignore[assignment, unused-ignore]
+    pa_feather = None  # type: ignore[assignment, unused-ignore]
+    pa_parquet = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore[assignment, unused-ignore]
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
+from .c3d_cache import C3DCache
+from .c3d_native import (
+    C3DHeader,
+    C3DMemmap,
+    parameter_frame_count,
+    read_c3d_parameters,
+)
+from .filtering import FilterSpec, filter_trajectories
+from .gap_filling import GapFillReport, fill_gaps
+from .kinematics import (
+    DEFAULT_SAVGOL_POLYORDER,
+    DEFAULT_SAVGOL_WINDOW,
+    Kinematics,
+    compute_kinematics,
+)
 from .logger_utils import get_logger
+from .resampling import AlignedStreams, align_streams
+from .segmentation import (
+    SWING_EVENTS,
+    SwingSegmentation,
+    detect_swing_events,
+    event_frames_from_times,
+    segment_swing,
+)
 
 logger = get_logger(__name__)
 
 C3DMapping = Dict[str, Any]
 
+BACKENDS = ("ezc3d", "native")
+
+# What a reader keeps after decoding: the full parser output, only the NumPy
+# point/analog arrays, or nothing beyond the metadata.
+RETAIN_MODES = ("all", "arrays", "none")
+
+# Parameter groups needed to rebuild C3DMetadata.
+METADATA_GROUPS = ("POINT", "ANALOG", "EVENT")
+
+# A marker selector is an exact label, a glob pattern, a compiled regular
+# expression or the name of a marker set; selections may combine several.
+MarkerSelector = str | re.Pattern[str]
+MarkerSelection = MarkerSelector | Sequence[MarkerSelector]
+
+# Named marker sets of the Gears full-body + club marker layout.
+MARKER_SETS: dict[str, tuple[str, ...]] = {
+    "club": ("Marker_2:2:*", "Marker_3:3:*"),
+    "pelvis": ("Waist*",),
+    "torso": ("Back*",),
+    "head": ("Head*",),
+    "left_arm": ("LShoulder*", "LElbow*", "LUArm*", "LWrist*"),
+    "right_arm": ("RShoulder*", "RElbow*", "RUArm*", "RWrist*"),
+    "left_leg": ("LKnee*", "LToe*", "LAnkle*"),
+    "right_leg": ("RKnee*", "RToe*", "RAnkle*"),
+}
+
+# Columnar formats written through pyarrow; "arrow" and "ipc" are aliases for
+# the Feather v2 / Arrow IPC file format.
+ARROW_FORMATS = ("parquet", "feather", "arrow", "ipc")
+LABEL_COLUMNS = ("marker", "channel")
+
+# Line-oriented formats supported by the streaming exporters, and the
+# compression codecs they understand (keyed by file suffix).
+STREAM_FORMATS = ("csv", "ndjson", "jsonl")
+STREAM_COMPRESSIONS = {".gz": "gzip", ".zst": "zstd"}
+
+# Leading characters spreadsheet applications interpret as a formula.
+CSV_INJECTION_PREFIXES = ("=", "+", "-", "@")
+
 
 @dataclass(frozen=True)
 class C3DEvent:
@@ -62,24 +144,149 @@ class C3DMetadata:
         return self.frame_count / self.frame_rate
 
 
+@dataclass(frozen=True)
+class C3DPointArray:
+    """Marker trajectories stored as dense arrays instead of a tidy table."""
+
+    coordinates: npt.NDArray[np.float64]
+    residuals: npt.NDArray[np.float64]
+    marker_labels: list[str]
+    label_index: dict[str, int]
+    frame_rate: float
+    units: str
+    first_frame: int = 0
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames along the first axis."""
+
+        return int(self.coordinates.shape[0])
+
+    @property
+    def time(self) -> npt.NDArray[np.float64]:
+        """Frame timestamps in seconds, or an empty array if the rate is missing."""
+
+        if self.frame_rate <= 0:
+            return np.empty(0)
+        return (np.arange(self.frame_count) + self.first_frame) / self.frame_rate
+
+    def marker(self, label: str) -> npt.NDArray[np.float64]:
+        """Return the ``(frames, 3)`` trajectory of a single marker."""
+
+        return self.coordinates[:, self.label_index[label], :]
+
+
 class C3DDataReader:
-    """Loads marker trajectories and metadata from a C3D file."""
+    """Loads marker trajectories and metadata from a C3D file.
+
+    Metadata queries only parse the header and parameter section of the file.
+    The point and analog data are decoded the first time a data accessor such
+    as :meth:`points_dataframe` needs them.
+
+    Two data backends are available. ``"ezc3d"`` (the default) copies the whole
+    file into ezc3d-owned arrays. ``"native"`` memory-maps the data section with
+    :class:`~src.c3d_native.C3DMemmap`, so pages are shared through the OS cache
+    and scale factors are applied only when an accessor decodes the samples.
+
+    An optional :class:`~src.c3d_cache.C3DCache` stores decoded captures on disk
+    so later readers of the same unchanged file skip parsing entirely.
+
+    Readers are context managers; :meth:`close` releases the decoded data and
+    the native memory map. Long-lived readers can bound their footprint with
+    ``retain``.
+    """
+
+    def __init__(
+        self,
+        file_path: Path | str,
+        backend: str = "ezc3d",
+        cache: C3DCache | None = None,
+        retain: str = "all",
+        marker_sets: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        """Initialize the C3D data reader with a file path.
 
-    def __init__(self, file_path: Path | str) -> None:
-        """Initialize the C3D data reader with a file path."""
+        Args:
+            file_path: Path to the C3D file.
+            backend: Data backend, either ``"ezc3d"`` or ``"native"``.
+            cache: Optional persistent cache consulted before parsing the file.
+            retain: ``"all"`` keeps the parser output for the reader's lifetime.
+                ``"arrays"`` keeps only the point and analog arrays plus the
+                parameter groups metadata needs, dropping the ezc3d object and
+                its native copy of the file. ``"none"`` releases the data after
+                every accessor call, so each call re-reads the file (or the
+                cache). The native backend already holds just a memory map, which
+                ``"arrays"`` keeps as is.
+            marker_sets: Additional or overriding named marker sets for marker
+                selection, mapping a name to labels or glob patterns. Extends
+                :data:`MARKER_SETS`.
+        """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unsupported C3D backend {backend!r}; expected one of {BACKENDS}."
+            )
+        if retain not in RETAIN_MODES:
+            raise ValueError(
+                f"Unsupported retain mode {retain!r}; expected one of {RETAIN_MODES}."
+            )
         self.file_path = Path(file_path)
+        self.backend = backend
+        self.cache = cache
+        self.retain = retain
+        self.marker_sets = {**MARKER_SETS, **(marker_sets or {})}
+        self._hold_depth = 0
+        self._label_index: dict[str, int] | None = None
+        self._selections: dict[tuple[MarkerSelector, ...], npt.NDArray[np.intp]] = {}
+        self._marker_order: dict[tuple[str, ...], npt.NDArray[np.intp]] = {}
+        self._filtered: dict[tuple[Any, ...], C3DPointArray] = {}
+        self._kinematics: dict[tuple[Any, ...], Kinematics] = {}
+        self._native: C3DMemmap | None = None
         self._c3d_data: C3DMapping | None = None
         self._metadata: C3DMetadata | None = None
+        self._header: C3DHeader | None = None
+        self._parameters: dict[str, Any] | None = None
+
+    def close(self) -> None:
+        """Release decoded data and the native memory map.
+
+        Metadata stays available. A later data access reloads the file.
+        """
+
+        self._c3d_data = None
+        self._parameters = None
+        self._filtered.clear()
+        self._kinematics.clear()
+        native, self._native = self._native, None
+        if native is not None:
+            try:
+                native.close()
+            except BufferError:
+                # Arrays handed out earlier still view the mapping; it is
+                # unmapped once they are garbage collected.
+                logger.debug("Deferred unmapping of %s", self.file_path)
+
+    def __enter__(self) -> C3DDataReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def get_metadata(self) -> C3DMetadata:
-        """Return metadata describing marker labels, frame count, rate, and units."""
+        """Return metadata describing marker labels, frame count, rate, and units.
+
+        The data section is not decoded when the file has not been loaded yet,
+        so listing markers and durations stays cheap for large captures.
+        """
 
         if self._metadata is None:
             point_parameters = self._get_point_parameters()
-            marker_labels = [
-                label.strip() for label in point_parameters["LABELS"]["value"]
-            ]
-            frame_count = int(point_parameters["FRAMES"]["value"][0])
+            marker_labels = _group_labels(point_parameters)
+            frame_count = parameter_frame_count(self._get_parameters())
             frame_rate = float(point_parameters["RATE"]["value"][0])
             units = str(point_parameters["UNITS"]["value"][0])
             analog_labels, analog_rate = self._get_analog_details()
@@ -96,69 +303,649 @@ class C3DDataReader:
 
         return self._metadata
 
+    @property
+    def label_index(self) -> dict[str, int]:
+        """Mapping of marker label to its position in the file, built once."""
+
+        if self._label_index is None:
+            self._label_index = {
+                label: index
+                for index, label in enumerate(self.get_metadata().marker_labels)
+            }
+        return self._label_index
+
+    def select_markers(self, markers: MarkerSelection) -> list[str]:
+        """Resolve a marker selection to labels in file order.
+
+        Each selector is matched as an exact label first, then as the name of
+        a marker set, then as a glob pattern (``"L*"``). Compiled regular
+        expressions are matched with ``re.search``. Selectors that match
+        nothing are ignored.
+
+        Args:
+            markers: A selector or a sequence of selectors.
+
+        Returns:
+            The selected labels, without duplicates, in file order.
+        """
+
+        labels = self.get_metadata().marker_labels
+        return [labels[index] for index in self._marker_indices(markers)]
+
     def points_dataframe(
         self,
         include_time: bool = True,
-        markers: Sequence[str] | None = None,
+        markers: MarkerSelection | None = None,
         residual_nan_threshold: float | None = None,
         target_units: str | None = None,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        compact: bool = False,
+        float32: bool = False,
     ) -> pd.DataFrame:
         """Return marker trajectories as a tidy DataFrame.
 
         Args:
             include_time: Whether to include a time column calculated from the frame
                 index and the frame rate reported in the C3D header.
-            markers: Optional list of marker names to retain. All markers are
-                returned when ``None``.
+            markers: Optional marker selection (labels, glob patterns, compiled
+                regular expressions or marker set names, see
+                :meth:`select_markers`). All markers are returned when ``None``.
             residual_nan_threshold: If provided, coordinates with residuals above
                 the threshold are replaced with ``NaN`` to make downstream QA
                 easier in visualization tools.
             target_units: Optional unit string (``"m"`` or ``"mm"``) for the point
                 coordinates. A no-op when ``None`` or when the requested units match
                 the file's native units.
+            start_frame: First frame (zero-based, inclusive) to return.
+            end_frame: Frame (zero-based, exclusive) to stop at. The window is
+                clipped to the capture length.
+            compact: Return ``marker`` as a categorical column and ``frame`` as
+                int32, which shrinks the table several-fold and speeds up
+                grouping by marker.
+            float32: Store ``x``, ``y``, ``z`` and ``residual`` as float32. The
+                ``time`` column always keeps float64 precision.
 
         Returns:
             DataFrame with columns ``frame``, ``marker``, ``x``, ``y``, ``z``,
-            ``residual`` (EzC3D stores residuals in the fourth point channel), and
-            an optional ``time`` column in seconds.
+            ``residual`` (the stored per-sample residual; ``-1`` marks a gap), and
+            an optional ``time`` column in seconds. Frame indices are absolute,
+            so windows from the same capture can be concatenated.
         """
 
-        c3d_data = self._load()
-        metadata = self.get_metadata()
-        points = c3d_data["data"]["points"]
+        point_array = self.points_array(
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+            start_frame=start_frame,
+            end_frame=end_frame,
+        )
+        dataframe = self._points_table(point_array, include_time, compact, float32)
+
+        logger.info(
+            "Loaded %s frames for %s markers from %s",
+            point_array.frame_count,
+            len(point_array.marker_labels),
+            self.file_path.name,
+        )
+        return dataframe
+
+    def iter_points_chunks(
+        self,
+        chunk_frames: int = 1000,
+        *,
+        include_time: bool = True,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        compact: bool = False,
+        float32: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield tidy point DataFrames covering at most ``chunk_frames`` frames.
+
+        The chunks have the same columns and dtypes as :meth:`points_dataframe`
+        and can be concatenated to reproduce it. With the ``"native"`` backend only the
+        frames of the current chunk are decoded, so memory stays bounded by the
+        chunk size rather than the capture length.
+        """
+
+        self._hold_depth += 1
+        try:
+            for start, stop in self._frame_chunks(chunk_frames):
+                point_array = self.points_array(
+                    markers=markers,
+                    residual_nan_threshold=residual_nan_threshold,
+                    target_units=target_units,
+                    start_frame=start,
+                    end_frame=stop,
+                )
+                yield self._points_table(point_array, include_time, compact, float32)
+        finally:
+            self._hold_depth -= 1
+            self._release_unretained()
+
+    def points_array(
+        self,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+    ) -> C3DPointArray:
+        """Return marker trajectories as dense ``(frames, markers, ...)`` arrays.
+
+        This is the array-native counterpart of :meth:`points_dataframe` and
+        avoids materializing the tidy frame × marker table. When no marker
+        filter, residual threshold or unit conversion is requested, the
+        returned arrays are read-only views of the loaded point block.
+
+        Args:
+            markers: Optional marker selection, see :meth:`select_markers`.
+                Markers are returned in file order; all when ``None``.
+            residual_nan_threshold: If provided, coordinates with residuals above
+                the threshold are replaced with ``NaN``.
+            target_units: Optional unit string (``"m"`` or ``"mm"``) for the point
+                coordinates.
+            start_frame: First frame (zero-based, inclusive) to return.
+            end_frame: Frame (zero-based, exclusive) to stop at.
+
+        Returns:
+            A :class:`C3DPointArray` with coordinates shaped
+            ``(frames, markers, 3)`` and residuals shaped ``(frames, markers)``.
+        """
 
-        marker_labels = np.array(metadata.marker_labels)
+        metadata = self.get_metadata()
+        start, stop = self._frame_window(start_frame, end_frame)
+        points = self._points_window(start, stop)
+        residuals = self._residuals_window(start, stop)
+        marker_labels = list(metadata.marker_labels)
 
         if markers:
             # Filter markers early to avoid processing unneeded data
-            mask = np.isin(marker_labels, list(markers))
-            marker_labels = marker_labels[mask]
-            points = points[:, mask, :]
-
-        # Sort markers alphabetically to avoid expensive DataFrame sorting later
-        sort_indices = np.argsort(marker_labels)
-        sorted_labels = marker_labels[sort_indices]
+            indices = self._marker_indices(markers)
+            if len(indices) != len(marker_labels):
+                marker_labels = [marker_labels[index] for index in indices]
+                points = points[:, indices, :]
+                residuals = residuals[:, indices]
 
-        # Reorder points data: (4, Markers, Frames) -> (4, SortedMarkers, Frames)
-        # This aligns the data with the sorted labels so we can construct the DataFrame
-        # already sorted by frame and marker.
-        points = points[:, sort_indices, :]
+        # (4, markers, frames) -> (frames, markers, 3) without copying; the
+        # fourth row is the homogeneous coordinate, not the residual.
+        coordinates = points[:3].transpose(2, 1, 0)
 
-        raw_coordinates = np.transpose(points[:3, :, :], axes=(2, 1, 0)).reshape(-1, 3)
-        coordinates = raw_coordinates * self._unit_scale(metadata.units, target_units)
-        residuals = points[3, :, :].T.reshape(-1)
+        scale = self._unit_scale(metadata.units, target_units)
+        if scale != 1.0:
+            coordinates = coordinates * scale
 
         if residual_nan_threshold is not None:
             too_noisy = residuals > residual_nan_threshold
-            coordinates[too_noisy, :] = np.nan
+            coordinates = np.where(too_noisy[:, :, np.newaxis], np.nan, coordinates)
+
+        coordinates.flags.writeable = False
+        residuals.flags.writeable = False
+        point_array = C3DPointArray(
+            coordinates=coordinates,
+            residuals=residuals,
+            marker_labels=marker_labels,
+            label_index={label: index for index, label in enumerate(marker_labels)},
+            frame_rate=metadata.frame_rate,
+            units=target_units or metadata.units,
+            first_frame=start,
+        )
+        self._release_unretained()
+        return point_array
+
+    def fill_gaps(
+        self,
+        method: str = "linear",
+        max_gap: int | None = None,
+        *,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        donors: Mapping[str, Sequence[str]] | None = None,
+    ) -> tuple[C3DPointArray, GapFillReport]:
+        """Return marker trajectories with gaps reconstructed.
+
+        Samples that are missing in the file, or blanked by
+        ``residual_nan_threshold``, are filled for all markers at once with
+        :func:`~src.gap_filling.fill_gaps`.
+
+        Args:
+            method: ``"linear"``, ``"cubic"`` or ``"rigid"`` (reconstruction
+                from donor markers moving rigidly with the gappy one).
+            max_gap: Longest gap, in frames, to fill. Longer gaps stay ``NaN``.
+            markers: Optional marker selection, see :meth:`select_markers`.
+                Rigid-body filling can only use donors inside the selection.
+            residual_nan_threshold: Blank samples above this residual first.
+            target_units: Optional unit string (``"m"`` or ``"mm"``).
+            start_frame: First frame (zero-based, inclusive) to return.
+            end_frame: Frame (zero-based, exclusive) to stop at.
+            donors: Explicit donor labels per target marker for ``"rigid"``.
+
+        Returns:
+            The filled :class:`C3DPointArray` and a
+            :class:`~src.gap_filling.GapFillReport` listing the filled frames
+            of every marker.
+        """
+
+        point_array = self.points_array(
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+            start_frame=start_frame,
+            end_frame=end_frame,
+        )
+        coordinates, report = fill_gaps(
+            point_array.coordinates,
+            method=method,
+            max_gap=max_gap,
+            marker_labels=point_array.marker_labels,
+            donors=donors,
+        )
+        coordinates.flags.writeable = False
+        logger.info(
+            "Filled %s samples across %s markers in %s",
+            int(report.filled.sum()),
+            int((report.filled_counts > 0).sum()),
+            self.file_path.name,
+        )
+        return replace(point_array, coordinates=coordinates), report
+
+    def filtered_points(
+        self,
+        kind: str = "butter",
+        cutoff: float | tuple[float, float] = 6.0,
+        order: int = 4,
+        btype: str = "lowpass",
+        *,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+    ) -> C3DPointArray:
+        """Return zero-phase filtered marker trajectories.
+
+        The whole ``(frames, markers, 3)`` block is filtered in one
+        :func:`~src.filtering.filter_trajectories` call. Results are memoized
+        per filter specification and selection until :meth:`close`.
+
+        Args:
+            kind: Filter family: ``"butter"``, ``"bessel"`` or ``"cheby2"``.
+            cutoff: Cutoff frequency in Hz, or ``(low, high)`` for band filters.
+            order: Order of the single-pass filter design.
+            btype: ``"lowpass"``, ``"highpass"``, ``"bandpass"`` or ``"bandstop"``.
+            markers: Optional marker selection, see :meth:`select_markers`.
+            residual_nan_threshold: Blank samples above this residual first.
+                Gaps are bridged while filtering and restored afterwards.
+            target_units: Optional unit string (``"m"`` or ``"mm"``).
+
+        Returns:
+            A :class:`C3DPointArray` with read-only filtered coordinates.
+        """
+
+        spec = FilterSpec(kind=kind, cutoff=cutoff, order=order, btype=btype)
+        selection = None if not markers else tuple(self._marker_indices(markers))
+        key = (spec, selection, residual_nan_threshold, target_units)
+        cached = self._filtered.get(key)
+        if cached is not None:
+            return cached
+
+        point_array = self.points_array(
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+        )
+        coordinates = filter_trajectories(
+            point_array.coordinates, point_array.frame_rate, spec
+        )
+        coordinates.flags.writeable = False
+        filtered = replace(point_array, coordinates=coordinates)
+        if self.retain != "none":
+            self._filtered[key] = filtered
+        return filtered
+
+    def kinematics(
+        self,
+        method: str = "central",
+        window_length: int = DEFAULT_SAVGOL_WINDOW,
+        polyorder: int = DEFAULT_SAVGOL_POLYORDER,
+        *,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        filter_cutoff: float | None = None,
+    ) -> Kinematics:
+        """Return velocity, acceleration, jerk and speed of every marker.
+
+        All markers are differentiated in one vectorized pass by
+        :func:`~src.kinematics.compute_kinematics`. Results are memoized per
+        argument combination until :meth:`close`;
+        :meth:`~src.kinematics.Kinematics.summary` then yields path length and
+        peak speed of all markers at once.
+
+        Args:
+            method: ``"central"`` differences or ``"savgol"`` (Savitzky-Golay).
+            window_length: Savitzky-Golay window in frames (odd).
+            polyorder: Savitzky-Golay polynomial order.
+            markers: Optional marker selection, see :meth:`select_markers`.
+            residual_nan_threshold: Blank samples above this residual first.
+            target_units: Optional unit string (``"m"`` or ``"mm"``).
+            filter_cutoff: Low-pass the trajectories with the default
+                Butterworth filter at this cutoff (Hz) before differentiating.
+        """
+
+        selection = None if not markers else tuple(self._marker_indices(markers))
+        key = (
+            method,
+            window_length,
+            polyorder,
+            selection,
+            residual_nan_threshold,
+            target_units,
+            filter_cutoff,
+        )
+        cached = self._kinematics.get(key)
+        if cached is not None:
+            return cached
+
+        if filter_cutoff is None:
+            point_array = self.points_array(
+                markers=markers,
+                residual_nan_threshold=residual_nan_threshold,
+                target_units=target_units,
+            )
+        else:
+            point_array = self.filtered_points(
+                cutoff=filter_cutoff,
+                markers=markers,
+                residual_nan_threshold=residual_nan_threshold,
+                target_units=target_units,
+            )
+        if point_array.frame_rate <= 0:
+            raise ValueError("Kinematics require a positive point frame rate.")
+        result = compute_kinematics(
+            point_array.coordinates,
+            point_array.frame_rate,
+            method=method,
+            marker_labels=point_array.marker_labels,
+            window_length=window_length,
+            polyorder=polyorder,
+            first_frame=point_array.first_frame,
+        )
+        if self.retain != "none":
+            self._kinematics[key] = result
+        return result
+
+    def segment_swing(
+        self, *, markers: MarkerSelection = "club", use_events: bool = True
+    ) -> SwingSegmentation:
+        """Split the capture into backswing, downswing and follow-through.
 
-        current_marker_count = len(sorted_labels)
-        frame_indices = np.repeat(np.arange(metadata.frame_count), current_marker_count)
-        marker_names = np.tile(sorted_labels, metadata.frame_count)
+        Event frames are taken from the capture's ``address``, ``top``,
+        ``impact`` and ``finish`` events (see
+        :func:`~src.segmentation.normalize_event_label` for accepted aliases).
+        Events the capture does not label are detected from the mean speed of
+        the ``markers`` with :func:`~src.segmentation.detect_swing_events`.
+
+        Args:
+            markers: Club markers used for detection, see :meth:`select_markers`.
+            use_events: Read labeled events from the capture. When ``False``
+                all events are detected.
+
+        Returns:
+            A :class:`~src.segmentation.SwingSegmentation` whose ``source`` is
+            ``"detected"`` when any event had to be detected.
+        """
+
+        metadata = self.get_metadata()
+        frames: dict[str, int] = {}
+        if use_events:
+            frames = event_frames_from_times(
+                ((event.label, event.time) for event in metadata.events),
+                metadata.frame_rate,
+                metadata.frame_count,
+            )
+        if all(name in frames for name in SWING_EVENTS):
+            return segment_swing(frames, metadata.frame_rate, source="events")
+
+        detected = detect_swing_events(self.kinematics(markers=markers).speed)
+        logger.debug("Detected swing events %s in %s", detected, self.file_path.name)
+        return segment_swing(
+            {**detected, **frames}, metadata.frame_rate, source="detected"
+        )
+
+    def phase_points(
+        self,
+        segmentation: SwingSegmentation | None = None,
+        *,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+    ) -> dict[str, C3DPointArray]:
+        """Return the marker trajectories of each swing phase.
+
+        Phase arrays are basic slices of :meth:`points_array`, so they share
+        memory with it. ``first_frame`` of each phase is its absolute frame.
+
+        Args:
+            segmentation: Phases to slice; :meth:`segment_swing` when omitted.
+            markers: Optional marker selection, see :meth:`select_markers`.
+            residual_nan_threshold: Blank samples above this residual.
+            target_units: Optional unit string (``"m"`` or ``"mm"``).
+        """
+
+        segmentation = segmentation or self.segment_swing()
+        point_array = self.points_array(
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+        )
+        return {
+            phase.name: replace(
+                point_array,
+                coordinates=point_array.coordinates[phase.frames],
+                residuals=point_array.residuals[phase.frames],
+                first_frame=point_array.first_frame + phase.start_frame,
+            )
+            for phase in segmentation.phases
+        }
+
+    def phase_analogs(
+        self, segmentation: SwingSegmentation | None = None
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Return ``(1, channels, samples)`` analog views for each swing phase.
+
+        Args:
+            segmentation: Phases to slice; :meth:`segment_swing` when omitted.
+        """
+
+        self._hold_depth += 1
+        try:
+            segmentation = segmentation or self.segment_swing()
+            analogs, _ = self._analog_window(0, self.get_metadata().frame_count)
+            return segmentation.slice_analogs(
+                analogs, self._analog_samples_per_frame(analogs.shape[2])
+            )
+        finally:
+            self._hold_depth -= 1
+            self._release_unretained()
+
+    def aligned_streams(
+        self,
+        target: str | float = "points",
+        *,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+    ) -> AlignedStreams:
+        """Return marker and analog data resampled onto a single timebase.
+
+        Args:
+            target: ``"points"`` decimates the analogs, with anti-aliasing, to
+                the point frame rate; ``"analogs"`` upsamples the points to the
+                analog rate; a number resamples both to that rate in Hz.
+            markers: Optional marker selection, see :meth:`select_markers`.
+            residual_nan_threshold: Blank samples above this residual first.
+                Gaps stay ``NaN`` after resampling.
+            target_units: Optional unit string (``"m"`` or ``"mm"``).
+
+        Returns:
+            A :class:`~src.resampling.AlignedStreams` with ``(samples, markers,
+            3)`` points and ``(samples, channels)`` analogs.
+
+        Raises:
+            ValueError: If the point rate is unknown, or the capture has analog
+                channels but no analog rate.
+        """
+
+        metadata = self.get_metadata()
+        self._hold_depth += 1
+        try:
+            point_array = self.points_array(
+                markers=markers,
+                residual_nan_threshold=residual_nan_threshold,
+                target_units=target_units,
+            )
+            analog_array, _ = self._analog_window(0, metadata.frame_count)
+        finally:
+            self._hold_depth -= 1
+            self._release_unretained()
+        subframes, channel_count, sample_count = analog_array.shape
+        if channel_count and not metadata.analog_rate:
+            raise ValueError("Cannot align analog channels without an analog rate.")
+        analogs = analog_array.transpose(2, 0, 1).reshape(
+            sample_count * subframes, channel_count
+        )
+        # An unknown (zero) point rate is rejected by align_streams below.
+        start_time = (
+            point_array.first_frame / point_array.frame_rate
+            if point_array.frame_rate > 0
+            else 0.0
+        )
+        return align_streams(
+            point_array.coordinates,
+            point_array.frame_rate,
+            analogs,
+            metadata.analog_rate or point_array.frame_rate,
+            target=target,
+            marker_labels=point_array.marker_labels,
+            analog_labels=metadata.analog_labels,
+            start_time=start_time,
+        )
+
+    def analog_array(
+        self, start_frame: int | None = None, end_frame: int | None = None
+    ) -> npt.NDArray[np.float64]:
+        """Return analog samples in ezc3d's ``(1, channels, samples)`` layout.
+
+        This is the array-native counterpart of :meth:`analog_dataframe`.
+        Subframes are interleaved into the sample axis, so each point frame
+        covers ``samples / frames`` entries along it.
+
+        Args:
+            start_frame: First point frame (zero-based, inclusive) whose analog
+                samples are returned.
+            end_frame: Point frame (zero-based, exclusive) to stop at.
+        """
+
+        start, stop = self._frame_window(start_frame, end_frame)
+        analogs, _ = self._analog_window(start, stop)
+        self._release_unretained()
+        return analogs
+
+    def analog_dataframe(
+        self,
+        include_time: bool = True,
+        start_frame: int | None = None,
+        end_frame: int | None = None,
+        compact: bool = False,
+        float32: bool = False,
+    ) -> pd.DataFrame:
+        """Return analog channels as a tidy DataFrame.
+
+        Rows are ordered by sample index and channel name so downstream GUI
+        components can easily plot synchronized sensor traces.
+
+        Args:
+            include_time: Include a time column derived from the analog rate.
+            start_frame: First point frame (zero-based, inclusive) whose analog
+                samples are returned.
+            end_frame: Point frame (zero-based, exclusive) to stop at. Sample
+                indices stay absolute within the capture.
+            compact: Return ``channel`` as a categorical column and ``sample`` as
+                int32.
+            float32: Store ``value`` as float32.
+        """
+
+        start, stop = self._frame_window(start_frame, end_frame)
+        analog_array, first_sample = self._analog_window(start, stop)
+        dataframe = self._analog_table(
+            analog_array, first_sample, include_time, compact, float32
+        )
+        self._release_unretained()
+        return dataframe
+
+    def iter_analog_chunks(
+        self,
+        chunk_frames: int = 1000,
+        *,
+        include_time: bool = True,
+        compact: bool = False,
+        float32: bool = False,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield tidy analog DataFrames covering at most ``chunk_frames`` frames.
+
+        Each chunk holds ``chunk_frames`` point frames worth of analog samples.
+        With the ``"native"`` backend only that window is decoded, so long
+        high-rate force-plate sessions can be processed in constant memory.
+        """
+
+        self._hold_depth += 1
+        try:
+            for start, stop in self._frame_chunks(chunk_frames):
+                analog_array, first_sample = self._analog_window(start, stop)
+                yield self._analog_table(
+                    analog_array, first_sample, include_time, compact, float32
+                )
+        finally:
+            self._hold_depth -= 1
+            self._release_unretained()
+
+    def _points_table(
+        self,
+        point_array: C3DPointArray,
+        include_time: bool,
+        compact: bool = False,
+        float32: bool = False,
+    ) -> pd.DataFrame:
+        """Explode a point array into the tidy frame × marker table."""
+        marker_labels = np.array(point_array.marker_labels)
+
+        # Sort markers alphabetically to avoid expensive DataFrame sorting later.
+        # Reordering the marker axis of the (frames, markers) arrays lets us build
+        # the DataFrame already sorted by frame and marker. The order is cached
+        # because chunked exports request it once per chunk.
+        label_key = tuple(point_array.marker_labels)
+        sort_indices = self._marker_order.get(label_key)
+        if sort_indices is None:
+            sort_indices = np.argsort(marker_labels)
+            self._marker_order[label_key] = sort_indices
+        sorted_labels = marker_labels[sort_indices]
+
+        coordinates = point_array.coordinates[:, sort_indices, :].reshape(-1, 3)
+        residuals = point_array.residuals[:, sort_indices].reshape(-1)
+
+        frame_count = point_array.frame_count
+        frames = np.arange(frame_count) + point_array.first_frame
+        frame_indices = np.repeat(frames, len(sorted_labels))
+        if float32:
+            coordinates = coordinates.astype(np.float32)
+            residuals = residuals.astype(np.float32)
 
         data = {
-            "frame": frame_indices,
-            "marker": marker_names,
+            "frame": frame_indices.astype(np.int32) if compact else frame_indices,
+            "marker": self._label_column(sorted_labels, frame_count, compact),
             "x": coordinates[:, 0],
             "y": coordinates[:, 1],
             "z": coordinates[:, 2],
@@ -166,8 +953,8 @@ class C3DDataReader:
         }
 
         if include_time:
-            if metadata.frame_rate > 0:
-                data["time"] = frame_indices / metadata.frame_rate
+            if point_array.frame_rate > 0:
+                data["time"] = frame_indices / point_array.frame_rate
             else:
                 logger.warning(
                     "Frame rate is 0. Time column will be omitted despite include_time=True."
@@ -175,26 +962,18 @@ class C3DDataReader:
 
         dataframe = pd.DataFrame(data)
 
-        dataframe = dataframe.reset_index(drop=True)
-
-        logger.info(
-            "Loaded %s frames for %s markers from %s",
-            metadata.frame_count,
-            current_marker_count,
-            self.file_path.name,
-        )
-        return dataframe
-
-    def analog_dataframe(self, include_time: bool = True) -> pd.DataFrame:
-        """Return analog channels as a tidy DataFrame.
-
-        Rows are ordered by sample index and channel name so downstream GUI
-        components can easily plot synchronized sensor traces.
-        """
+        return dataframe.reset_index(drop=True)
 
-        c3d_data = self._load()
+    def _analog_table(
+        self,
+        analog_array: npt.NDArray[np.float64],
+        first_sample: int,
+        include_time: bool,
+        compact: bool = False,
+        float32: bool = False,
+    ) -> pd.DataFrame:
+        """Flatten an analog block into the tidy sample × channel table."""
         metadata = self.get_metadata()
-        analog_array = c3d_data["data"]["analogs"]
         subframes, channel_count, frame_count = analog_array.shape
         analog_rate = metadata.analog_rate
 
@@ -208,22 +987,25 @@ class C3DDataReader:
         values = analog_array.transpose(2, 0, 1).reshape(
             frame_count * subframes, channel_count
         )
-        sample_indices = np.arange(values.shape[0])
+        sample_indices = first_sample + np.arange(values.shape[0])
         channel_names = np.array(
             metadata.analog_labels
             or [f"Analog_{idx+1}" for idx in range(channel_count)]
         )
 
+        sample_column = np.repeat(sample_indices, channel_count)
         dataframe = pd.DataFrame(
             {
-                "sample": np.repeat(sample_indices, channel_count),
-                "channel": np.tile(channel_names, values.shape[0]),
-                "value": values.reshape(-1),
+                "sample": sample_column.astype(np.int32) if compact else sample_column,
+                "channel": self._label_column(channel_names, values.shape[0], compact),
+                "value": values.reshape(-1).astype(
+                    np.float32 if float32 else np.float64, copy=False
+                ),
             }
         )
 
         if include_time and analog_rate:
-            dataframe.insert(1, "time", dataframe["sample"] / analog_rate)
+            dataframe.insert(1, "time", sample_column / analog_rate)
 
         return dataframe
 
@@ -232,17 +1014,21 @@ class C3DDataReader:
         output_path: Path | str,
         *,
         include_time: bool = True,
-        markers: Sequence[str] | None = None,
+        markers: MarkerSelection | None = None,
         residual_nan_threshold: float | None = None,
         target_units: str | None = None,
         file_format: str | None = None,
         sanitize: bool = True,
+        compression: str | None = None,
+        float32: bool = False,
+        row_group_size: int | None = None,
     ) -> Path:
         """Export marker trajectories to a tabular file.
 
-        Supported formats are CSV, JSON (records orientation), and NPZ. The
-        format is inferred from the file extension when ``file_format`` is not
-        provided.
+        Supported formats are CSV, JSON (records orientation), NPZ, Parquet and
+        Arrow IPC/Feather. The format is inferred from the file extension when
+        ``file_format`` is not provided. The columnar formats require
+        ``pyarrow`` and store the ``marker`` column dictionary-encoded.
 
         Args:
             output_path: Destination file path.
@@ -250,9 +1036,15 @@ class C3DDataReader:
             markers: Filter for specific markers.
             residual_nan_threshold: Threshold to filter noisy data.
             target_units: Unit conversion (e.g. 'm', 'mm').
-            file_format: Explicit format ('csv', 'json', 'npz').
+            file_format: Explicit format ('csv', 'json', 'npz', 'parquet',
+                'feather', 'arrow').
             sanitize: Whether to sanitize CSV output to prevent Excel Formula Injection.
                 Defaults to True. Strings starting with =, +, -, @ will be escaped.
+            compression: Codec for Parquet (e.g. 'snappy', 'zstd', 'gzip') or
+                Arrow IPC ('lz4', 'zstd', 'uncompressed') output.
+            float32: Store coordinate and residual columns as float32 in the
+                columnar formats. The time column keeps full precision.
+            row_group_size: Maximum rows per Parquet row group or IPC record batch.
         """
 
         dataframe = self.points_dataframe(
@@ -261,7 +1053,15 @@ class C3DDataReader:
             residual_nan_threshold=residual_nan_threshold,
             target_units=target_units,
         )
-        return self._export_dataframe(dataframe, output_path, file_format, sanitize)
+        return self._export_dataframe(
+            dataframe,
+            output_path,
+            file_format,
+            sanitize,
+            compression=compression,
+            float32=float32,
+            row_group_size=row_group_size,
+        )
 
     def export_analog(
         self,
@@ -270,6 +1070,9 @@ class C3DDataReader:
         include_time: bool = True,
         file_format: str | None = None,
         sanitize: bool = True,
+        compression: str | None = None,
+        float32: bool = False,
+        row_group_size: int | None = None,
     ) -> Path:
         """Export analog channels to a tabular file.
 
@@ -280,46 +1083,163 @@ class C3DDataReader:
         Args:
             output_path: Destination file path.
             include_time: Include a time column in the output.
-            file_format: Explicit format ('csv', 'json', 'npz').
+            file_format: Explicit format ('csv', 'json', 'npz', 'parquet',
+                'feather', 'arrow').
             sanitize: Whether to sanitize CSV output to prevent Excel Formula Injection.
                 Defaults to True.
+            compression: Codec for Parquet or Arrow IPC output.
+            float32: Store the value column as float32 in the columnar formats.
+            row_group_size: Maximum rows per Parquet row group or IPC record batch.
         """
 
         dataframe = self.analog_dataframe(include_time=include_time)
-        return self._export_dataframe(dataframe, output_path, file_format, sanitize)
+        return self._export_dataframe(
+            dataframe,
+            output_path,
+            file_format,
+            sanitize,
+            compression=compression,
+            float32=float32,
+            row_group_size=row_group_size,
+        )
 
-    def _get_point_parameters(self) -> Dict[str, Any]:
+    def stream_points(
+        self,
+        output_path: Path | str,
+        *,
+        chunk_frames: int = 1000,
+        include_time: bool = True,
+        markers: MarkerSelection | None = None,
+        residual_nan_threshold: float | None = None,
+        target_units: str | None = None,
+        file_format: str | None = None,
+        sanitize: bool = True,
+        compression: str | None = None,
+    ) -> Path:
+        """Stream marker trajectories to CSV or NDJSON in frame chunks.
+
+        Unlike :meth:`export_points`, the full tidy table is never built: each
+        chunk of ``chunk_frames`` frames is converted and written before the
+        next is read, so memory stays bounded by the chunk size. CSV output has
+        the same header, columns and values as :meth:`export_points`.
+
+        Args:
+            output_path: Destination file path. A trailing ``.gz`` or ``.zst``
+                suffix selects the compression when ``compression`` is omitted.
+            chunk_frames: Number of frames converted per write.
+            include_time: Include a time column in the output.
+            markers: Filter for specific markers.
+            residual_nan_threshold: Threshold to filter noisy data.
+            target_units: Unit conversion (e.g. 'm', 'mm').
+            file_format: Explicit format ('csv', 'ndjson' or 'jsonl').
+            sanitize: Whether to sanitize CSV output to prevent Excel Formula Injection.
+            compression: ``"gzip"``, ``"zstd"`` or ``None`` for plain text.
+        """
+
+        chunks = self.iter_points_chunks(
+            chunk_frames,
+            include_time=include_time,
+            markers=markers,
+            residual_nan_threshold=residual_nan_threshold,
+            target_units=target_units,
+            compact=True,
+        )
+        return self._stream_tables(
+            chunks,
+            lambda: self.points_dataframe(
+                include_time=include_time,
+                markers=markers,
+                residual_nan_threshold=residual_nan_threshold,
+                target_units=target_units,
+                end_frame=0,
+            ),
+            output_path,
+            file_format,
+            sanitize,
+            compression,
+        )
+
+    def stream_analog(
+        self,
+        output_path: Path | str,
+        *,
+        chunk_frames: int = 1000,
+        include_time: bool = True,
+        file_format: str | None = None,
+        sanitize: bool = True,
+        compression: str | None = None,
+    ) -> Path:
+        """Stream analog channels to CSV or NDJSON in frame chunks.
+
+        The analog counterpart of :meth:`stream_points`. Captures without
+        analog data still produce a file with the CSV header.
+
+        Args:
+            output_path: Destination file path. A trailing ``.gz`` or ``.zst``
+                suffix selects the compression when ``compression`` is omitted.
+            chunk_frames: Number of point frames whose samples are written at once.
+            include_time: Include a time column in the output.
+            file_format: Explicit format ('csv', 'ndjson' or 'jsonl').
+            sanitize: Whether to sanitize CSV output to prevent Excel Formula Injection.
+            compression: ``"gzip"``, ``"zstd"`` or ``None`` for plain text.
+        """
+
+        chunks = self.iter_analog_chunks(
+            chunk_frames, include_time=include_time, compact=True
+        )
+        return self._stream_tables(
+            chunks,
+            lambda: self.analog_dataframe(include_time=include_time, end_frame=0),
+            output_path,
+            file_format,
+            sanitize,
+            compression,
+        )
+
+    def _get_parameters(self) -> dict[str, Any]:
+        """Get the parameter tree, parsing only the file header if needed."""
+        if self._c3d_data is not None:
+            return cast(dict[str, Any], self._c3d_data["parameters"])
+
+        if self._parameters is None:
+            try:
+                self._header, self._parameters = read_c3d_parameters(self.file_path)
+            except ValueError as error:
+                logger.debug(
+                    "Header-only parse failed for %s (%s); loading full file.",
+                    self.file_path,
+                    error,
+                )
+                return cast(dict[str, Any], self._load()["parameters"])
+        return self._parameters
+
+    def _get_point_parameters(self) -> dict[str, Any]:
         """Get POINT parameters from the C3D file."""
-        c3d_data = self._load()
+        parameters = self._get_parameters()
         try:
-            return cast(Dict[str, Any], c3d_data["parameters"]["POINT"])
+            return cast(dict[str, Any], parameters["POINT"])
         except KeyError as error:  # pragma: no cover - defensive guard
             raise ValueError(
                 f"POINT parameters missing from C3D file: {self.file_path}"
             ) from error
 
-    def _get_analog_parameters(self) -> Dict[str, Any] | None:
+    def _get_analog_parameters(self) -> dict[str, Any] | None:
         """Get ANALOG parameters from the C3D file, if present."""
-        c3d_data = self._load()
-        analog_params = c3d_data["parameters"].get("ANALOG")
+        analog_params = self._get_parameters().get("ANALOG")
         return (
-            cast(Dict[str, Any], analog_params) if analog_params is not None else None
+            cast(dict[str, Any], analog_params) if analog_params is not None else None
         )
 
     def _get_analog_details(self) -> tuple[list[str], float | None]:
         """Get analog channel labels and sample rate from the C3D file."""
         analog_parameters = self._get_analog_parameters()
-        analog_array = self._load()["data"]["analogs"]
-        channel_count = analog_array.shape[1]
+        channel_count = self._analog_channel_count()
 
         if analog_parameters is None:
             labels = []
             analog_rate = None
         else:
-            labels = [
-                label.strip()
-                for label in analog_parameters.get("LABELS", {}).get("value", [])
-            ]
+            labels = _group_labels(analog_parameters)
             analog_rate = float(analog_parameters.get("RATE", {}).get("value", [0])[0])
 
         if not labels and channel_count > 0:
@@ -327,10 +1247,120 @@ class C3DDataReader:
 
         return labels, analog_rate
 
+    def _marker_indices(self, markers: MarkerSelection) -> npt.NDArray[np.intp]:
+        """Resolve a marker selection to sorted file indices, memoized."""
+        selectors: tuple[MarkerSelector, ...] = (
+            (markers,) if isinstance(markers, (str, re.Pattern)) else tuple(markers)
+        )
+        indices = self._selections.get(selectors)
+        if indices is None:
+            selected: set[int] = set()
+            for selector in selectors:
+                selected.update(self._match_selector(selector, set()))
+            indices = np.array(sorted(selected), dtype=np.intp)
+            indices.flags.writeable = False
+            self._selections[selectors] = indices
+        return indices
+
+    def _match_selector(self, selector: MarkerSelector, seen: set[str]) -> list[int]:
+        """File indices matched by one selector; ``seen`` guards set recursion."""
+        label_index = self.label_index
+        if isinstance(selector, re.Pattern):
+            return [idx for label, idx in label_index.items() if selector.search(label)]
+        if selector in label_index:
+            return [label_index[selector]]
+        if selector in self.marker_sets and selector not in seen:
+            seen.add(selector)
+            return [
+                index
+                for member in self.marker_sets[selector]
+                for index in self._match_selector(member, seen)
+            ]
+        pattern = re.compile(fnmatch.translate(selector))
+        return [idx for label, idx in label_index.items() if pattern.match(label)]
+
+    def _frame_window(
+        self, start_frame: int | None, end_frame: int | None
+    ) -> tuple[int, int]:
+        """Resolve an optional frame window against the capture length."""
+        frame_count = self.get_metadata().frame_count
+        start = 0 if start_frame is None else int(start_frame)
+        stop = frame_count if end_frame is None else min(int(end_frame), frame_count)
+        if start < 0 or stop < start:
+            raise ValueError(
+                f"Invalid frame window [{start_frame}, {end_frame}) for "
+                f"{frame_count} frames."
+            )
+        return start, stop
+
+    def _frame_chunks(self, chunk_frames: int) -> Iterator[tuple[int, int]]:
+        """Yield consecutive ``(start, stop)`` frame windows."""
+        if chunk_frames <= 0:
+            raise ValueError("chunk_frames must be a positive integer.")
+        frame_count = self.get_metadata().frame_count
+        for start in range(0, frame_count, chunk_frames):
+            yield start, min(start + chunk_frames, frame_count)
+
+    def _points_window(self, start: int, stop: int) -> npt.NDArray[np.float64]:
+        """Return the ``(4, markers, frames)`` point block for a frame window."""
+        data = self._load()["data"]
+        if isinstance(data, _LazyC3DData) and not data.is_decoded("points"):
+            return data.memmap.points(start, stop)
+        points: npt.NDArray[np.float64] = data["points"]
+        return points[:, :, start:stop]
+
+    def _residuals_window(self, start: int, stop: int) -> npt.NDArray[np.float64]:
+        """Return ``(frames, markers)`` residuals for a frame window.
+
+        Mappings without ``meta_points`` report ``0`` for present samples and
+        ``-1`` for gaps, the C3D convention for samples without a residual.
+        """
+        data = self._load()["data"]
+        if isinstance(data, _LazyC3DData) and not data.is_decoded("meta_points"):
+            return data.memmap.residuals(start, stop)
+        if "meta_points" in data:
+            residuals: npt.NDArray[np.float64] = data["meta_points"]["residuals"]
+            return residuals[0, :, start:stop].T
+        missing = np.isnan(data["points"][:3, :, start:stop]).any(axis=0)
+        return np.where(missing, -1.0, 0.0).T
+
+    def _analog_window(
+        self, start: int, stop: int
+    ) -> tuple[npt.NDArray[np.float64], int]:
+        """Return the analog block for a frame window and its first sample index.
+
+        ezc3d interleaves subframes into the last axis, so a window of point
+        frames covers ``samples_per_frame`` entries per frame along that axis.
+        """
+        data = self._load()["data"]
+        analogs: npt.NDArray[np.float64]
+        if isinstance(data, _LazyC3DData) and not data.is_decoded("analogs"):
+            analogs = data.memmap.analogs(start, stop)
+            samples_per_frame = max(data.memmap.header.analog_subframes, 1)
+        else:
+            full = data["analogs"]
+            samples_per_frame = self._analog_samples_per_frame(full.shape[2])
+            analogs = full[:, :, start * samples_per_frame : stop * samples_per_frame]
+        return analogs, start * samples_per_frame * analogs.shape[0]
+
+    def _analog_samples_per_frame(self, sample_count: int) -> int:
+        """Number of entries along the analog sample axis per point frame."""
+        frame_count = self.get_metadata().frame_count
+        if frame_count > 0 and sample_count % frame_count == 0:
+            return max(sample_count // frame_count, 1)
+        return 1
+
+    def _analog_channel_count(self) -> int:
+        """Number of analog channels, read from the header when not loaded."""
+        if self._c3d_data is None:
+            self._get_parameters()
+            if self._header is not None:
+                return self._header.analog_channel_count
+        return int(self._load()["data"]["analogs"].shape[1])
+
     def _get_events(self) -> list[C3DEvent]:
         """Extract event markers from the C3D file."""
-        c3d_data = self._load()
-        event_parameters = c3d_data["parameters"].get("EVENT")
+        event_parameters = self._get_parameters().get("EVENT")
         if not event_parameters:
             return []
 
@@ -353,28 +1383,137 @@ class C3DDataReader:
 
     def _load(self) -> C3DMapping:
         """Load the C3D file if not already loaded."""
+        if self._c3d_data is None and self.cache is not None:
+            if self.file_path.exists():
+                self._c3d_data = self.cache.get(self.file_path)
         if self._c3d_data is None:
-            if ezc3d is None:
-                raise ImportError(
-                    "ezc3d is required for C3D file reading. "
-                    "Install it with: pip install ezc3d\n"
-                    "Note: ezc3d requires Python >=3.10. "
-                    "For Python 3.9, this functionality is not available."
-                )
-            if not self.file_path.exists():
-                raise FileNotFoundError(f"File not found: {self.file_path}")
-            self._c3d_data = ezc3d.c3d(str(self.file_path))
+            self._c3d_data = self._parse()
+            if self.cache is not None:
+                self.cache.put(self.file_path, self._c3d_data)
+        if self.retain != "all" and not isinstance(self._c3d_data, _RetainedArrays):
+            self._c3d_data = self._retain_arrays(self._c3d_data)
         return self._c3d_data
 
+    def _retain_arrays(self, c3d_data: C3DMapping) -> C3DMapping:
+        """Replace parser output by its NumPy arrays and metadata parameters."""
+        data = c3d_data["data"]
+        if isinstance(data, _LazyC3DData):
+            return c3d_data
+        parameters = c3d_data["parameters"]
+        arrays = {"points": data["points"], "analogs": data["analogs"]}
+        if "meta_points" in data:
+            arrays["meta_points"] = {"residuals": data["meta_points"]["residuals"]}
+        return _RetainedArrays(
+            parameters={
+                group: parameters[group]
+                for group in METADATA_GROUPS
+                if group in parameters
+            },
+            data=arrays,
+        )
+
+    def _release_unretained(self) -> None:
+        """Drop loaded data after an accessor when ``retain="none"``."""
+        if self.retain == "none" and self._hold_depth == 0:
+            self.get_metadata()
+            self.close()
+
+    def _parse(self) -> C3DMapping:
+        """Decode the file with the configured backend."""
+        if self.backend == "native":
+            self._native = C3DMemmap(self.file_path)
+            self._header = self._native.header
+            return {
+                "parameters": self._native.parameters,
+                "data": _LazyC3DData(self._native),
+            }
+        if ezc3d is None:
+            raise ImportError(
+                "ezc3d is required for C3D file reading. "
+                "Install it with: pip install ezc3d\n"
+                "Note: ezc3d requires Python >=3.10. "
+                "For Python 3.9, this functionality is not available."
+            )
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        return cast(C3DMapping, ezc3d.c3d(str(self.file_path)))
+
+    @staticmethod
+    def _label_column(
+        labels: npt.NDArray[np.str_], repeats: int, compact: bool
+    ) -> npt.NDArray[np.str_] | pd.Categorical:
+        """Tile ``labels`` once per frame, as a categorical when ``compact``."""
+        if not compact:
+            return np.tile(labels, repeats)
+        codes = np.tile(np.arange(len(labels), dtype=np.int32), repeats)
+        categories, inverse = np.unique(labels, return_inverse=True)
+        return pd.Categorical.from_codes(inverse[codes], categories=categories)
+
     @staticmethod
     def _sanitize_for_csv(value: Any) -> Any:
         """Sanitize a value to prevent CSV injection."""
         if not isinstance(value, str):
             return value
-        if value.startswith(("=", "+", "-", "@")):
+        if value.startswith(CSV_INJECTION_PREFIXES):
             return f"'{value}"
         return value
 
+    @classmethod
+    def _sanitize_series(cls, series: pd.Series) -> pd.Series:
+        """Vectorized :meth:`_sanitize_for_csv` over a column.
+
+        Categorical columns are sanitized through their categories, so the work
+        scales with the number of distinct labels rather than the row count.
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories.to_series(index=None)
+            sanitized = cls._sanitize_series(categories)
+            if sanitized.equals(categories):
+                return series
+            if sanitized.is_unique:
+                return series.cat.rename_categories(sanitized.to_numpy())
+            # Escaping made two labels collide (e.g. "=a" and "'=a").
+            return cls._sanitize_series(series.astype(object))
+
+        # Factorize so the prefix test runs once per distinct value; tidy tables
+        # repeat every marker/channel label on each frame.
+        codes, uniques = pd.factorize(series)
+        flagged = np.fromiter(
+            (
+                isinstance(value, str) and value.startswith(CSV_INJECTION_PREFIXES)
+                for value in uniques
+            ),
+            dtype=bool,
+            count=len(uniques),
+        )
+        if not flagged.any():
+            return series
+        escaped = np.array(
+            [
+                f"'{value}" if flag else value
+                for value, flag in zip(uniques, flagged, strict=True)
+            ],
+            dtype=object,
+        )
+        row_mask = np.zeros(len(codes), dtype=bool)
+        valid = codes >= 0
+        row_mask[valid] = flagged[codes[valid]]
+        values = series.to_numpy(dtype=object, copy=True)
+        values[row_mask] = escaped[codes[row_mask]]
+        return pd.Series(
+            values, index=series.index, name=series.name, dtype=series.dtype
+        )
+
+    @classmethod
+    def _sanitize_dataframe(cls, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Return a shallow copy of ``dataframe`` with text columns sanitized."""
+        sanitized = dataframe.copy(deep=False)
+        for col in sanitized.select_dtypes(
+            include=[object, "string", "category"]
+        ).columns:
+            sanitized[col] = cls._sanitize_series(sanitized[col])
+        return sanitized
+
     @staticmethod
     def _unit_scale(current_units: str, target_units: str | None) -> float:
         """Calculate scaling factor for unit conversion."""
@@ -402,8 +1541,12 @@ class C3DDataReader:
         output_path: Path | str,
         file_format: str | None,
         sanitize: bool = True,
+        *,
+        compression: str | None = None,
+        float32: bool = False,
+        row_group_size: int | None = None,
     ) -> Path:
-        """Export a DataFrame to CSV, JSON, or NPZ format."""
+        """Export a DataFrame to CSV, JSON, NPZ, Parquet or Arrow IPC format."""
         path = Path(output_path)
         if not file_format:
             if not path.suffix:
@@ -413,16 +1556,21 @@ class C3DDataReader:
             file_format = path.suffix.lstrip(".")
 
         normalized_format = file_format.lower()
+        if normalized_format not in ARROW_FORMATS and compression is not None:
+            raise ValueError(
+                f"Compression is only supported for {', '.join(ARROW_FORMATS)} exports."
+            )
+        if normalized_format in ARROW_FORMATS and pa is None:
+            raise ImportError(
+                "pyarrow is required for Parquet and Arrow exports. "
+                "Install it with: pip install pyarrow"
+            )
         path.parent.mkdir(parents=True, exist_ok=True)
 
         if normalized_format == "csv":
-            df_to_export = dataframe.copy() if sanitize else dataframe
-            if sanitize:
-                # Sanitize for CSV Injection (Excel Formula Injection)
-                for col in df_to_export.select_dtypes(
-                    include=[object, "string"]
-                ).columns:
-                    df_to_export[col] = df_to_export[col].apply(self._sanitize_for_csv)
+            df_to_export = (
+                self._sanitize_dataframe(dataframe) if sanitize else dataframe
+            )
             df_to_export.to_csv(path, index=False)
         elif normalized_format == "json":
             dataframe.to_json(path, orient="records")
@@ -430,19 +1578,185 @@ class C3DDataReader:
             np.savez(
                 path, **{column: dataframe[column].to_numpy() for column in dataframe}
             )
+        elif normalized_format == "parquet":
+            pa_parquet.write_table(
+                self._arrow_table(dataframe, float32),
+                path,
+                compression=compression or "snappy",
+                row_group_size=row_group_size,
+            )
+        elif normalized_format in ARROW_FORMATS:
+            pa_feather.write_feather(
+                self._arrow_table(dataframe, float32),
+                path,
+                compression=compression,
+                chunksize=row_group_size,
+            )
         else:  # pragma: no cover - defensive guard for unrecognized formats
             raise ValueError(f"Unsupported export format: {file_format}")
 
         logger.info("Exported %s rows to %s", len(dataframe), path)
         return path
 
+    def _stream_tables(
+        self,
+        chunks: Iterator[pd.DataFrame],
+        empty_table: Callable[[], pd.DataFrame],
+        output_path: Path | str,
+        file_format: str | None,
+        sanitize: bool,
+        compression: str | None,
+    ) -> Path:
+        """Write DataFrame chunks to a line-oriented, optionally compressed file."""
+        path = Path(output_path)
+        suffixes = [suffix.lower() for suffix in path.suffixes]
+        if compression is None and suffixes and suffixes[-1] in STREAM_COMPRESSIONS:
+            compression = STREAM_COMPRESSIONS[suffixes.pop()]
+        if not file_format:
+            if not suffixes:
+                raise ValueError(
+                    "File format could not be inferred from the path suffix."
+                )
+            file_format = suffixes[-1].lstrip(".")
+
+        normalized_format = file_format.lower()
+        if normalized_format not in STREAM_FORMATS:
+            raise ValueError(f"Unsupported streaming format: {file_format}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        row_count = 0
+        with self._open_text_stream(path, compression) as handle:
+            first = True
+            for chunk in chunks:
+                self._write_chunk(handle, chunk, normalized_format, sanitize, first)
+                row_count += len(chunk)
+                first = False
+            if first:
+                self._write_chunk(
+                    handle, empty_table(), normalized_format, sanitize, first
+                )
+
+        logger.info("Streamed %s rows to %s", row_count, path)
+        return path
+
+    def _write_chunk(
+        self,
+        handle: IO[str],
+        chunk: pd.DataFrame,
+        file_format: str,
+        sanitize: bool,
+        header: bool,
+    ) -> None:
+        """Append one DataFrame chunk to an open text stream."""
+        if file_format == "csv":
+            if sanitize:
+                chunk = self._sanitize_dataframe(chunk)
+            chunk.to_csv(handle, index=False, header=header)
+        elif len(chunk):
+            chunk.to_json(handle, orient="records", lines=True)
+
+    @staticmethod
+    def _open_text_stream(path: Path, compression: str | None) -> IO[str]:
+        """Open ``path`` for text writing with the requested compression."""
+        if compression is None:
+            return path.open("w", encoding="utf-8", newline="")
+        normalized = compression.lower()
+        if normalized in ("gzip", "gz"):
+            return gzip.open(path, "wt", encoding="utf-8", newline="")
+        if normalized in ("zstd", "zst"):
+            if zstandard is None:
+                raise ImportError(
+                    "zstandard is required for zstd-compressed exports. "
+                    "Install it with: pip install zstandard"
+                )
+            return cast(
+                IO[str], zstandard.open(path, "wt", encoding="utf-8", newline="")
+            )
+        raise ValueError(f"Unsupported compression: {compression}")
+
+    @staticmethod
+    def _arrow_table(dataframe: pd.DataFrame, float32: bool) -> Any:
+        """Convert a tidy DataFrame into an Arrow table for columnar export.
+
+        Label columns are dictionary-encoded so each marker or channel name is
+        stored once per row group instead of once per row.
+        """
+        columns = {}
+        for column in dataframe.columns:
+            series = dataframe[column]
+            if column in LABEL_COLUMNS:
+                series = series.astype("category")
+            elif float32 and column != "time" and series.dtype == np.float64:
+                series = series.astype(np.float32)
+            columns[column] = series
+        return pa.Table.from_pandas(pd.DataFrame(columns), preserve_index=False)
+
+
+class _RetainedArrays(dict[str, Any]):
+    """Slim stand-in for parser output kept by ``retain="arrays"`` readers."""
+
 
-def load_tour_average_reader(base_directory: Path | None = None) -> C3DDataReader:
+class _LazyC3DData(Mapping[str, Any]):
+    """ezc3d-style ``data`` mapping that decodes memory-mapped blocks on access."""
+
+    _DECODERS = ("points", "analogs", "meta_points")
+
+    def __init__(self, memmap: C3DMemmap) -> None:
+        self._memmap = memmap
+        self._decoded: dict[str, Any] = {}
+
+    @property
+    def memmap(self) -> C3DMemmap:
+        """The memory-mapped file backing this mapping."""
+        return self._memmap
+
+    def is_decoded(self, key: str) -> bool:
+        """Whether ``key`` has already been decoded in full."""
+        return key in self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._DECODERS:
+            raise KeyError(key)
+        if key not in self._decoded:
+            if key == "meta_points":
+                # ezc3d layout: residuals shaped (1, markers, frames).
+                residuals = self._memmap.residuals().T[np.newaxis]
+                self._decoded[key] = {"residuals": residuals}
+            else:
+                self._decoded[key] = getattr(self._memmap, key)()
+        return self._decoded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._DECODERS)
+
+    def __len__(self) -> int:
+        return len(self._DECODERS)
+
+
+def _group_labels(group: Mapping[str, Any]) -> list[str]:
+    """``LABELS`` of a parameter group continued by ``LABELS2``, ``LABELS3``, ...
+
+    A parameter holds at most 255 strings, so files with more markers or
+    channels split their labels over numbered parameters.
+    """
+    labels: list[str] = []
+    name, number = "LABELS", 1
+    while name in group:
+        labels.extend(str(label).strip() for label in group[name]["value"])
+        number += 1
+        name = f"LABELS{number}"
+    return labels
+
+
+def load_tour_average_reader(
+    base_directory: Path | None = None, backend: str = "ezc3d"
+) -> C3DDataReader:
     """Convenience loader for the repository's Tour average capture.
 
     Args:
         base_directory: Optional base directory containing the repository files. If
             omitted, the repository root is derived from this module's location.
+        backend: Data backend passed to :class:`C3DDataReader`.
 
     Returns:
         A configured :class:`C3DDataReader` pointing to the Tour average capture file.
@@ -452,4 +1766,4 @@ def load_tour_average_reader(base_directory: Path | None = None) -> C3DDataReade
     default_path = (
         base_path / "matlab" / "Data" / "Gears C3D Files" / "C3DExport Tour average.c3d"
     )
-    return C3DDataReader(default_path)
+    return C3DDataReader(default_path, backend=backend)
@@ -0,0 +1,386 @@
+"""SQLite metadata catalog of C3D capture libraries.
+
+:class:`C3DCatalog` walks a directory tree, reads each capture's
+:class:`~src.c3d_reader.C3DMetadata` from the parameter section only (the data
+section is never decoded) and stores it in a local SQLite database together
+with the file's size and modification time. A later :meth:`C3DCatalog.refresh`
+only re-reads files whose fingerprint changed and drops files that
+disappeared, so re-indexing a large library costs one ``stat`` per file.
+
+Queries such as "360 Hz captures with marker ``Marker_2:2:1`` and an impact
+event" are answered from indexed tables without touching the captures.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from .c3d_reader import C3DDataReader, C3DEvent, C3DMetadata
+from .logger_utils import get_logger
+from .segmentation import normalize_event_label
+
+logger = get_logger(__name__)
+
+DEFAULT_PATTERNS = ("*.c3d", "*.C3D")
+
+# Frame rates are floats in the files; queries match within this tolerance.
+RATE_TOLERANCE_HZ = 1e-3
+
+ProgressCallback = Callable[[int, int, Path], None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    frame_count INTEGER NOT NULL,
+    frame_rate REAL NOT NULL,
+    units TEXT NOT NULL,
+    analog_rate REAL,
+    duration REAL NOT NULL,
+    marker_count INTEGER NOT NULL,
+    analog_count INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS markers (
+    capture_id INTEGER NOT NULL REFERENCES captures(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS analog_channels (
+    capture_id INTEGER NOT NULL REFERENCES captures(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    capture_id INTEGER NOT NULL REFERENCES captures(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    name TEXT NOT NULL,
+    time REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS markers_label ON markers(label, capture_id);
+CREATE INDEX IF NOT EXISTS analog_channels_label
+    ON analog_channels(label, capture_id);
+CREATE INDEX IF NOT EXISTS events_name ON events(name, capture_id);
+CREATE INDEX IF NOT EXISTS captures_rate ON captures(frame_rate);
+"""
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """Summary row of one indexed capture."""
+
+    path: Path
+    frame_count: int
+    frame_rate: float
+    units: str
+    analog_rate: float | None
+    duration: float
+    marker_count: int
+    analog_count: int
+
+
+@dataclass(frozen=True)
+class RefreshReport:
+    """What a :meth:`C3DCatalog.refresh` pass changed."""
+
+    added: list[Path]
+    updated: list[Path]
+    removed: list[Path]
+    unchanged: int
+    failed: dict[Path, str]
+
+
+class C3DCatalog:
+    """Persistent, incrementally refreshed index of capture metadata."""
+
+    def __init__(self, database: Path | str, *, backend: str = "native") -> None:
+        """Open (or create) the catalog database.
+
+        Args:
+            database: SQLite file, or ``":memory:"`` for a transient catalog.
+            backend: ``C3DDataReader`` backend used to read metadata. The
+                native backend only parses the header and parameter blocks.
+        """
+        self.database = database
+        self.backend = backend
+        if database != ":memory:":
+            Path(database).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(database))
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def refresh(
+        self,
+        root: Path | str,
+        patterns: Sequence[str] = DEFAULT_PATTERNS,
+        progress: ProgressCallback | None = None,
+    ) -> RefreshReport:
+        """Index new and modified captures below ``root``.
+
+        Files whose size and modification time match the catalog are skipped.
+        Catalogued files below ``root`` that no longer exist are removed.
+        Unreadable files are reported and left out of the catalog.
+
+        Args:
+            root: Directory to walk recursively.
+            patterns: Glob patterns of capture file names.
+            progress: Optional ``progress(done, total, path)`` callback.
+        """
+
+        root_path = Path(root).resolve()
+        paths = sorted(
+            {path for pattern in patterns for path in root_path.rglob(pattern)}
+        )
+        known = {
+            Path(row[0]): (row[1], row[2])
+            for row in self._connection.execute(
+                "SELECT path, size, mtime_ns FROM captures "
+                "WHERE substr(path, 1, ?) = ?",
+                _prefix_parameters(root_path),
+            )
+        }
+
+        added: list[Path] = []
+        updated: list[Path] = []
+        failed: dict[Path, str] = {}
+        unchanged = 0
+        for done, path in enumerate(paths, start=1):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Deleted since the walk; any catalogued row is removed below.
+                logger.debug("Capture %s disappeared during refresh", path)
+            else:
+                fingerprint = (stat.st_size, stat.st_mtime_ns)
+                previous = known.pop(path, None)
+                if previous == fingerprint:
+                    unchanged += 1
+                else:
+                    try:
+                        metadata = C3DDataReader(
+                            path, backend=self.backend
+                        ).get_metadata()
+                    except Exception as error:
+                        logger.warning("Could not index %s: %s", path, error)
+                        failed[path] = f"{type(error).__name__}: {error}"
+                        if previous is not None:
+                            self._delete(path)
+                    else:
+                        self._store(path, fingerprint, metadata)
+                        (added if previous is None else updated).append(path)
+            if progress is not None:
+                progress(done, len(paths), path)
+
+        removed = sorted(known)
+        for path in removed:
+            self._delete(path)
+        self._connection.commit()
+        logger.info(
+            "Catalog refresh of %s: %s added, %s updated, %s removed, %s unchanged",
+            root_path,
+            len(added),
+            len(updated),
+            len(removed),
+            unchanged,
+        )
+        return RefreshReport(added, updated, removed, unchanged, failed)
+
+    def query(
+        self,
+        *,
+        frame_rate: float | None = None,
+        markers: Iterable[str] = (),
+        events: Iterable[str] = (),
+        analog_channels: Iterable[str] = (),
+        units: str | None = None,
+        min_duration: float | None = None,
+        max_duration: float | None = None,
+        under: Path | str | None = None,
+    ) -> list[CatalogEntry]:
+        """Return the captures matching every given criterion.
+
+        Args:
+            frame_rate: Point frame rate in Hz.
+            markers: Marker labels that must all be present.
+            events: Swing events that must all be present, matched after
+                :func:`~src.segmentation.normalize_event_label`, so ``"impact"``
+                also finds ``"Ball Impact"``.
+            analog_channels: Analog channel labels that must all be present.
+            units: Point units, e.g. ``"mm"``.
+            min_duration: Shortest capture duration in seconds.
+            max_duration: Longest capture duration in seconds.
+            under: Only captures below this directory.
+
+        Returns:
+            Matching entries ordered by path.
+        """
+
+        clauses: list[str] = []
+        parameters: list[Any] = []
+        if frame_rate is not None:
+            clauses.append("ABS(frame_rate - ?) <= ?")
+            parameters += [frame_rate, RATE_TOLERANCE_HZ]
+        if units is not None:
+            clauses.append("units = ?")
+            parameters.append(units)
+        if min_duration is not None:
+            clauses.append("duration >= ?")
+            parameters.append(min_duration)
+        if max_duration is not None:
+            clauses.append("duration <= ?")
+            parameters.append(max_duration)
+        if under is not None:
+            clauses.append("substr(path, 1, ?) = ?")
+            parameters += _prefix_parameters(Path(under).resolve())
+        for table, column, values in (
+            ("markers", "label", markers),
+            ("analog_channels", "label", analog_channels),
+            ("events", "name", [normalize_event_label(name) for name in events]),
+        ):
+            for value in values:
+                clauses.append(
+                    f"EXISTS (SELECT 1 FROM {table} "
+                    f"WHERE capture_id = captures.id AND {column} = ?)"
+                )
+                parameters.append(value)
+
+        sql = (
+            "SELECT path, frame_count, frame_rate, units, analog_rate, duration, "
+            "marker_count, analog_count FROM captures"
+        )
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        rows = self._connection.execute(sql + " ORDER BY path", parameters)
+        return [CatalogEntry(Path(row[0]), *row[1:]) for row in rows]
+
+    def metadata(self, file_path: Path | str) -> C3DMetadata:
+        """Return the catalogued metadata of one capture.
+
+        Raises:
+            KeyError: If the capture is not in the catalog.
+        """
+
+        path = str(Path(file_path).resolve())
+        row = self._connection.execute(
+            "SELECT id, frame_count, frame_rate, units, analog_rate "
+            "FROM captures WHERE path = ?",
+            (path,),
+        ).fetchone()
+        if row is None:
+            raise KeyError(f"{path} is not in the catalog.")
+        capture_id = row[0]
+        return C3DMetadata(
+            marker_labels=self._labels("markers", capture_id),
+            frame_count=row[1],
+            frame_rate=row[2],
+            units=row[3],
+            analog_labels=self._labels("analog_channels", capture_id),
+            analog_rate=row[4],
+            events=[
+                C3DEvent(label=label, time=event_time)
+                for label, event_time in self._connection.execute(
+                    "SELECT label, time FROM events WHERE capture_id = ? ORDER BY time",
+                    (capture_id,),
+                )
+            ],
+        )
+
+    def __len__(self) -> int:
+        return int(
+            self._connection.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+        )
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(self.query())
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        self._connection.close()
+
+    def __enter__(self) -> C3DCatalog:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _store(
+        self, path: Path, fingerprint: tuple[int, int], metadata: C3DMetadata
+    ) -> None:
+        """Insert or replace the rows describing one capture."""
+        self._delete(path)
+        duration = (
+            metadata.frame_count / metadata.frame_rate if metadata.frame_rate else 0.0
+        )
+        cursor = self._connection.execute(
+            "INSERT INTO captures (path, size, mtime_ns, frame_count, frame_rate, "
+            "units, analog_rate, duration, marker_count, analog_count, indexed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                str(path),
+                *fingerprint,
+                metadata.frame_count,
+                metadata.frame_rate,
+                metadata.units,
+                metadata.analog_rate,
+                duration,
+                len(metadata.marker_labels),
+                len(metadata.analog_labels),
+                time.time(),
+            ),
+        )
+        capture_id = cursor.lastrowid
+        self._connection.executemany(
+            "INSERT INTO markers VALUES (?, ?, ?)",
+            [(capture_id, i, label) for i, label in enumerate(metadata.marker_labels)],
+        )
+        self._connection.executemany(
+            "INSERT INTO analog_channels VALUES (?, ?, ?)",
+            [(capture_id, i, label) for i, label in enumerate(metadata.analog_labels)],
+        )
+        self._connection.executemany(
+            "INSERT INTO events VALUES (?, ?, ?, ?)",
+            [
+                (
+                    capture_id,
+                    event.label,
+                    normalize_event_label(event.label),
+                    event.time,
+                )
+                for event in metadata.events
+            ],
+        )
+
+    def _delete(self, path: Path) -> None:
+        """Remove a capture and, through the foreign keys, its child rows."""
+        self._connection.execute("DELETE FROM captures WHERE path = ?", (str(path),))
+
+    def _labels(self, table: str, capture_id: int) -> list[str]:
+        """Ordered labels of a capture from ``markers`` or ``analog_channels``."""
+        return [
+            row[0]
+            for row in self._connection.execute(
+                f"SELECT label FROM {table} WHERE capture_id = ? ORDER BY position",
+                (capture_id,),
+            )
+        ]
+
+
+def _prefix_parameters(directory: Path) -> tuple[int, str]:
+    """``substr(path, 1, ?) = ?`` parameters selecting paths below ``directory``."""
+    prefix = str(directory).rstrip(os.sep) + os.sep
+    return len(prefix), prefix
@@ -0,0 +1,337 @@
+"""Dynamic time warping of swing trajectories.
+
+:func:`dtw` aligns two multivariate trajectories, e.g. a clubhead path or the
+flattened ``(frames, markers, 3)`` block of a
+:class:`~src.c3d_reader.C3DPointArray`, under a Sakoe-Chiba band: frame ``i`` of
+one series may only be matched with frames ``j`` where ``|i - j| <= radius``.
+The band turns the quadratic cost matrix into a strip of width
+``2 * radius + 1``, and only that strip is stored.
+
+The accumulated cost is computed by a Numba kernel when Numba is installed and
+otherwise by a NumPy wavefront that processes one anti-diagonal of the band per
+step, since every cell on a diagonal depends only on the two previous ones.
+
+:func:`nearest` ranks many candidates against one query and skips the full DTW
+of candidates whose LB_Keogh lower bound already exceeds the best distance
+found so far.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+try:
+    import numba
+except ImportError:
+    numba = None  # type: ignore[assignment, unused-ignore]
+
+from .c3d_reader import C3DPointArray
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Band radius as a fraction of the longer series when none is given.
+DEFAULT_WINDOW_FRACTION = 0.1
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class DTWResult:
+    """Outcome of aligning two series.
+
+    Attributes:
+        distance: Sum of Euclidean frame distances along the optimal path.
+        path: ``(steps, 2)`` matched ``(i, j)`` frame pairs, when requested.
+        radius: Sakoe-Chiba band radius that was used.
+    """
+
+    distance: float
+    path: npt.NDArray[np.intp] | None
+    radius: int
+
+    @property
+    def normalized_distance(self) -> float:
+        """Distance divided by the number of path steps."""
+
+        if self.path is None or len(self.path) == 0:
+            return math.nan
+        return self.distance / len(self.path)
+
+
+def band_radius(length_x: int, length_y: int, radius: int | None = None) -> int:
+    """Band radius, widened so the end points ``(n - 1, m - 1)`` are reachable."""
+
+    if radius is None:
+        radius = math.ceil(DEFAULT_WINDOW_FRACTION * max(length_x, length_y))
+    if radius < 0:
+        raise ValueError("The band radius must be non-negative.")
+    return max(int(radius), abs(length_x - length_y))
+
+
+def dtw(
+    x: FloatArray,
+    y: FloatArray,
+    radius: int | None = None,
+    return_path: bool = True,
+) -> DTWResult:
+    """Align ``x`` and ``y`` with banded dynamic time warping.
+
+    Args:
+        x: ``(frames, ...)`` series; trailing axes are flattened into the
+            feature vector of each frame.
+        y: Series with the same number of features per frame.
+        radius: Sakoe-Chiba band radius in frames. Defaults to
+            :data:`DEFAULT_WINDOW_FRACTION` of the longer series, and is never
+            smaller than the length difference.
+        return_path: Backtrack and return the warping path.
+
+    Raises:
+        ValueError: If a series is empty or contains ``NaN``, or the feature
+            counts differ. Fill gaps first, e.g. with
+            :meth:`~src.c3d_reader.C3DDataReader.fill_gaps`.
+    """
+
+    x, y = _as_features(x), _as_features(y)
+    if x.shape[1] != y.shape[1]:
+        raise ValueError(
+            f"Series have {x.shape[1]} and {y.shape[1]} features per frame."
+        )
+    radius = band_radius(len(x), len(y), radius)
+    # Wider bands than the series admit no further cells, only more storage.
+    width = min(radius, max(len(x), len(y)))
+    cost = _accumulated_cost(x, y, width)
+    distance = float(cost[len(x), len(y) - len(x) + width])
+    path = _backtrack(cost, len(y), width) if return_path else None
+    return DTWResult(distance=distance, path=path, radius=radius)
+
+
+def envelope(
+    query: FloatArray, radius: int, length: int | None = None
+) -> tuple[FloatArray, FloatArray]:
+    """Running ``(lower, upper)`` envelope of ``query`` within the band.
+
+    Position ``i`` of the envelope bounds every query frame ``j`` with
+    ``|i - j| <= radius``. ``length`` sets the number of positions, i.e. the
+    length of the candidates the envelope is compared against.
+    """
+
+    query = _as_features(query)
+    length = len(query) if length is None else length
+    # Edge padding keeps the window minimum/maximum inside the query.
+    trailing = radius + max(length - len(query), 0)
+    padded = np.pad(query, ((radius, trailing), (0, 0)), "edge")
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * radius + 1, axis=0)
+    windows = windows[:length]
+    return windows.min(axis=2), windows.max(axis=2)
+
+
+def lb_keogh(
+    candidate: FloatArray,
+    query: FloatArray,
+    radius: int | None = None,
+    query_envelope: tuple[FloatArray, FloatArray] | None = None,
+) -> float:
+    """LB_Keogh lower bound of ``dtw(candidate, query, radius).distance``.
+
+    Every candidate frame lies on the warping path at least once, and its cost
+    there is at least its distance to the query envelope around it.
+
+    Args:
+        candidate: ``(frames, ...)`` series.
+        query: Series it is compared with.
+        radius: Band radius, resolved as in :func:`dtw`.
+        query_envelope: Precomputed :func:`envelope` of the query for this
+            radius and candidate length.
+    """
+
+    candidate = _as_features(candidate)
+    query = _as_features(query)
+    radius = band_radius(len(candidate), len(query), radius)
+    lower, upper = query_envelope or envelope(query, radius, len(candidate))
+    excess = np.maximum(candidate - upper, 0.0) + np.maximum(lower - candidate, 0.0)
+    return float(np.sqrt((excess**2).sum(axis=1)).sum())
+
+
+def nearest(
+    query: FloatArray,
+    candidates: Sequence[FloatArray],
+    radius: int | None = None,
+    k: int = 1,
+) -> list[tuple[int, float]]:
+    """Return the ``k`` candidates closest to ``query`` under banded DTW.
+
+    Candidates are visited in order of their LB_Keogh bound, and the search
+    stops as soon as a bound exceeds the ``k``-th best distance found.
+
+    Returns:
+        ``(candidate index, distance)`` pairs sorted by distance.
+    """
+
+    if k < 1:
+        raise ValueError("k must be a positive integer.")
+    query = _as_features(query)
+    series = [_as_features(candidate) for candidate in candidates]
+    bounds = np.array([lb_keogh(candidate, query, radius) for candidate in series])
+
+    best: list[tuple[int, float]] = []
+    computed = 0
+    for index in np.argsort(bounds, kind="stable"):
+        if len(best) == k and bounds[index] >= best[-1][1]:
+            break
+        distance = dtw(series[index], query, radius, return_path=False).distance
+        computed += 1
+        best.append((int(index), distance))
+        best.sort(key=lambda item: item[1])
+        del best[k:]
+    logger.debug(
+        "LB_Keogh pruned %s of %s DTW computations", len(series) - computed, len(series)
+    )
+    return best
+
+
+def align_point_arrays(
+    trial: C3DPointArray, reference: C3DPointArray, radius: int | None = None
+) -> DTWResult:
+    """Align two captures on the markers they have in common.
+
+    Raises:
+        ValueError: If the captures share no marker labels.
+    """
+
+    common = [label for label in reference.marker_labels if label in trial.label_index]
+    if not common:
+        raise ValueError("The captures have no marker labels in common.")
+    trial_columns = [trial.label_index[label] for label in common]
+    reference_columns = [reference.label_index[label] for label in common]
+    return dtw(
+        trial.coordinates[:, trial_columns],
+        reference.coordinates[:, reference_columns],
+        radius,
+    )
+
+
+def warp(values: FloatArray, path: npt.NDArray[np.intp], length: int) -> FloatArray:
+    """Resample ``values`` (indexed by ``j``) onto the ``i`` axis of a path.
+
+    Frames of ``values`` matched with the same ``i`` are averaged, giving a
+    ``(length, ...)`` series that lines up frame by frame with the other one.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    counts = np.bincount(path[:, 0], minlength=length).astype(np.float64)
+    flat = values.reshape(len(values), -1)
+    sums = np.zeros((length, flat.shape[1]))
+    np.add.at(sums, path[:, 0], flat[path[:, 1]])
+    with np.errstate(invalid="ignore"):
+        warped = sums / counts[:, np.newaxis]
+    return warped.reshape((length,) + values.shape[1:])
+
+
+def _as_features(series: FloatArray) -> FloatArray:
+    """Validate a series and flatten it to ``(frames, features)``."""
+    series = np.asarray(series, dtype=np.float64)
+    if series.ndim == 0 or len(series) == 0:
+        raise ValueError("Cannot align an empty series.")
+    features = series.reshape(len(series), -1)
+    if np.isnan(features).any():
+        raise ValueError("Series contain NaN samples; fill the gaps before DTW.")
+    return features
+
+
+def _accumulated_cost(x: FloatArray, y: FloatArray, radius: int) -> FloatArray:
+    """Banded ``(n + 1, 2 * radius + 1)`` accumulated cost.
+
+    Column ``k`` of row ``i`` holds cell ``(i, j = i + k - radius)`` of the full
+    ``(n + 1, m + 1)`` matrix; cells outside the band or the matrix are ``inf``.
+    """
+    if numba is not None:
+        return np.asarray(
+            _accumulated_cost_numba(
+                np.ascontiguousarray(x), np.ascontiguousarray(y), radius
+            ),
+            dtype=np.float64,
+        )
+
+    n, m = len(x), len(y)
+    width = 2 * radius + 1
+    cost = np.full((n + 1, width), np.inf)
+    cost[0, radius] = 0.0
+    for diagonal in range(n + m - 1):
+        # Cells (i, j) with i + j == diagonal and |i - j| <= radius.
+        first = max(0, diagonal - m + 1, -((radius - diagonal) // 2))
+        last = min(n - 1, diagonal, (diagonal + radius) // 2)
+        if first > last:
+            continue
+        i = np.arange(first, last + 1)
+        j = diagonal - i
+        k = j - i + radius
+        distance = np.sqrt(((x[i] - y[j]) ** 2).sum(axis=1))
+        # (i, j) sits in column k of row i, (i, j + 1) in column k + 1 and
+        # (i + 1, j) in column k - 1 of row i + 1; the last two may leave the band.
+        above = np.where(k + 1 < width, cost[i, np.minimum(k + 1, width - 1)], np.inf)
+        left = np.where(k > 0, cost[i + 1, np.maximum(k - 1, 0)], np.inf)
+        previous = np.minimum(np.minimum(cost[i, k], above), left)
+        cost[i + 1, k] = distance + previous
+    return cost
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)  # type: ignore[misc, untyped-decorator, unused-ignore]
+    def _accumulated_cost_numba(
+        x: FloatArray, y: FloatArray, radius: int
+    ) -> FloatArray:
+        """Row-by-row banded accumulation compiled by Numba."""
+        n, m = x.shape[0], y.shape[0]
+        width = 2 * radius + 1
+        cost = np.full((n + 1, width), np.inf)
+        cost[0, radius] = 0.0
+        for i in range(1, n + 1):
+            for j in range(max(1, i - radius), min(m, i + radius) + 1):
+                squared = 0.0
+                for feature in range(x.shape[1]):
+                    difference = x[i - 1, feature] - y[j - 1, feature]
+                    squared += difference * difference
+                k = j - i + radius
+                previous = cost[i - 1, k]
+                if k + 1 < width:
+                    previous = min(previous, cost[i - 1, k + 1])
+                if k > 0:
+                    previous = min(previous, cost[i, k - 1])
+                cost[i, k] = np.sqrt(squared) + previous
+        return cost
+
+
+def _band_cell(cost: FloatArray, radius: int, i: int, j: int) -> float:
+    """Cell ``(i, j)`` of the full matrix stored in a banded cost array."""
+    k = j - i + radius
+    if 0 <= k < cost.shape[1]:
+        return float(cost[i, k])
+    return math.inf
+
+
+def _backtrack(cost: FloatArray, m: int, radius: int) -> npt.NDArray[np.intp]:
+    """Optimal warping path through a banded accumulated cost array."""
+    i, j = cost.shape[0] - 1, m
+    path = [(i - 1, j - 1)]
+    while i > 1 or j > 1:
+        steps = (
+            _band_cell(cost, radius, i - 1, j - 1),
+            _band_cell(cost, radius, i - 1, j),
+            _band_cell(cost, radius, i, j - 1),
+        )
+        step = int(np.argmin(steps))
+        if step == 0:
+            i, j = i - 1, j - 1
+        elif step == 1:
+            i -= 1
+        else:
+            j -= 1
+        path.append((i - 1, j - 1))
+    return np.array(path[::-1], dtype=np.intp)
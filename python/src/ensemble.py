@@ -0,0 +1,353 @@
+"""Time-normalized ensemble averaging of many swing trials.
+
+Each trial is resampled onto a common phase axis of ``samples`` points from 0
+to 100 %, either uniformly over the whole trial or piecewise-linearly between
+anchor events (e.g. address at 0 %, top at 60 %, impact at 80 %, finish at
+100 %), so that the same swing event lines up across trials.
+
+:class:`EnsembleAccumulator` takes trials one at a time. Mean and standard
+deviation are updated with Welford's algorithm, and the normalized trials are
+kept for percentile bands only when requested. Memory is therefore bounded by
+the normalized ``(trials, samples, markers, 3)`` output rather than by the raw
+captures, which can be loaded, added and released one by one.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+
+from .c3d_reader import C3DDataReader, C3DPointArray, MarkerSelection
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_SAMPLES = 101
+DEFAULT_PERCENTILES = (5.0, 95.0)
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class EnsembleResult:
+    """Summary statistics of time-normalized trials.
+
+    Attributes:
+        phase: ``(samples,)`` phase axis in percent.
+        mean: ``(samples, markers, 3)`` mean over trials, ignoring gaps.
+        std: Sample standard deviation, ``NaN`` where fewer than two trials
+            had data.
+        count: ``(samples, markers)`` number of trials with data.
+        percentiles: Percentile bands keyed by percentile.
+        trials: ``(trials, samples, markers, 3)`` stack, when it was kept.
+    """
+
+    phase: FloatArray
+    mean: FloatArray
+    std: FloatArray
+    count: npt.NDArray[np.int64]
+    marker_labels: list[str]
+    percentiles: dict[float, FloatArray]
+    trials: FloatArray | None = None
+
+    @property
+    def trial_count(self) -> int:
+        """Largest number of trials contributing to any sample."""
+
+        return int(self.count.max()) if self.count.size else 0
+
+
+def time_normalize(
+    coordinates: FloatArray,
+    samples: int = DEFAULT_SAMPLES,
+    event_frames: Sequence[float] | None = None,
+    anchor_percents: Sequence[float] | None = None,
+) -> FloatArray:
+    """Resample a ``(frames, ...)`` trial onto ``samples`` points of 0-100 %.
+
+    Without events the trial is stretched uniformly. With ``event_frames`` and
+    matching increasing ``anchor_percents`` the mapping is piecewise-linear:
+    event ``k`` lands exactly at ``anchor_percents[k]``. Phase points outside
+    the anchors hold the first or last event frame.
+
+    Args:
+        coordinates: Trial samples along the first axis, any trailing shape.
+        samples: Number of phase points.
+        event_frames: Frame index of each anchor event.
+        anchor_percents: Phase in percent of each anchor event.
+
+    Returns:
+        A new ``(samples, ...)`` array, linearly interpolated between frames;
+        phase points between a frame and a ``NaN`` frame are ``NaN``.
+
+    Raises:
+        ValueError: If fewer than two samples are requested, the anchors do not
+            match the events or are not increasing.
+    """
+
+    if samples < 2:
+        raise ValueError("At least two phase samples are required.")
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    frame_count = coordinates.shape[0]
+    phase = np.linspace(0.0, 100.0, samples)
+
+    if event_frames is None:
+        source = phase / 100.0 * (frame_count - 1)
+    else:
+        if anchor_percents is None or len(anchor_percents) != len(event_frames):
+            raise ValueError("Each anchor event needs exactly one anchor percent.")
+        percents = np.asarray(anchor_percents, dtype=np.float64)
+        frames = np.asarray(event_frames, dtype=np.float64)
+        if np.any(np.diff(percents) <= 0) or np.any(np.diff(frames) < 0):
+            raise ValueError("Anchor percents and event frames must be increasing.")
+        source = np.interp(phase, percents, frames)
+
+    source = np.clip(source, 0, frame_count - 1)
+    lower = np.minimum(np.floor(source).astype(np.intp), max(frame_count - 2, 0))
+    upper = np.minimum(lower + 1, frame_count - 1)
+    weight = (source - lower).reshape((-1,) + (1,) * (coordinates.ndim - 1))
+    start = coordinates[lower]
+    # Phase points on a frame must not pick up a gap in the following frame.
+    interpolated = start + weight * (coordinates[upper] - start)
+    return np.asarray(np.where(weight > 0, interpolated, start), dtype=np.float64)
+
+
+class EnsembleAccumulator:
+    """Streaming ensemble of time-normalized trials.
+
+    Markers are matched by label: the first trial fixes the label order unless
+    ``marker_labels`` is given, and markers missing from a trial count as gaps.
+    """
+
+    def __init__(
+        self,
+        samples: int = DEFAULT_SAMPLES,
+        anchors: Mapping[str, float] | None = None,
+        marker_labels: Sequence[str] | None = None,
+        keep_trials: bool = True,
+    ) -> None:
+        """Create an empty ensemble.
+
+        Args:
+            samples: Number of phase points from 0 to 100 %.
+            anchors: Optional phase in percent of named events, e.g.
+                ``{"address": 0, "top": 60, "impact": 80, "finish": 100}``.
+                Every added trial must then provide these event frames.
+            marker_labels: Marker order of the ensemble.
+            keep_trials: Keep the normalized trials, which percentile bands and
+                :attr:`EnsembleResult.trials` require.
+        """
+        if samples < 2:
+            raise ValueError("At least two phase samples are required.")
+        self.samples = samples
+        self.anchors = dict(sorted((anchors or {}).items(), key=lambda item: item[1]))
+        self.marker_labels = list(marker_labels) if marker_labels else None
+        self.keep_trials = keep_trials
+        self._trials: list[FloatArray] = []
+        self._added = 0
+        self._count: npt.NDArray[np.int64] | None = None
+        self._mean: FloatArray | None = None
+        self._m2: FloatArray | None = None
+
+    @property
+    def trial_count(self) -> int:
+        """Number of trials added so far."""
+
+        return self._added
+
+    def add(
+        self,
+        trial: C3DPointArray,
+        event_frames: Mapping[str, int] | None = None,
+    ) -> FloatArray:
+        """Normalize one trial and add it to the ensemble.
+
+        Args:
+            trial: Marker trajectories of the trial.
+            event_frames: Frame index of each anchor event, relative to the
+                first frame of ``trial``. Required when anchors are set.
+
+        Returns:
+            The ``(samples, markers, 3)`` normalized trial.
+
+        Raises:
+            KeyError: If an anchor event is missing from ``event_frames``.
+        """
+
+        if self.marker_labels is None:
+            self.marker_labels = list(trial.marker_labels)
+        coordinates = self._reorder(trial)
+
+        if self.anchors:
+            frames = event_frames or {}
+            missing = [name for name in self.anchors if name not in frames]
+            if missing:
+                raise KeyError(f"Trial is missing anchor events {missing}.")
+            normalized = time_normalize(
+                coordinates,
+                self.samples,
+                [frames[name] for name in self.anchors],
+                list(self.anchors.values()),
+            )
+        else:
+            normalized = time_normalize(coordinates, self.samples)
+
+        self._update_moments(normalized)
+        if self.keep_trials:
+            self._trials.append(normalized)
+        self._added += 1
+        return normalized
+
+    def result(
+        self, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> EnsembleResult:
+        """Return the ensemble statistics of the trials added so far.
+
+        Args:
+            percentiles: Percentile bands to compute. Requires ``keep_trials``
+                unless empty.
+
+        Raises:
+            ValueError: If no trial was added, or percentiles are requested
+                from an accumulator that does not keep trials.
+        """
+
+        if self._mean is None or self._m2 is None or self._count is None:
+            raise ValueError("The ensemble does not contain any trials yet.")
+        if percentiles and not self.keep_trials:
+            raise ValueError("Percentile bands require keep_trials=True.")
+
+        count = self._count[..., np.newaxis]
+        mean = np.where(count > 0, self._mean, np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            std = np.where(count > 1, np.sqrt(self._m2 / (count - 1)), np.nan)
+
+        trials = np.stack(self._trials) if self.keep_trials else None
+        bands: dict[float, FloatArray] = {}
+        if trials is not None and percentiles:
+            values = _nanpercentile(trials, percentiles)
+            bands = {
+                float(q): band for q, band in zip(percentiles, values, strict=True)
+            }
+        return EnsembleResult(
+            phase=np.linspace(0.0, 100.0, self.samples),
+            mean=mean,
+            std=std,
+            count=self._count.copy(),
+            marker_labels=list(self.marker_labels or []),
+            percentiles=bands,
+            trials=trials,
+        )
+
+    def _reorder(self, trial: C3DPointArray) -> FloatArray:
+        """Trial coordinates in the ensemble's marker order, gaps for absent ones."""
+        labels = self.marker_labels or []
+        if list(trial.marker_labels) == labels:
+            return np.asarray(trial.coordinates, dtype=np.float64)
+        coordinates = np.full(
+            (trial.coordinates.shape[0], len(labels), 3), np.nan, dtype=np.float64
+        )
+        positions = [
+            (target, trial.label_index[label])
+            for target, label in enumerate(labels)
+            if label in trial.label_index
+        ]
+        if positions:
+            targets, sources = zip(*positions, strict=True)
+            coordinates[:, list(targets)] = trial.coordinates[:, list(sources)]
+        return coordinates
+
+    def _update_moments(self, normalized: FloatArray) -> None:
+        """Welford update of the running mean and squared deviations."""
+        if self._count is None or self._mean is None or self._m2 is None:
+            self._count = np.zeros(normalized.shape[:2], dtype=np.int64)
+            self._mean = np.zeros_like(normalized)
+            self._m2 = np.zeros_like(normalized)
+        valid = np.asarray(~np.isnan(normalized).any(axis=2), dtype=np.bool_)
+        self._count += valid
+        # Gaps contribute a zero delta, leaving their running moments unchanged.
+        valid_xyz = valid[..., np.newaxis]
+        values = np.where(valid_xyz, normalized, 0.0)
+        delta = np.where(valid_xyz, values - self._mean, 0.0)
+        self._mean += delta / np.maximum(self._count, 1)[..., np.newaxis]
+        self._m2 += delta * (values - self._mean)
+
+
+def ensemble_average(
+    trials: Iterable[C3DPointArray | tuple[C3DPointArray, Mapping[str, int]]],
+    samples: int = DEFAULT_SAMPLES,
+    anchors: Mapping[str, float] | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    keep_trials: bool = True,
+) -> EnsembleResult:
+    """Ensemble-average trials streamed from an iterable.
+
+    Args:
+        trials: Point arrays, or ``(point_array, event_frames)`` pairs when
+            ``anchors`` are used. A generator keeps one raw trial in memory.
+        samples: Number of phase points from 0 to 100 %.
+        anchors: Optional phase in percent of named events.
+        percentiles: Percentile bands to compute.
+        keep_trials: Return the normalized trial stack as well.
+    """
+
+    accumulator = EnsembleAccumulator(
+        samples, anchors, keep_trials=keep_trials or bool(percentiles)
+    )
+    for trial in trials:
+        if isinstance(trial, tuple):
+            accumulator.add(*trial)
+        else:
+            accumulator.add(trial)
+    result = accumulator.result(percentiles)
+    return result if keep_trials else replace(result, trials=None)
+
+
+def ensemble_from_files(
+    paths: Iterable[Path | str],
+    samples: int = DEFAULT_SAMPLES,
+    anchors: Mapping[str, float] | None = None,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    *,
+    markers: MarkerSelection | None = None,
+    target_units: str | None = None,
+    backend: str = "ezc3d",
+) -> EnsembleResult:
+    """Ensemble-average C3D captures, loading and releasing one file at a time.
+
+    With ``anchors``, event frames come from
+    :meth:`~src.c3d_reader.C3DDataReader.segment_swing`.
+
+    Args:
+        paths: Capture files.
+        samples: Number of phase points from 0 to 100 %.
+        anchors: Optional phase in percent of named swing events.
+        percentiles: Percentile bands to compute.
+        markers: Optional marker selection applied to every capture.
+        target_units: Optional common unit string (``"m"`` or ``"mm"``).
+        backend: ``C3DDataReader`` backend.
+    """
+
+    accumulator = EnsembleAccumulator(samples, anchors, keep_trials=bool(percentiles))
+    for path in paths:
+        with C3DDataReader(path, backend=backend) as reader:
+            trial = reader.points_array(markers=markers, target_units=target_units)
+            events = reader.segment_swing().event_frames if anchors else None
+            accumulator.add(trial, events)
+            logger.debug("Added %s to the ensemble", path)
+    return accumulator.result(percentiles)
+
+
+def _nanpercentile(trials: FloatArray, percentiles: Sequence[float]) -> FloatArray:
+    """Percentiles over the trial axis, ``NaN`` where no trial has data."""
+    with warnings.catch_warnings():
+        # All-NaN slices are expected where every trial has a gap.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        return np.asarray(
+            np.nanpercentile(trials, list(percentiles), axis=0), dtype=np.float64
+        )
@@ -0,0 +1,172 @@
+"""Zero-phase filtering of whole marker trajectory blocks.
+
+Filters are described by a hashable :class:`FilterSpec`. Second-order-section
+(SOS) coefficients are designed once per spec and sample rate and then applied
+with :func:`scipy.signal.sosfiltfilt` along the frame axis of the complete
+``(frames, markers, 3)`` block, so all markers and axes are filtered in one
+vectorized call.
+
+``sosfiltfilt`` cannot pass ``NaN`` samples, so gaps are temporarily bridged by
+linear interpolation (and edge gaps held at the nearest valid sample) before
+filtering, and the original gaps are restored afterwards.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from .gap_filling import fill_gaps, gap_bounds
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+FILTER_KINDS = ("butter", "bessel", "cheby2")
+FILTER_BTYPES = ("lowpass", "highpass", "bandpass", "bandstop")
+
+# Stop-band attenuation for Chebyshev type II designs, in dB.
+CHEBY2_ATTENUATION_DB = 40.0
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    """Hashable description of an IIR filter.
+
+    Attributes:
+        kind: Filter family, one of :data:`FILTER_KINDS`.
+        cutoff: Cutoff frequency in Hz, or ``(low, high)`` for band filters.
+        order: Filter order of the single-pass design. ``sosfiltfilt`` runs it
+            forwards and backwards, doubling the effective order.
+        btype: One of :data:`FILTER_BTYPES`.
+    """
+
+    kind: str = "butter"
+    cutoff: float | tuple[float, float] = 6.0
+    order: int = 4
+    btype: str = "lowpass"
+
+    def __post_init__(self) -> None:
+        if self.kind not in FILTER_KINDS:
+            raise ValueError(
+                f"Unsupported filter kind {self.kind!r}; "
+                f"expected one of {FILTER_KINDS}."
+            )
+        if self.btype not in FILTER_BTYPES:
+            raise ValueError(
+                f"Unsupported filter type {self.btype!r}; "
+                f"expected one of {FILTER_BTYPES}."
+            )
+        if self.order < 1:
+            raise ValueError("Filter order must be a positive integer.")
+        if not isinstance(self.cutoff, (int, float)):
+            # Keep the spec hashable when band edges are passed as a list.
+            object.__setattr__(self, "cutoff", tuple(self.cutoff))
+
+
+@functools.lru_cache(maxsize=64)
+def design_sos(spec: FilterSpec, sample_rate: float) -> FloatArray:
+    """Return the (cached, read-only) SOS coefficients of ``spec``.
+
+    Raises:
+        ValueError: If a cutoff is not strictly between 0 and the Nyquist
+            frequency.
+    """
+
+    from scipy import signal
+
+    nyquist = sample_rate / 2.0
+    cutoffs = np.atleast_1d(np.asarray(spec.cutoff, dtype=np.float64))
+    if sample_rate <= 0 or np.any(cutoffs <= 0) or np.any(cutoffs >= nyquist):
+        raise ValueError(
+            f"Cutoff {spec.cutoff} Hz must lie between 0 and the Nyquist "
+            f"frequency ({nyquist} Hz)."
+        )
+
+    if spec.kind == "butter":
+        sos = signal.butter(
+            spec.order, spec.cutoff, btype=spec.btype, fs=sample_rate, output="sos"
+        )
+    elif spec.kind == "bessel":
+        sos = signal.bessel(
+            spec.order,
+            spec.cutoff,
+            btype=spec.btype,
+            fs=sample_rate,
+            output="sos",
+            norm="phase",
+        )
+    else:
+        sos = signal.cheby2(
+            spec.order,
+            CHEBY2_ATTENUATION_DB,
+            spec.cutoff,
+            btype=spec.btype,
+            fs=sample_rate,
+            output="sos",
+        )
+    sos = np.asarray(sos, dtype=np.float64)
+    sos.flags.writeable = False
+    return sos
+
+
+def filter_trajectories(
+    coordinates: FloatArray, sample_rate: float, spec: FilterSpec
+) -> FloatArray:
+    """Zero-phase filter a ``(frames, markers, 3)`` block along the frame axis.
+
+    Args:
+        coordinates: Marker coordinates, possibly containing ``NaN`` gaps.
+        sample_rate: Frame rate in Hz.
+        spec: Filter to apply.
+
+    Returns:
+        A new array of filtered coordinates with the input's gaps preserved.
+    """
+
+    from scipy import signal
+
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    sos = design_sos(spec, float(sample_rate))
+    frame_count = coordinates.shape[0]
+    if frame_count < 2:
+        return coordinates.copy()
+
+    missing = np.isnan(coordinates)
+    bridged = bridge_gaps(coordinates) if missing.any() else coordinates
+
+    # Default sosfiltfilt padding, shortened for captures that are too short.
+    padlen = 3 * (
+        2 * len(sos) + 1 - min((sos[:, 2] == 0).sum(), (sos[:, 5] == 0).sum())
+    )
+    filtered = signal.sosfiltfilt(
+        sos.copy(), bridged, axis=0, padlen=min(padlen, frame_count - 1)
+    )
+    filtered[missing] = np.nan
+    return np.asarray(filtered, dtype=np.float64)
+
+
+def bridge_gaps(coordinates: FloatArray) -> FloatArray:
+    """Return a gap-free copy of ``coordinates`` for whole-signal operations.
+
+    Interior gaps are linearly interpolated, leading and trailing gaps hold the
+    nearest valid sample and markers that are never seen become 0.
+    """
+
+    bridged, _ = fill_gaps(coordinates, "linear")
+    missing = np.isnan(bridged).any(axis=2)
+    if missing.any():
+        previous, following = gap_bounds(np.asarray(missing, dtype=np.bool_))
+        frame_count = missing.shape[0]
+        # Only leading and trailing runs remain: hold the nearest valid sample.
+        source = np.where(previous >= 0, previous, following)
+        frame_index, marker_index = np.nonzero(missing & (source < frame_count))
+        bridged[frame_index, marker_index] = bridged[
+            source[frame_index, marker_index], marker_index
+        ]
+        bridged[np.isnan(bridged)] = 0.0
+    return bridged
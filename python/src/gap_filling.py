@@ -0,0 +1,345 @@
+"""Vectorized gap filling for marker trajectories.
+
+Gaps are frames where a marker has ``NaN`` coordinates, either because the
+camera system lost it or because :meth:`~src.c3d_reader.C3DDataReader.points_array`
+blanked samples above ``residual_nan_threshold``. All methods operate on the
+``(frames, markers, 3)`` coordinate arrays of :class:`~src.c3d_reader.C3DPointArray`
+at once instead of looping over markers:
+
+* ``"linear"`` interpolates between the samples bracketing each gap.
+* ``"cubic"`` fits a cubic spline through the valid samples. Markers that share
+  the same set of valid frames are fitted together in one spline.
+* ``"rigid"`` reconstructs a marker from donor markers assumed to move rigidly
+  with it (e.g. the club cluster). The transform from the nearest frame where
+  the marker was seen is estimated with a batched Kabsch fit.
+
+Gaps longer than ``max_gap`` frames are left untouched; ``"linear"`` and
+``"cubic"`` never extrapolate past the first or last valid sample.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+GAP_FILL_METHODS = ("linear", "cubic", "rigid")
+
+# Number of donor markers used by rigid-body reconstruction when none are given.
+DEFAULT_DONOR_COUNT = 3
+
+# Frames sampled when ranking candidate donors by distance variability.
+_DONOR_SAMPLE_FRAMES = 2000
+
+FloatArray = npt.NDArray[np.float64]
+BoolArray = npt.NDArray[np.bool_]
+
+
+@dataclass(frozen=True)
+class GapFillReport:
+    """Which samples a gap-filling pass reconstructed, per marker."""
+
+    marker_labels: list[str]
+    method: str
+    missing: BoolArray
+    filled: BoolArray
+
+    @property
+    def filled_counts(self) -> npt.NDArray[np.int64]:
+        """Number of filled frames per marker."""
+
+        counts: npt.NDArray[np.int64] = self.filled.sum(axis=0)
+        return counts
+
+    @property
+    def unfilled_counts(self) -> npt.NDArray[np.int64]:
+        """Number of frames per marker that are still missing."""
+
+        counts: npt.NDArray[np.int64] = (self.missing & ~self.filled).sum(axis=0)
+        return counts
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Summarize the report as one row per marker."""
+
+        return pd.DataFrame(
+            {
+                "marker": self.marker_labels,
+                "missing": self.missing.sum(axis=0),
+                "filled": self.filled_counts,
+                "unfilled": self.unfilled_counts,
+            }
+        )
+
+
+def fill_gaps(
+    coordinates: FloatArray,
+    method: str = "linear",
+    max_gap: int | None = None,
+    marker_labels: Sequence[str] | None = None,
+    donors: Mapping[str, Sequence[str]] | None = None,
+) -> tuple[FloatArray, GapFillReport]:
+    """Fill ``NaN`` gaps in a ``(frames, markers, 3)`` coordinate array.
+
+    Args:
+        coordinates: Marker coordinates; a sample is missing when any of its
+            three components is ``NaN``.
+        method: One of :data:`GAP_FILL_METHODS`.
+        max_gap: Longest gap, in frames, that is filled. ``None`` fills gaps
+            of any length.
+        marker_labels: Labels of the marker axis, used by the report and to
+            resolve ``donors``. Defaults to ``Marker_<index>``.
+        donors: For ``"rigid"``, labels of the donor markers of each target
+            marker. Markers without an entry use the
+            :data:`DEFAULT_DONOR_COUNT` markers whose distance to the target
+            varies least over the capture.
+
+    Returns:
+        The filled coordinates (a new array) and a :class:`GapFillReport`.
+
+    Raises:
+        ValueError: If the method is unknown, ``max_gap`` is negative or the
+            array does not have shape ``(frames, markers, 3)``.
+    """
+
+    if method not in GAP_FILL_METHODS:
+        raise ValueError(
+            f"Unsupported gap filling method {method!r}; "
+            f"expected one of {GAP_FILL_METHODS}."
+        )
+    if max_gap is not None and max_gap < 0:
+        raise ValueError("max_gap must be non-negative.")
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    if coordinates.ndim != 3 or coordinates.shape[2] != 3:
+        raise ValueError(
+            "Expected coordinates shaped (frames, markers, 3), "
+            f"got {coordinates.shape}."
+        )
+    labels = (
+        list(marker_labels)
+        if marker_labels is not None
+        else [f"Marker_{idx}" for idx in range(coordinates.shape[1])]
+    )
+
+    missing: BoolArray = np.asarray(np.isnan(coordinates).any(axis=2))
+    filled = coordinates.copy()
+    if missing.any():
+        if method == "linear":
+            _fill_linear(filled, missing, max_gap)
+        elif method == "cubic":
+            _fill_cubic(filled, missing, max_gap)
+        else:
+            _fill_rigid(filled, missing, max_gap, labels, donors or {})
+
+    report = GapFillReport(
+        marker_labels=labels,
+        method=method,
+        missing=missing,
+        filled=np.asarray(missing & ~np.isnan(filled).any(axis=2)),
+    )
+    logger.debug(
+        "Filled %s of %s missing samples with %s gap filling",
+        int(report.filled.sum()),
+        int(missing.sum()),
+        method,
+    )
+    return filled, report
+
+
+def gap_bounds(missing: BoolArray) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Index of the last valid frame before and first valid frame after each sample.
+
+    Args:
+        missing: ``(frames, markers)`` mask of missing samples.
+
+    Returns:
+        ``(previous, following)`` arrays shaped like ``missing``. ``previous`` is
+        ``-1`` before the first valid sample and ``following`` is ``frames``
+        after the last one. For valid samples both equal the frame index.
+    """
+
+    frame_count = missing.shape[0]
+    frames = np.arange(frame_count)[:, np.newaxis]
+    previous = np.maximum.accumulate(np.where(missing, -1, frames), axis=0)
+    following = np.minimum.accumulate(
+        np.where(missing, frame_count, frames)[::-1], axis=0
+    )[::-1]
+    return previous, following
+
+
+def _interior_gaps(
+    missing: BoolArray, max_gap: int | None
+) -> tuple[BoolArray, npt.NDArray[np.intp], npt.NDArray[np.intp]]:
+    """Missing samples bracketed by valid ones within gaps of at most ``max_gap``."""
+    previous, following = gap_bounds(missing)
+    fillable = missing & (previous >= 0) & (following < missing.shape[0])
+    if max_gap is not None:
+        fillable &= following - previous - 1 <= max_gap
+    return fillable, previous, following
+
+
+def _fill_linear(
+    coordinates: FloatArray, missing: BoolArray, max_gap: int | None
+) -> None:
+    """Linear interpolation across every marker and axis in one pass."""
+    fillable, previous, following = _interior_gaps(missing, max_gap)
+    frame_index, marker_index = np.nonzero(fillable)
+    before = previous[frame_index, marker_index]
+    after = following[frame_index, marker_index]
+    weight = ((frame_index - before) / (after - before))[:, np.newaxis]
+    start = coordinates[before, marker_index]
+    end = coordinates[after, marker_index]
+    coordinates[frame_index, marker_index] = start + weight * (end - start)
+
+
+def _fill_cubic(
+    coordinates: FloatArray, missing: BoolArray, max_gap: int | None
+) -> None:
+    """Cubic spline interpolation, one spline per group of identical masks."""
+    from scipy.interpolate import CubicSpline
+
+    fillable, _, _ = _interior_gaps(missing, max_gap)
+    candidates = np.flatnonzero(fillable.any(axis=0))
+    if len(candidates) == 0:
+        return
+
+    # Markers dropped out in the same frames share their sample positions, so
+    # their coordinates can be fitted as extra columns of a single spline.
+    groups: dict[bytes, list[int]] = {}
+    for marker in candidates:
+        groups.setdefault(np.packbits(missing[:, marker]).tobytes(), []).append(
+            int(marker)
+        )
+
+    frames = np.arange(missing.shape[0])
+    for members in groups.values():
+        valid = ~missing[:, members[0]]
+        if valid.sum() < 2:
+            continue
+        spline = CubicSpline(frames[valid], coordinates[valid][:, members], axis=0)
+        targets = fillable[:, members].any(axis=1)
+        values = spline(frames[targets])
+        block = coordinates[targets][:, members]
+        mask = fillable[targets][:, members]
+        block[mask] = values[mask]
+        coordinates[np.ix_(targets, np.asarray(members, dtype=np.intp))] = block
+
+
+def _fill_rigid(
+    coordinates: FloatArray,
+    missing: BoolArray,
+    max_gap: int | None,
+    labels: list[str],
+    donors: Mapping[str, Sequence[str]],
+) -> None:
+    """Reconstruct markers from rigidly attached donors with batched Kabsch fits."""
+    previous, following = gap_bounds(missing)
+    fillable = missing.copy()
+    if max_gap is not None:
+        # Runs touching the start or end of the capture count up to the edge.
+        fillable &= following - previous - 1 <= max_gap
+    label_index = {label: idx for idx, label in enumerate(labels)}
+    observed = ~missing
+
+    for target in np.flatnonzero(fillable.any(axis=0)):
+        donor_indices = _donor_indices(
+            coordinates, observed, int(target), labels, label_index, donors
+        )
+        if len(donor_indices) < 3:
+            logger.debug("Not enough donors to rebuild %s", labels[target])
+            continue
+
+        frames = np.flatnonzero(fillable[:, target])
+        # Use the nearest frame where the target was seen as the reference.
+        before = previous[frames, target]
+        after = following[frames, target]
+        use_after = (before < 0) | (
+            (after < missing.shape[0]) & (after - frames < frames - before)
+        )
+        reference = np.where(use_after, after, before)
+        usable = (
+            (reference >= 0)
+            & (reference < missing.shape[0])
+            & observed[frames][:, donor_indices].all(axis=1)
+        )
+        usable[usable] &= observed[reference[usable]][:, donor_indices].all(axis=1)
+        frames, reference = frames[usable], reference[usable]
+        if len(frames) == 0:
+            continue
+
+        rotation, translation = _kabsch(
+            coordinates[reference][:, donor_indices],
+            coordinates[frames][:, donor_indices],
+        )
+        source = coordinates[reference, target]
+        coordinates[frames, target] = (
+            np.einsum("nij,nj->ni", rotation, source) + translation
+        )
+
+
+def _donor_indices(
+    coordinates: FloatArray,
+    observed: BoolArray,
+    target: int,
+    labels: list[str],
+    label_index: dict[str, int],
+    donors: Mapping[str, Sequence[str]],
+) -> list[int]:
+    """Donor markers for ``target``: explicit ones, else the most rigid neighbours."""
+    if labels[target] in donors:
+        return [
+            label_index[label]
+            for label in donors[labels[target]]
+            if label in label_index and label_index[label] != target
+        ]
+
+    step = max(1, coordinates.shape[0] // _DONOR_SAMPLE_FRAMES)
+    sample = coordinates[::step]
+    seen = observed[::step, target]
+    if seen.sum() < 2:
+        return []
+    distances = np.linalg.norm(
+        sample[seen] - sample[seen, target][:, np.newaxis], axis=2
+    )
+    with np.errstate(invalid="ignore"):
+        variability = np.nanstd(distances, axis=0)
+    coverage = observed[::step][seen].mean(axis=0)
+    variability[(coverage < 0.5) | ~np.isfinite(variability)] = np.inf
+    variability[target] = np.inf
+    ranked = np.argsort(variability)[:DEFAULT_DONOR_COUNT]
+    return [int(idx) for idx in ranked if np.isfinite(variability[idx])]
+
+
+def _kabsch(source: FloatArray, target: FloatArray) -> tuple[FloatArray, FloatArray]:
+    """Batched least-squares rigid transforms mapping ``source`` onto ``target``.
+
+    Args:
+        source: ``(n, k, 3)`` donor positions in the reference frames.
+        target: ``(n, k, 3)`` donor positions in the frames to fill.
+
+    Returns:
+        ``(n, 3, 3)`` rotations and ``(n, 3)`` translations such that
+        ``target ≈ source @ R.T + t`` for each of the ``n`` frames.
+    """
+    source_centroid = source.mean(axis=1)
+    target_centroid = target.mean(axis=1)
+    covariance = np.einsum(
+        "nki,nkj->nij",
+        source - source_centroid[:, np.newaxis],
+        target - target_centroid[:, np.newaxis],
+    )
+    u, _, vt = np.linalg.svd(covariance)
+    # Flip the last singular vector where needed to exclude reflections.
+    sign = np.sign(np.linalg.det(np.einsum("nij,njk->nik", u, vt)))
+    sign[sign == 0] = 1.0
+    correction = np.ones((len(sign), 3))
+    correction[:, 2] = sign
+    rotation = np.einsum("nji,nj,nkj->nik", vt, correction, u)
+    translation = target_centroid - np.einsum("nij,nj->ni", rotation, source_centroid)
+    return rotation, translation
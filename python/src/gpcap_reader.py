@@ -0,0 +1,578 @@
+"""Streaming reader for Gears ``.gpcap`` / ``.info`` capture files.
+
+A Gears session folder holds one ``N Capture.gpcap`` file per swing and a small
+``N Capture.info`` sidecar. Both are Protocol Buffers messages, decoded here by
+a minimal wire-format parser so no schema compiler or generated code is needed.
+The field layout below was inferred from the captures shipped with this
+repository and cross-checked against their C3D exports:
+
+* top level: ``1`` capture id, ``2`` marker count, ``3`` frame rate in Hz,
+  ``5`` recording time, ``7`` player, ``9`` swing summary (``3`` top and ``4``
+  impact time in seconds, ``5`` duration), ``14`` skeleton definition and
+  ``15`` one record per frame, written after all other fields;
+* frame record: ``1`` time in seconds and ``14`` the labeled camera markers,
+  each with ``1``-``3`` coordinates in metres, ``6``/``7`` segment, ``8`` index
+  within the segment and ``9`` a fit residual.
+
+Segment ``1`` is the body; its markers are named by the skeleton definition
+(``WaistLeft``, ``HeadTop``, ...). The club segments are labeled
+``Marker_<segment>:<segment>:<index>`` as in the C3D export, so the marker sets
+of :data:`~src.c3d_reader.MARKER_SETS` apply unchanged. Unlabeled markers are
+dropped. The mirrored club block of each record (field ``3``) is not read.
+
+:class:`GpcapReader` reads the file record by record, decoding each frame
+straight into the ``(frames, markers, 3)`` layout of
+:class:`~src.c3d_reader.C3DPointArray`. :func:`read_session` loads every capture
+of a session folder in parallel.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .c3d_batch import C3DBatchResult
+from .c3d_reader import C3DEvent, C3DMetadata, C3DPointArray
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+GPCAP_SUFFIX = ".gpcap"
+INFO_SUFFIX = ".info"
+GPCAP_UNITS = "m"
+
+# Segment of the body markers named by the skeleton definition.
+BODY_SEGMENT = 1
+
+ProgressCallback = Callable[[int, int, Path], None]
+
+FloatArray = npt.NDArray[np.float64]
+
+# Wire types of the Protocol Buffers encoding.
+_VARINT, _FIXED64, _LENGTH, _FIXED32 = 0, 1, 2, 5
+
+# Top-level fields shared by .gpcap and .info files.
+_CAPTURE_ID, _MARKER_COUNT, _FRAME_RATE, _RECORDED_AT = 1, 2, 3, 5
+# .gpcap fields.
+_PLAYER, _SWING, _SKELETON, _FRAME = 7, 9, 14, 15
+# .info fields.
+_INFO_DURATION, _INFO_PLAYER = 11, 15
+
+_SWING_TOP, _SWING_IMPACT, _SWING_DURATION = 3, 4, 5
+_PLAYER_FIRST_NAME, _PLAYER_LAST_NAME = 3, 5
+_FRAME_TIME, _FRAME_MARKERS, _MARKER = 1, 14, 4
+
+_SKELETON_MAGIC = b"ASKL"
+_SKELETON_BLOB = 2
+# A UTF-16 marker name in the skeleton blob is preceded by a zero word, its
+# marker index and its length in characters, all little-endian 32-bit integers.
+_SKELETON_NAME = re.compile(rb"(?s)\x00{4}(.{4})(.{4})((?:[\x20-\x7e]\x00)+)")
+
+_FLOAT32 = struct.Struct("<f")
+
+# Frames allocated before the first doubling while a capture is decoded.
+_INITIAL_FRAMES = 256
+
+
+@dataclass(frozen=True)
+class GearsCaptureInfo:
+    """Header fields of a Gears capture.
+
+    Attributes:
+        capture_id: UUID of the capture.
+        frame_rate: Camera frame rate in Hz.
+        marker_count: Number of labeled markers the system tracks.
+        recorded_at: Recording time, when present.
+        player: Player name as ``"First Last"``.
+        duration: Capture length in seconds, when present.
+        events: Swing events stored in the header (``Top``, ``Impact``).
+        marker_names: Body marker names by index within the body segment.
+    """
+
+    capture_id: str
+    frame_rate: float
+    marker_count: int
+    recorded_at: datetime | None
+    player: str
+    duration: float | None
+    events: list[C3DEvent]
+    marker_names: dict[int, str]
+
+
+@dataclass(frozen=True)
+class GearsFrame:
+    """Labeled markers of one decoded frame record."""
+
+    index: int
+    time: float
+    labels: list[str]
+    coordinates: FloatArray
+    residuals: FloatArray
+
+
+class GpcapReader:
+    """Decode a ``.gpcap`` capture incrementally into C3D-style arrays."""
+
+    def __init__(self, file_path: Path | str) -> None:
+        """Create a reader for a capture.
+
+        Args:
+            file_path: ``.gpcap`` file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        self.file_path = Path(file_path)
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {self.file_path}")
+        self._info: GearsCaptureInfo | None = None
+        self._points: C3DPointArray | None = None
+
+    @property
+    def info(self) -> GearsCaptureInfo:
+        """Header fields, read without decoding any frame record."""
+
+        if self._info is None:
+            with self.file_path.open("rb") as handle:
+                self._info = _read_header(handle, self.file_path)
+        return self._info
+
+    def iter_frames(self) -> Iterator[GearsFrame]:
+        """Yield the frame records one at a time.
+
+        Only the record being decoded is held in memory, so arbitrarily long
+        captures can be processed in constant space.
+        """
+
+        with self.file_path.open("rb") as handle:
+            info = _read_header(handle, self.file_path)
+            self._info = self._info or info
+            index = 0
+            for field, wire_type, value in _iter_stream_fields(handle):
+                if field != _FRAME or wire_type != _LENGTH:
+                    continue
+                # Length-delimited fields always carry their payload bytes.
+                yield _decode_frame(cast(bytes, value), index, info.marker_names)
+                index += 1
+
+    def points_array(self) -> C3DPointArray:
+        """Return every labeled marker as a :class:`C3DPointArray`, memoized.
+
+        Body markers come first in skeleton order, followed by the club
+        markers sorted by segment and index. Frames in which a marker was not
+        labeled hold ``NaN`` coordinates and a residual of ``-1``.
+        """
+
+        if self._points is None:
+            self._points = self._decode_points()
+        return self._points
+
+    def get_metadata(self) -> C3DMetadata:
+        """Return the capture description in the layout of ``C3DDataReader``."""
+
+        points = self.points_array()
+        return C3DMetadata(
+            marker_labels=list(points.marker_labels),
+            frame_count=points.frame_count,
+            frame_rate=points.frame_rate,
+            units=points.units,
+            analog_labels=[],
+            analog_rate=None,
+            events=list(self.info.events),
+        )
+
+    def _decode_points(self) -> C3DPointArray:
+        """Stream the records into growing per-marker columns."""
+        columns: dict[str, int] = {}
+        capacity = max(self.info.marker_count, 1)
+        coordinates = np.full((_INITIAL_FRAMES, capacity, 3), np.nan)
+        residuals = np.full((_INITIAL_FRAMES, capacity), -1.0)
+        frame_count = 0
+        for frame in self.iter_frames():
+            for label in frame.labels:
+                columns.setdefault(label, len(columns))
+            rows, width = residuals.shape
+            if frame_count == rows or len(columns) > width:
+                rows *= 2 if frame_count == rows else 1
+                width = max(width, len(columns))
+                coordinates, residuals = _grow(coordinates, residuals, rows, width)
+            targets = [columns[label] for label in frame.labels]
+            coordinates[frame_count, targets] = frame.coordinates
+            residuals[frame_count, targets] = frame.residuals
+            frame_count += 1
+
+        body = {name: i for i, name in enumerate(self.info.marker_names.values())}
+        labels = sorted(
+            columns, key=lambda label: (label not in body, body.get(label, 0), label)
+        )
+        order = [columns[label] for label in labels]
+        logger.debug(
+            "Decoded %s frames of %s markers from %s",
+            frame_count,
+            len(labels),
+            self.file_path,
+        )
+        return C3DPointArray(
+            coordinates=coordinates[:frame_count, order],
+            residuals=residuals[:frame_count, order],
+            marker_labels=labels,
+            label_index={label: index for index, label in enumerate(labels)},
+            frame_rate=self.info.frame_rate,
+            units=GPCAP_UNITS,
+        )
+
+
+def read_capture_info(file_path: Path | str) -> GearsCaptureInfo:
+    """Read the header of a ``.gpcap`` file or its ``.info`` sidecar.
+
+    The ``.info`` file carries no skeleton or swing events; those fields are
+    empty when it is read.
+    """
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {path}")
+    with path.open("rb") as handle:
+        return _read_header(handle, path)
+
+
+def find_captures(folder: Path | str) -> list[Path]:
+    """Return the ``.gpcap`` files below ``folder`` in capture-number order."""
+
+    return sorted(Path(folder).rglob(f"*{GPCAP_SUFFIX}"), key=_capture_sort_key)
+
+
+def read_session(
+    folder: Path | str | Iterable[Path | str],
+    workers: int | None = None,
+    progress: ProgressCallback | None = None,
+) -> list[C3DBatchResult]:
+    """Decode every capture of a session folder in parallel.
+
+    A capture that cannot be decoded is reported on its result and never
+    aborts the rest of the session.
+
+    Args:
+        folder: Session folder searched recursively, or explicit capture files.
+        workers: Number of worker processes. Defaults to the CPU count; ``1``
+            decodes the files sequentially in the calling process.
+        progress: Optional ``progress(completed, total, path)`` callback.
+
+    Returns:
+        One :class:`~src.c3d_batch.C3DBatchResult` per capture in
+        capture-number order, with ``analogs`` left empty.
+    """
+
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer.")
+    if isinstance(folder, (str, Path)):
+        paths = find_captures(folder)
+    else:
+        paths = sorted((Path(path) for path in folder), key=_capture_sort_key)
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    results: list[C3DBatchResult | None] = [None] * len(paths)
+
+    if workers == 1:
+        for index, path in enumerate(paths):
+            results[index] = _load_capture(path)
+            if progress is not None:
+                progress(index + 1, len(paths), path)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures: dict[Future[C3DBatchResult], int] = {
+                pool.submit(_load_capture, path): index
+                for index, path in enumerate(paths)
+            }
+            for completed, future in enumerate(as_completed(futures), start=1):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as error:  # worker process died
+                    results[index] = C3DBatchResult(
+                        path=paths[index], error=f"{type(error).__name__}: {error}"
+                    )
+                if progress is not None:
+                    progress(completed, len(paths), paths[index])
+
+    loaded = [
+        result or C3DBatchResult(path=path, error="No result")
+        for path, result in zip(paths, results, strict=True)
+    ]
+    failures = sum(not result.ok for result in loaded)
+    logger.info("Decoded %s of %s Gears captures", len(loaded) - failures, len(loaded))
+    return loaded
+
+
+def _load_capture(path: Path) -> C3DBatchResult:
+    """Worker entry point: decode one capture."""
+    try:
+        reader = GpcapReader(path)
+        points = reader.points_array()
+        metadata = reader.get_metadata()
+    except Exception as error:
+        logger.warning("Failed to decode %s: %s", path, error)
+        return C3DBatchResult(path=path, error=f"{type(error).__name__}: {error}")
+    return C3DBatchResult(path=path, metadata=metadata, points=points)
+
+
+def _capture_sort_key(path: Path) -> tuple[str, int, str]:
+    """Order ``2 Capture`` before ``10 Capture`` within a folder."""
+    match = re.match(r"\d+", path.name)
+    return (str(path.parent), int(match.group()) if match else -1, path.name)
+
+
+def _grow(
+    coordinates: FloatArray, residuals: FloatArray, rows: int, width: int
+) -> tuple[FloatArray, FloatArray]:
+    """Copy the filled arrays into larger ``NaN`` / ``-1`` padded ones."""
+    grown_coordinates = np.full((rows, width, 3), np.nan)
+    grown_residuals = np.full((rows, width), -1.0)
+    frames, markers = residuals.shape
+    grown_coordinates[:frames, :markers] = coordinates
+    grown_residuals[:frames, :markers] = residuals
+    return grown_coordinates, grown_residuals
+
+
+def _read_header(handle: BinaryIO, path: Path) -> GearsCaptureInfo:
+    """Decode the fields in front of the first frame record.
+
+    The handle is left positioned at the first frame record. Field ``15`` is
+    the player in an ``.info`` file, so the whole sidecar is read.
+    """
+    is_info = path.suffix.lower() == INFO_SUFFIX
+    fields: dict[int, int | bytes] = {}
+    while True:
+        start = handle.tell()
+        entry = next(_iter_stream_fields(handle), None)
+        if entry is None:
+            break
+        field, _, value = entry
+        if field == _FRAME and not is_info:
+            handle.seek(start)
+            break
+        fields.setdefault(field, value)
+
+    if _FRAME_RATE not in fields:
+        raise ValueError(f"Not a Gears capture file: {path}")
+    player = fields.get(_INFO_PLAYER if is_info else _PLAYER, b"")
+    swing = {} if is_info else _message(fields.get(_SWING, b""))
+    events = [
+        C3DEvent(label=label, time=_float32(swing[key]))
+        for label, key in (("Top", _SWING_TOP), ("Impact", _SWING_IMPACT))
+        if key in swing
+    ]
+    duration = swing.get(_SWING_DURATION, fields.get(_INFO_DURATION))
+    recorded = _message(fields.get(_RECORDED_AT, b"")).get(1)
+    return GearsCaptureInfo(
+        capture_id=_text(fields.get(_CAPTURE_ID, b"")),
+        frame_rate=float(_integer(fields[_FRAME_RATE])),
+        marker_count=_integer(fields.get(_MARKER_COUNT, 0)),
+        recorded_at=(
+            None
+            if recorded is None
+            else datetime.fromtimestamp(_integer(recorded), tz=UTC)
+        ),
+        player=_player_name(player),
+        duration=None if duration is None else _float32(duration),
+        events=events,
+        marker_names=_skeleton_names(fields.get(_SKELETON, b"")),
+    )
+
+
+def _decode_frame(record: bytes, index: int, names: dict[int, str]) -> GearsFrame:
+    """Decode the labeled markers of one frame record."""
+    time = 0.0
+    labels: list[str] = []
+    values: list[tuple[float, float, float, float]] = []
+    for field, _, value in _iter_fields(record):
+        if field == _FRAME_TIME:
+            time = _float32(value)
+        elif field == _FRAME_MARKERS:
+            if not isinstance(value, bytes):
+                raise ValueError(f"Expected a length-delimited field {field}.")
+            for marker_field, _, marker in _iter_fields(value):
+                if marker_field != _MARKER:
+                    continue
+                marker_values = _message(marker)
+                segment = _integer(marker_values.get(6, 0))
+                if segment == 0:
+                    continue
+                marker_index = _integer(marker_values.get(8, 0))
+                if segment == BODY_SEGMENT and marker_index in names:
+                    labels.append(names[marker_index])
+                else:
+                    group = _integer(marker_values.get(7, segment))
+                    labels.append(f"Marker_{segment}:{group}:{marker_index}")
+                values.append(
+                    (
+                        _float32(marker_values.get(1, 0)),
+                        _float32(marker_values.get(2, 0)),
+                        _float32(marker_values.get(3, 0)),
+                        _float32(marker_values.get(9, 0)),
+                    )
+                )
+    array = np.array(values, dtype=np.float64).reshape(-1, 4)
+    return GearsFrame(
+        index=index,
+        time=time,
+        labels=labels,
+        coordinates=array[:, :3],
+        residuals=array[:, 3],
+    )
+
+
+def _skeleton_names(definition: int | bytes) -> dict[int, str]:
+    """Body marker names keyed by their index, from the skeleton definition."""
+    blob = _message(definition).get(_SKELETON_BLOB, b"")
+    if not isinstance(blob, bytes) or not blob.startswith(_SKELETON_MAGIC):
+        return {}
+    names: dict[int, str] = {}
+    # Skip the magic, version, segment and count words and the skeleton name.
+    (name_length,) = struct.unpack_from("<I", blob, 16)
+    offset = 20 + 2 * name_length
+    for match in _SKELETON_NAME.finditer(blob, offset):
+        (marker_index,) = struct.unpack("<I", match.group(1))
+        (length,) = struct.unpack("<I", match.group(2))
+        name = match.group(3).decode("utf-16-le")
+        if length == len(name) and marker_index not in names:
+            names[marker_index] = name
+    return names
+
+
+def _player_name(player: int | bytes) -> str:
+    """``"First Last"`` from a player message."""
+    values = _message(player)
+    parts = (values.get(_PLAYER_FIRST_NAME), values.get(_PLAYER_LAST_NAME))
+    return " ".join(_text(part) for part in parts if part)
+
+
+def _message(payload: int | bytes) -> dict[int, int | bytes]:
+    """First value of every field of an embedded message."""
+    if not isinstance(payload, bytes):
+        return {}
+    values: dict[int, int | bytes] = {}
+    for field, _, value in _iter_fields(payload):
+        values.setdefault(field, value)
+    return values
+
+
+def _iter_fields(buffer: bytes) -> Iterator[tuple[int, int, int | bytes]]:
+    """Yield ``(field, wire_type, value)`` of a serialized message.
+
+    Varints are returned as integers; fixed-width and length-delimited values
+    as their raw bytes.
+    """
+    position, end = 0, len(buffer)
+    while position < end:
+        key, position = _read_varint(buffer, position)
+        field, wire_type = key >> 3, key & 7
+        if wire_type == _VARINT:
+            value, position = _read_varint(buffer, position)
+            yield field, wire_type, value
+            continue
+        if wire_type == _LENGTH:
+            size, position = _read_varint(buffer, position)
+        elif wire_type == _FIXED32:
+            size = 4
+        elif wire_type == _FIXED64:
+            size = 8
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in field {field}.")
+        if position + size > end:
+            raise ValueError(f"Truncated field {field}.")
+        yield field, wire_type, buffer[position : position + size]
+        position += size
+
+
+def _iter_stream_fields(
+    handle: BinaryIO,
+) -> Iterator[tuple[int, int, int | bytes]]:
+    """Like :func:`_iter_fields`, but read top-level fields from a file."""
+    while True:
+        key = _read_stream_varint(handle)
+        if key is None:
+            return
+        field, wire_type = key >> 3, key & 7
+        if wire_type == _VARINT:
+            value = _read_stream_varint(handle)
+            if value is None:
+                raise ValueError(f"Truncated field {field}.")
+            yield field, wire_type, value
+            continue
+        if wire_type == _LENGTH:
+            length = _read_stream_varint(handle)
+            if length is None:
+                raise ValueError(f"Truncated field {field}.")
+            size = length
+        elif wire_type == _FIXED32:
+            size = 4
+        elif wire_type == _FIXED64:
+            size = 8
+        else:
+            raise ValueError(f"Unsupported wire type {wire_type} in field {field}.")
+        payload = handle.read(size)
+        if len(payload) != size:
+            raise ValueError(f"Truncated field {field}.")
+        yield field, wire_type, payload
+
+
+def _read_varint(buffer: bytes, position: int) -> tuple[int, int]:
+    """Decode a base-128 varint; return the value and the next position."""
+    result = shift = 0
+    while True:
+        if position >= len(buffer):
+            raise ValueError("Truncated varint.")
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Varint is longer than 64 bits.")
+
+
+def _read_stream_varint(handle: BinaryIO) -> int | None:
+    """Read a varint from a file, or ``None`` at a clean end of file."""
+    result = shift = 0
+    while True:
+        byte = handle.read(1)
+        if not byte:
+            if shift == 0:
+                return None
+            raise ValueError("Truncated varint.")
+        result |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return result
+        shift += 7
+        if shift >= 64:
+            raise ValueError("Varint is longer than 64 bits.")
+
+
+def _float32(value: int | bytes) -> float:
+    """Little-endian ``float`` field, ``0.0`` when omitted as a default."""
+    if not isinstance(value, bytes):
+        return 0.0
+    return float(_FLOAT32.unpack(value)[0])
+
+
+def _integer(value: int | bytes) -> int:
+    """Varint field value."""
+    if not isinstance(value, int):
+        raise ValueError("Expected a varint field.")
+    return value
+
+
+def _text(value: int | bytes) -> str:
+    """UTF-8 string field."""
+    return value.decode("utf-8") if isinstance(value, bytes) else ""
@@ -0,0 +1,273 @@
+"""Vectorized marker kinematics: velocity, acceleration, jerk and speed.
+
+:func:`compute_kinematics` differentiates the complete ``(frames, markers, 3)``
+coordinate block along the frame axis in one pass, either with second-order
+central differences (:func:`numpy.gradient`) or with a Savitzky-Golay
+derivative filter, which smooths while differentiating. The resulting
+:class:`Kinematics` holds every derivative for every marker and summarizes path
+length and peak speed for all markers in a single call.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .filtering import bridge_gaps
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+DERIVATIVE_METHODS = ("central", "savgol")
+KINEMATIC_QUANTITIES = ("position", "velocity", "acceleration", "jerk")
+
+DEFAULT_SAVGOL_WINDOW = 11
+DEFAULT_SAVGOL_POLYORDER = 3
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class Kinematics:
+    """Position derivatives of every marker, shaped ``(frames, markers, 3)``."""
+
+    marker_labels: list[str]
+    frame_rate: float
+    position: FloatArray
+    velocity: FloatArray
+    acceleration: FloatArray
+    jerk: FloatArray
+    method: str = "central"
+    first_frame: int = 0
+    label_index: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "label_index",
+            {label: index for index, label in enumerate(self.marker_labels)},
+        )
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames along the first axis."""
+
+        return int(self.position.shape[0])
+
+    @property
+    def time(self) -> FloatArray:
+        """Frame timestamps in seconds."""
+
+        return (np.arange(self.frame_count) + self.first_frame) / self.frame_rate
+
+    @property
+    def speed(self) -> FloatArray:
+        """Velocity magnitude, shaped ``(frames, markers)``."""
+
+        speed: FloatArray = np.linalg.norm(self.velocity, axis=2)
+        return speed
+
+    def marker(self, label: str, quantity: str = "velocity") -> FloatArray:
+        """Return the ``(frames, 3)`` series of one quantity for one marker.
+
+        Args:
+            label: Marker label.
+            quantity: One of :data:`KINEMATIC_QUANTITIES`, or ``"speed"`` for
+                the ``(frames,)`` velocity magnitude.
+        """
+
+        index = self.label_index[label]
+        if quantity == "speed":
+            return self.speed[:, index]
+        if quantity not in KINEMATIC_QUANTITIES:
+            raise ValueError(
+                f"Unknown kinematic quantity {quantity!r}; "
+                f"expected one of {KINEMATIC_QUANTITIES} or 'speed'."
+            )
+        values: FloatArray = getattr(self, quantity)[:, index, :]
+        return values
+
+    def summary(self) -> pd.DataFrame:
+        """Per-marker path length, mean and peak speed, and time of peak speed.
+
+        Returns:
+            DataFrame indexed by marker with columns ``path_length``,
+            ``mean_speed``, ``max_speed``, ``peak_frame`` and ``peak_time``.
+            Markers without any valid speed sample report ``NaN`` peaks and a
+            ``peak_frame`` of ``-1``.
+        """
+
+        segments = np.linalg.norm(np.diff(self.position, axis=0), axis=2)
+        speed = self.speed
+        valid = ~np.isnan(speed)
+        has_speed = valid.any(axis=0)
+        peak = np.where(
+            has_speed, np.argmax(np.where(valid, speed, -np.inf), axis=0), -1
+        )
+        columns = np.arange(speed.shape[1])
+        with warnings.catch_warnings():
+            # All-NaN markers trigger "Mean of empty slice".
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            mean_speed = np.nanmean(speed, axis=0)
+        max_speed = np.where(has_speed, speed[np.maximum(peak, 0), columns], np.nan)
+        peak_time = np.where(
+            has_speed, (peak + self.first_frame) / self.frame_rate, np.nan
+        )
+        return pd.DataFrame(
+            {
+                "path_length": np.nansum(segments, axis=0),
+                "mean_speed": mean_speed,
+                "max_speed": max_speed,
+                "peak_frame": peak + np.where(has_speed, self.first_frame, 0),
+                "peak_time": peak_time,
+            },
+            index=pd.Index(self.marker_labels, name="marker"),
+        )
+
+
+def derivative(
+    values: FloatArray,
+    frame_rate: float,
+    order: int = 1,
+    method: str = "central",
+    window_length: int = DEFAULT_SAVGOL_WINDOW,
+    polyorder: int = DEFAULT_SAVGOL_POLYORDER,
+) -> FloatArray:
+    """Differentiate ``values`` ``order`` times along the first axis.
+
+    Args:
+        values: Samples along axis 0, any trailing shape.
+        frame_rate: Sampling rate in Hz.
+        order: Derivative order.
+        method: ``"central"`` for repeated second-order central differences or
+            ``"savgol"`` for a Savitzky-Golay derivative filter.
+        window_length: Savitzky-Golay window in frames (odd).
+        polyorder: Savitzky-Golay polynomial order; must be at least ``order``.
+            The ``"savgol"`` method needs finite samples, see
+            :func:`compute_kinematics` for gap handling.
+
+    Raises:
+        ValueError: If the method is unknown, the frame rate not positive, or
+            a ``"savgol"`` window is longer than the samples or its polynomial
+            order is below ``order``.
+    """
+
+    if method not in DERIVATIVE_METHODS:
+        raise ValueError(
+            f"Unsupported derivative method {method!r}; "
+            f"expected one of {DERIVATIVE_METHODS}."
+        )
+    if frame_rate <= 0:
+        raise ValueError("A positive frame rate is required for derivatives.")
+    values = np.asarray(values, dtype=np.float64)
+    spacing = 1.0 / frame_rate
+
+    if method == "savgol":
+        from scipy.signal import savgol_filter
+
+        if values.shape[0] < window_length:
+            raise ValueError(
+                f"Savitzky-Golay window of {window_length} frames is longer than "
+                f"the {values.shape[0]} available samples."
+            )
+        if polyorder < order:
+            # savgol_filter returns zeros for derivatives above the fit order.
+            raise ValueError(
+                f"Savitzky-Golay polyorder {polyorder} is below the derivative "
+                f"order {order}."
+            )
+        return np.asarray(
+            savgol_filter(
+                values,
+                window_length,
+                polyorder,
+                deriv=order,
+                delta=spacing,
+                axis=0,
+                mode="interp",
+            ),
+            dtype=np.float64,
+        )
+
+    result = values
+    for _ in range(order):
+        if result.shape[0] < 2:
+            return np.full_like(values, np.nan)
+        edge_order: Literal[1, 2] = 2 if result.shape[0] > 2 else 1
+        result = np.gradient(result, spacing, axis=0, edge_order=edge_order)
+    return result
+
+
+def compute_kinematics(
+    coordinates: FloatArray,
+    frame_rate: float,
+    method: str = "central",
+    marker_labels: Sequence[str] | None = None,
+    window_length: int = DEFAULT_SAVGOL_WINDOW,
+    polyorder: int = DEFAULT_SAVGOL_POLYORDER,
+    first_frame: int = 0,
+) -> Kinematics:
+    """Compute velocity, acceleration and jerk of every marker at once.
+
+    Args:
+        coordinates: ``(frames, markers, 3)`` marker positions.
+        frame_rate: Frame rate in Hz.
+        method: ``"central"`` or ``"savgol"``, see :func:`derivative`.
+        marker_labels: Labels of the marker axis. Defaults to ``Marker_<index>``.
+        window_length: Savitzky-Golay window in frames (odd).
+        polyorder: Savitzky-Golay polynomial order (at least 3 for jerk).
+        first_frame: Absolute index of the first frame, used for timestamps.
+
+    Returns:
+        A :class:`Kinematics` with read-only arrays. Central differences
+        propagate ``NaN`` gaps to their neighbouring frames; Savitzky-Golay
+        derivatives are computed across bridged gaps and blanked inside them.
+    """
+
+    position = np.asarray(coordinates, dtype=np.float64)
+    missing = np.isnan(position).any(axis=2)
+    # The Savitzky-Golay fit cannot pass NaN samples: bridge the gaps and blank
+    # the derivatives there again afterwards, as filter_trajectories does.
+    source = bridge_gaps(position) if method == "savgol" and missing.any() else position
+    labels = (
+        list(marker_labels)
+        if marker_labels is not None
+        else [f"Marker_{idx}" for idx in range(position.shape[1])]
+    )
+    if method == "savgol":
+        # Each derivative comes straight from the fitted polynomials.
+        velocity, acceleration, jerk = (
+            derivative(source, frame_rate, order, method, window_length, polyorder)
+            for order in (1, 2, 3)
+        )
+    else:
+        velocity = derivative(position, frame_rate, 1, method)
+        acceleration = derivative(velocity, frame_rate, 1, method)
+        jerk = derivative(acceleration, frame_rate, 1, method)
+
+    for array in (velocity, acceleration, jerk):
+        if source is not position:
+            array[missing] = np.nan
+        array.flags.writeable = False
+    logger.debug(
+        "Computed %s kinematics for %s markers over %s frames",
+        method,
+        len(labels),
+        position.shape[0],
+    )
+    return Kinematics(
+        marker_labels=labels,
+        frame_rate=float(frame_rate),
+        position=position,
+        velocity=velocity,
+        acceleration=acceleration,
+        jerk=jerk,
+        method=method,
+        first_frame=first_frame,
+    )
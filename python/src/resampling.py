@@ -0,0 +1,192 @@
+"""Resampling of point and analog streams onto a common timebase.
+
+Marker trajectories are sampled at the point frame rate and analog channels
+(force plates, launch monitors, EMG) at the analog rate, usually an integer
+multiple of it. :func:`resample` converts a whole ``(samples, ...)`` block to a
+new rate with :func:`scipy.signal.resample_poly`, whose polyphase FIR filter
+provides the anti-aliasing needed when decimating. :func:`align_streams` uses it
+to bring both streams of a capture onto one rate so they can be analysed as
+arrays of equal length.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from fractions import Fraction
+
+import numpy as np
+import numpy.typing as npt
+
+from .filtering import bridge_gaps
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+ALIGN_TARGETS = ("points", "analogs")
+
+# Largest denominator accepted when approximating a rate ratio by a fraction.
+MAX_RATE_DENOMINATOR = 1000
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class AlignedStreams:
+    """Point and analog data sampled on the same timebase.
+
+    Attributes:
+        time: ``(samples,)`` timestamps in seconds.
+        points: ``(samples, markers, 3)`` marker coordinates.
+        analogs: ``(samples, channels)`` analog values.
+        rate: Common sample rate in Hz.
+    """
+
+    time: FloatArray
+    points: FloatArray
+    analogs: FloatArray
+    rate: float
+    marker_labels: list[str]
+    analog_labels: list[str]
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples along the first axis of every array."""
+
+        return int(self.time.shape[0])
+
+
+def rate_ratio(source_rate: float, target_rate: float) -> tuple[int, int]:
+    """Return ``(up, down)`` integers with ``up / down == target / source``.
+
+    Raises:
+        ValueError: If either rate is not positive.
+    """
+
+    if source_rate <= 0 or target_rate <= 0:
+        raise ValueError("Sample rates must be positive.")
+    ratio = Fraction(target_rate / source_rate).limit_denominator(MAX_RATE_DENOMINATOR)
+    return ratio.numerator, ratio.denominator
+
+
+def resample(values: FloatArray, source_rate: float, target_rate: float) -> FloatArray:
+    """Resample ``values`` along the first axis from one rate to another.
+
+    All trailing axes (markers, coordinates, channels) are resampled in one
+    vectorized call. Edges are padded by line extrapolation to avoid the
+    droop of zero padding. Samples containing ``NaN`` are not supported; see
+    :func:`resample_points` for marker data with gaps.
+
+    Args:
+        values: ``(samples, ...)`` array.
+        source_rate: Current sample rate in Hz.
+        target_rate: Requested sample rate in Hz.
+
+    Returns:
+        A new ``(ceil(samples * target / source), ...)`` array.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    up, down = rate_ratio(source_rate, target_rate)
+    if up == down or values.shape[0] == 0:
+        return values.copy()
+    if values.size == 0 or values.shape[0] < 2:
+        # Nothing to filter: repeat or drop samples to reach the new length.
+        sample_count = -(-values.shape[0] * up // down)
+        indices = np.minimum(np.arange(sample_count) * down // up, values.shape[0] - 1)
+        repeated: FloatArray = values[indices]
+        return repeated
+
+    from scipy import signal
+
+    return np.asarray(
+        signal.resample_poly(values, up, down, axis=0, padtype="line"),
+        dtype=np.float64,
+    )
+
+
+def resample_points(
+    coordinates: FloatArray, source_rate: float, target_rate: float
+) -> FloatArray:
+    """Resample ``(frames, markers, 3)`` coordinates, keeping gaps as ``NaN``.
+
+    Gaps are bridged before resampling (see
+    :func:`~src.filtering.bridge_gaps`); output samples whose nearest input
+    frame was missing are blanked again.
+    """
+
+    coordinates = np.asarray(coordinates, dtype=np.float64)
+    missing: npt.NDArray[np.bool_] = np.asarray(np.isnan(coordinates).any(axis=2))
+    if not missing.any():
+        return resample(coordinates, source_rate, target_rate)
+
+    resampled = resample(bridge_gaps(coordinates), source_rate, target_rate)
+    nearest = np.rint(np.arange(resampled.shape[0]) * source_rate / target_rate)
+    nearest = np.minimum(nearest.astype(np.intp), coordinates.shape[0] - 1)
+    resampled[missing[nearest]] = np.nan
+    return resampled
+
+
+def align_streams(
+    points: FloatArray,
+    point_rate: float,
+    analogs: FloatArray,
+    analog_rate: float,
+    target: str | float = "points",
+    marker_labels: Sequence[str] | None = None,
+    analog_labels: Sequence[str] | None = None,
+    start_time: float = 0.0,
+) -> AlignedStreams:
+    """Resample point and analog streams onto one sample rate.
+
+    Args:
+        points: ``(frames, markers, 3)`` marker coordinates.
+        point_rate: Point frame rate in Hz.
+        analogs: ``(samples, channels)`` analog values.
+        analog_rate: Analog sample rate in Hz.
+        target: ``"points"`` decimates the analogs to the point rate,
+            ``"analogs"`` upsamples the points to the analog rate, and a number
+            resamples both to that rate in Hz.
+        marker_labels: Labels of the marker axis.
+        analog_labels: Labels of the analog channel axis.
+        start_time: Time of the first sample in seconds.
+
+    Returns:
+        :class:`AlignedStreams` whose arrays all have the same length; the
+        longer stream is truncated to the duration of the shorter one.
+
+    Raises:
+        ValueError: If ``target`` is an unknown name or a rate is not positive.
+    """
+
+    if isinstance(target, str):
+        if target not in ALIGN_TARGETS:
+            raise ValueError(
+                f"Unsupported alignment target {target!r}; "
+                f"expected one of {ALIGN_TARGETS} or a rate in Hz."
+            )
+        rate = point_rate if target == "points" else analog_rate
+    else:
+        rate = float(target)
+
+    aligned_points = resample_points(points, point_rate, rate)
+    aligned_analogs = resample(analogs, analog_rate, rate)
+    sample_count = min(aligned_points.shape[0], aligned_analogs.shape[0])
+    logger.debug(
+        "Aligned %s point frames at %s Hz and %s analog samples at %s Hz "
+        "onto %s samples at %s Hz",
+        points.shape[0],
+        point_rate,
+        analogs.shape[0],
+        analog_rate,
+        sample_count,
+        rate,
+    )
+    return AlignedStreams(
+        time=start_time + np.arange(sample_count) / rate,
+        points=aligned_points[:sample_count],
+        analogs=aligned_analogs[:sample_count],
+        rate=float(rate),
+        marker_labels=list(marker_labels or []),
+        analog_labels=list(analog_labels or []),
+    )
@@ -0,0 +1,270 @@
+"""Swing phase segmentation from capture events or club-head speed.
+
+A swing is split at four key events, ``address``, ``top``, ``impact`` and
+``finish``, into the phases of :data:`SWING_PHASES`. Event frames come from the
+labels stored in the capture (:attr:`~src.c3d_reader.C3DMetadata.events`) or,
+when those are missing, are detected from the club speed profile by
+:func:`detect_swing_events`.
+
+A :class:`SwingSegmentation` only stores frame ranges. Phase data is taken as
+basic slices along the frame axis, so the per-phase arrays are views that share
+memory with the full capture instead of boolean-masked copies.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TypeVar
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+SWING_EVENTS = ("address", "top", "impact", "finish")
+
+# Phase name -> (starting event, ending event).
+SWING_PHASES = {
+    "backswing": ("address", "top"),
+    "downswing": ("top", "impact"),
+    "follow_through": ("impact", "finish"),
+}
+
+# Alternative event labels found in capture files, after normalization.
+EVENT_ALIASES = {
+    "setup": "address",
+    "takeaway": "address",
+    "top_of_backswing": "top",
+    "top_of_swing": "top",
+    "transition": "top",
+    "ball_impact": "impact",
+    "contact": "impact",
+    "end": "finish",
+    "end_of_swing": "finish",
+}
+
+# Speed thresholds for detection, as fractions of the peak club speed.
+DEFAULT_TOP_FRACTION = 0.25
+DEFAULT_REST_FRACTION = 0.05
+
+FloatArray = npt.NDArray[np.float64]
+ScalarT = TypeVar("ScalarT", bound=np.generic)
+
+
+@dataclass(frozen=True)
+class SwingPhase:
+    """A half-open ``[start_frame, end_frame)`` range of frames."""
+
+    name: str
+    start_frame: int
+    end_frame: int
+    frame_rate: float
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames in the phase."""
+
+        return self.end_frame - self.start_frame
+
+    @property
+    def duration(self) -> float:
+        """Phase duration in seconds."""
+
+        return self.frame_count / self.frame_rate
+
+    @property
+    def frames(self) -> slice:
+        """Slice selecting the phase along a frame axis."""
+
+        return slice(self.start_frame, self.end_frame)
+
+
+@dataclass(frozen=True)
+class SwingSegmentation:
+    """Event frames of one swing and the phases between them.
+
+    Attributes:
+        event_frames: Frame index of each key event that was found.
+        phases: Phases whose bounding events are both known, in swing order.
+        source: ``"events"`` when the frames come from capture events,
+            ``"detected"`` when they were derived from club speed.
+    """
+
+    event_frames: dict[str, int]
+    phases: list[SwingPhase]
+    source: str = "events"
+
+    def phase(self, name: str) -> SwingPhase:
+        """Return the phase called ``name``.
+
+        Raises:
+            KeyError: If the phase could not be segmented.
+        """
+
+        for phase in self.phases:
+            if phase.name == name:
+                return phase
+        raise KeyError(f"Phase {name!r} not available; have {self.phase_names}.")
+
+    @property
+    def phase_names(self) -> list[str]:
+        """Names of the segmented phases."""
+
+        return [phase.name for phase in self.phases]
+
+    def durations(self) -> dict[str, float]:
+        """Duration in seconds of every phase."""
+
+        return {phase.name: phase.duration for phase in self.phases}
+
+    def slice_frames(
+        self, values: npt.NDArray[ScalarT], axis: int = 0
+    ) -> dict[str, npt.NDArray[ScalarT]]:
+        """Split ``values`` into per-phase views along the frame ``axis``."""
+
+        index: list[slice] = [slice(None)] * values.ndim
+        views = {}
+        for phase in self.phases:
+            index[axis] = phase.frames
+            views[phase.name] = values[tuple(index)]
+        return views
+
+    def slice_analogs(
+        self, analogs: npt.NDArray[ScalarT], samples_per_frame: int
+    ) -> dict[str, npt.NDArray[ScalarT]]:
+        """Split ezc3d-layout ``(1, channels, samples)`` analogs into phase views."""
+
+        views: dict[str, npt.NDArray[ScalarT]] = {}
+        for phase in self.phases:
+            start = phase.start_frame * samples_per_frame
+            stop = phase.end_frame * samples_per_frame
+            views[phase.name] = analogs[..., start:stop]
+        return views
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """One row per phase with its frame range and duration."""
+
+        return pd.DataFrame(
+            {
+                "phase": self.phase_names,
+                "start_frame": [phase.start_frame for phase in self.phases],
+                "end_frame": [phase.end_frame for phase in self.phases],
+                "duration": [phase.duration for phase in self.phases],
+            }
+        )
+
+
+def normalize_event_label(label: str) -> str:
+    """Map a capture event label onto :data:`SWING_EVENTS` where possible."""
+
+    key = "_".join(label.strip().lower().replace("-", " ").split())
+    return EVENT_ALIASES.get(key, key)
+
+
+def event_frames_from_times(
+    events: Iterable[tuple[str, float]], frame_rate: float, frame_count: int
+) -> dict[str, int]:
+    """Convert ``(label, time)`` pairs to frame indices of the swing events.
+
+    Labels are normalized with :func:`normalize_event_label`; unrelated events
+    are ignored and the first occurrence of a repeated event wins.
+    """
+
+    frames: dict[str, int] = {}
+    for label, time in events:
+        name = normalize_event_label(label)
+        if name in SWING_EVENTS and name not in frames:
+            frames[name] = int(np.clip(round(time * frame_rate), 0, frame_count - 1))
+    return frames
+
+
+def detect_swing_events(
+    speed: FloatArray,
+    top_fraction: float = DEFAULT_TOP_FRACTION,
+    rest_fraction: float = DEFAULT_REST_FRACTION,
+) -> dict[str, int]:
+    """Detect the swing events from a club speed profile.
+
+    ``impact`` is the peak speed. ``top`` is the speed minimum reached when
+    walking back from impact, ignoring local minima above ``top_fraction`` of
+    the peak. ``address`` is the last frame before the fastest backswing frame,
+    and ``finish`` the first frame after impact, where the speed is below
+    ``rest_fraction`` of the peak; the capture start and end are used when the
+    club never comes to rest.
+
+    Args:
+        speed: ``(frames,)`` club speed, or ``(frames, markers)`` for several
+            club markers, which are averaged. ``NaN`` gaps are interpolated.
+        top_fraction: Highest speed, relative to the peak, accepted at the top.
+        rest_fraction: Speed, relative to the peak, regarded as at rest.
+
+    Raises:
+        ValueError: If the profile contains no valid samples.
+    """
+
+    speed = np.asarray(speed, dtype=np.float64)
+    if speed.ndim == 2:
+        with warnings.catch_warnings():
+            # Frames where every club marker is missing stay NaN.
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            speed = np.nanmean(speed, axis=1)
+    valid = ~np.isnan(speed)
+    if not valid.any():
+        raise ValueError("Cannot detect swing events without valid speed samples.")
+    frames = np.arange(len(speed))
+    if not valid.all():
+        speed = np.interp(frames, frames[valid], speed[valid])
+
+    impact = int(np.argmax(speed))
+    peak = speed[impact]
+    top_threshold = top_fraction * peak
+    top = impact
+    while top > 0 and (speed[top - 1] <= speed[top] or speed[top] > top_threshold):
+        top -= 1
+
+    at_rest = speed <= rest_fraction * peak
+    # The club slows down near the top as well, so search for the address
+    # before the fastest backswing frame.
+    backswing_peak = int(np.argmax(speed[:top])) if top > 0 else 0
+    before = np.flatnonzero(at_rest[:backswing_peak])
+    after = np.flatnonzero(at_rest[impact + 1 :])
+    return {
+        "address": int(before[-1]) if len(before) else 0,
+        "top": top,
+        "impact": impact,
+        "finish": impact + 1 + int(after[0]) if len(after) else len(speed) - 1,
+    }
+
+
+def segment_swing(
+    event_frames: Mapping[str, int], frame_rate: float, source: str = "events"
+) -> SwingSegmentation:
+    """Build the swing phases bounded by the given event frames.
+
+    The ``finish`` frame is included in the follow-through. Phases missing an
+    event, or whose events are out of order, are left out.
+
+    Raises:
+        ValueError: If the frame rate is not positive.
+    """
+
+    if frame_rate <= 0:
+        raise ValueError("A positive frame rate is required for segmentation.")
+    phases = []
+    for name, (start_event, end_event) in SWING_PHASES.items():
+        if start_event not in event_frames or end_event not in event_frames:
+            continue
+        start = event_frames[start_event]
+        end = event_frames[end_event] + (1 if end_event == "finish" else 0)
+        if end <= start:
+            logger.warning("Skipping %s: %s precedes %s", name, end_event, start_event)
+            continue
+        phases.append(SwingPhase(name, start, end, float(frame_rate)))
+    return SwingSegmentation(
+        event_frames=dict(event_frames), phases=phases, source=source
+    )
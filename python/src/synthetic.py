@@ -0,0 +1,466 @@
+"""Deterministic synthetic C3D captures for scale and regression testing.
+
+:func:`write_synthetic_c3d` writes a real, floating-point C3D file described by
+a :class:`SyntheticCapture`: any number of markers, up to millions of frames,
+analog channels with several samples per frame, marker gaps and events. Marker
+and analog samples are closed-form functions of the frame index whose
+coefficients are drawn from a seeded generator, so the same specification
+always produces the same bytes regardless of how the data section is chunked,
+and :func:`synthetic_points` / :func:`synthetic_analogs` return the expected
+values of any frame window without reading the file back.
+
+The writer streams the data section in chunks, so captures far larger than
+memory can be generated. Captures longer than the 16-bit header frame fields
+store their length in ``TRIAL:ACTUAL_START_FIELD`` / ``ACTUAL_END_FIELD``, with
+the header and ``POINT:FRAMES`` saturated at 65535. More than 255 marker labels
+are split over ``POINT:LABELS``, ``LABELS2``, ... .
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import BinaryIO, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .c3d_native import BLOCK_SIZE, C3D_KEY, PROCESSOR_INTEL
+from .logger_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Gears full-body + club layout, so the reader's marker sets apply.
+GEARS_MARKER_LABELS = (
+    "WaistLeft",
+    "WaistRight",
+    "WaistLBack",
+    "WaistRBack",
+    "BackTop",
+    "BackLeft",
+    "BackRight",
+    "HeadTop",
+    "HeadFront",
+    "HeadSide",
+    "LShoulderTop",
+    "LShoulderBack",
+    "LElbowOut",
+    "LUArmHigh",
+    "LWristTop",
+    "RShoulderTop",
+    "RShoulderBack",
+    "RElbowOut",
+    "RUArmHigh",
+    "RWristTop",
+    "LKneeOut",
+    "LToeIn",
+    "LToeOut",
+    "LAnkleOut",
+    "RKneeOut",
+    "RToeIn",
+    "RToeOut",
+    "RAnkleOut",
+    "Marker_2:2:1",
+    "Marker_2:2:2",
+    "Marker_2:2:3",
+    "Marker_3:3:1",
+    "Marker_3:3:2",
+    "Marker_3:3:3",
+)
+
+# Swing events as fractions of the capture duration.
+DEFAULT_EVENTS = (
+    ("Address", 0.1),
+    ("Top", 0.55),
+    ("Impact", 0.7),
+    ("Finish", 0.95),
+)
+
+# Largest value stored in one dimension of a C3D parameter.
+MAX_PARAMETER_DIMENSION = 255
+MAX_HEADER_FRAME = 0xFFFF
+MAX_INT16_PARAMETER = 0x7FFF
+
+# Stored residual words are multiplied by |POINT:SCALE| when read.
+POINT_SCALE = -0.1
+
+# Camera mask in the low byte of each tracked residual word (cameras 1-3); the
+# residual itself goes in the high byte.
+CAMERA_MASK = 0b0000_0111
+
+# Number of marker samples generated per chunk of the data section.
+DEFAULT_CHUNK_SAMPLES = 1 << 20
+
+FloatArray = npt.NDArray[np.float64]
+
+_CHARACTER, _INTEGER, _FLOAT = -1, 2, 4
+
+
+@dataclass(frozen=True)
+class SyntheticCapture:
+    """Specification of a synthetic capture.
+
+    Attributes:
+        marker_count: Number of markers. The first 34 use the Gears labels,
+            further markers are labeled ``Synthetic_<n>``.
+        frame_count: Number of point frames.
+        frame_rate: Point frame rate in Hz.
+        analog_channels: Number of analog channels (at most 255).
+        analog_subframes: Analog samples per point frame.
+        gaps_per_marker: Number of gaps drawn for every marker.
+        max_gap_frames: Longest gap in frames.
+        events: ``(label, fraction of the duration)`` pairs.
+        units: Point units.
+        seed: Seed of the coefficient generator.
+    """
+
+    marker_count: int = len(GEARS_MARKER_LABELS)
+    frame_count: int = 654
+    frame_rate: float = 360.0
+    analog_channels: int = 0
+    analog_subframes: int = 1
+    gaps_per_marker: int = 0
+    max_gap_frames: int = 20
+    events: tuple[tuple[str, float], ...] = DEFAULT_EVENTS
+    units: str = "mm"
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.marker_count < 0 or self.frame_count < 1:
+            raise ValueError("A capture needs at least one frame and no negatives.")
+        if self.frame_rate <= 0:
+            raise ValueError("The frame rate must be positive.")
+        if not 0 <= self.analog_channels <= MAX_PARAMETER_DIMENSION:
+            raise ValueError(
+                f"Between 0 and {MAX_PARAMETER_DIMENSION} analog channels "
+                "are supported."
+            )
+        if self.analog_subframes < 1:
+            raise ValueError("analog_subframes must be a positive integer.")
+        if self.gaps_per_marker < 0 or self.max_gap_frames < 1:
+            raise ValueError("Gap counts and lengths must be positive.")
+
+    @property
+    def marker_labels(self) -> list[str]:
+        """Marker labels in file order."""
+
+        named = list(GEARS_MARKER_LABELS[: self.marker_count])
+        extra = range(len(named), self.marker_count)
+        return named + [f"Synthetic_{index + 1}" for index in extra]
+
+    @property
+    def analog_labels(self) -> list[str]:
+        """Analog channel labels in file order."""
+
+        return [f"Channel_{index + 1}" for index in range(self.analog_channels)]
+
+    @property
+    def analog_rate(self) -> float:
+        """Analog sample rate in Hz."""
+
+        return self.frame_rate * self.analog_subframes
+
+    @property
+    def duration(self) -> float:
+        """Capture duration in seconds."""
+
+        return self.frame_count / self.frame_rate
+
+    @property
+    def event_times(self) -> list[tuple[str, float]]:
+        """``(label, seconds)`` of every event."""
+
+        return [(label, fraction * self.duration) for label, fraction in self.events]
+
+    @cached_property
+    def gaps(self) -> npt.NDArray[np.intp]:
+        """``(gaps, 3)`` rows of ``(marker, start frame, stop frame)``."""
+
+        rng = np.random.default_rng([self.seed, 1])
+        count = self.marker_count * self.gaps_per_marker
+        lengths = rng.integers(1, self.max_gap_frames, count, endpoint=True)
+        lengths = np.minimum(lengths, self.frame_count)
+        starts = rng.integers(0, self.frame_count - lengths, endpoint=True)
+        markers = np.repeat(np.arange(self.marker_count), self.gaps_per_marker)
+        return np.column_stack([markers, starts, starts + lengths]).astype(np.intp)
+
+    @cached_property
+    def coefficients(self) -> dict[str, FloatArray]:
+        """Seeded trajectory and channel coefficients."""
+
+        rng = np.random.default_rng([self.seed, 0])
+        scale = 1000.0 if self.units == "mm" else 1.0
+        markers, channels = self.marker_count, self.analog_channels
+        return {
+            "origin": rng.uniform(-1.0, 1.0, (markers, 3)) * scale,
+            "amplitude": rng.uniform(0.05, 0.5, (markers, 3)) * scale,
+            "frequency": rng.uniform(0.2, 2.0, (markers, 1)),
+            "phase": rng.uniform(0.0, 2 * np.pi, (markers, 3)),
+            "residual": rng.integers(1, 50, markers).astype(np.float64),
+            "channel_amplitude": rng.uniform(1.0, 100.0, channels),
+            "channel_frequency": rng.uniform(1.0, 50.0, channels),
+            "channel_phase": rng.uniform(0.0, 2 * np.pi, channels),
+        }
+
+
+def synthetic_points(
+    capture: SyntheticCapture, start: int = 0, stop: int | None = None
+) -> tuple[FloatArray, FloatArray]:
+    """Expected ``(frames, markers, 3)`` coordinates and residuals of a window.
+
+    Gap samples are ``NaN`` with a residual of ``-1``. Values are rounded to
+    float32, as stored in the file.
+    """
+
+    stop = capture.frame_count if stop is None else min(stop, capture.frame_count)
+    coefficients = capture.coefficients
+    time = np.arange(start, stop, dtype=np.float64) / capture.frame_rate
+    angle = (
+        2
+        * np.pi
+        * coefficients["frequency"].T[..., np.newaxis]
+        * time[:, np.newaxis, np.newaxis]
+        + coefficients["phase"]
+    )
+    coordinates = coefficients["origin"] + coefficients["amplitude"] * np.sin(angle)
+    coordinates = coordinates.astype(np.float32).astype(np.float64)
+    residuals = np.broadcast_to(
+        coefficients["residual"] * abs(np.float32(POINT_SCALE)),
+        (stop - start, capture.marker_count),
+    ).copy()
+
+    gaps = capture.gaps
+    overlapping = gaps[(gaps[:, 1] < stop) & (gaps[:, 2] > start)]
+    for marker, gap_start, gap_stop in overlapping:
+        window = slice(max(gap_start, start) - start, min(gap_stop, stop) - start)
+        coordinates[window, marker] = np.nan
+        residuals[window, marker] = -1.0
+    return coordinates, residuals
+
+
+def synthetic_analogs(
+    capture: SyntheticCapture, start: int = 0, stop: int | None = None
+) -> FloatArray:
+    """Expected ``(frames * subframes, channels)`` analog samples of a window."""
+
+    stop = capture.frame_count if stop is None else min(stop, capture.frame_count)
+    coefficients = capture.coefficients
+    subframes = capture.analog_subframes
+    samples = np.arange(start * subframes, stop * subframes, dtype=np.float64)
+    time = samples[:, np.newaxis] / capture.analog_rate
+    values = coefficients["channel_amplitude"] * np.sin(
+        2 * np.pi * coefficients["channel_frequency"] * time
+        + coefficients["channel_phase"]
+    )
+    return values.astype(np.float32).astype(np.float64)
+
+
+def write_synthetic_c3d(
+    path: Path | str,
+    capture: SyntheticCapture | None = None,
+    chunk_samples: int = DEFAULT_CHUNK_SAMPLES,
+) -> Path:
+    """Write a synthetic capture as a floating-point Intel C3D file.
+
+    Args:
+        path: Output file; parent directories are created.
+        capture: Capture specification. Defaults to a capture shaped like the
+            Tour average export.
+        chunk_samples: Marker samples generated per chunk, bounding memory use.
+
+    Returns:
+        The written path.
+    """
+
+    capture = capture or SyntheticCapture()
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    parameters = _parameter_section(capture)
+    parameter_blocks = len(parameters) // BLOCK_SIZE
+    data_block = 2 + parameter_blocks
+    chunk_frames = max(1, chunk_samples // max(capture.marker_count, 1))
+
+    with output.open("wb") as handle:
+        handle.write(_header(capture, data_block))
+        handle.write(parameters)
+        for start in range(0, capture.frame_count, chunk_frames):
+            _write_frames(handle, capture, start, start + chunk_frames)
+    logger.debug(
+        "Wrote synthetic capture with %s markers and %s frames to %s",
+        capture.marker_count,
+        capture.frame_count,
+        output,
+    )
+    return output
+
+
+def _write_frames(
+    handle: BinaryIO, capture: SyntheticCapture, start: int, stop: int
+) -> None:
+    """Append the point and analog samples of frames ``[start, stop)``."""
+    coordinates, residuals = synthetic_points(capture, start, stop)
+    frames = coordinates.shape[0]
+    points = np.empty((frames, capture.marker_count, 4), dtype="<f4")
+    points[:, :, :3] = np.nan_to_num(coordinates, nan=0.0)
+    words = np.rint(residuals / abs(np.float32(POINT_SCALE))) * 256 + CAMERA_MASK
+    points[:, :, 3] = np.where(residuals < 0, -1.0, words)
+    analogs = synthetic_analogs(capture, start, stop).astype("<f4")
+    analogs = analogs.reshape(
+        frames, capture.analog_subframes * capture.analog_channels
+    )
+    handle.write(
+        np.concatenate([points.reshape(frames, -1), analogs], axis=1).tobytes()
+    )
+
+
+def _header(capture: SyntheticCapture, data_block: int) -> bytes:
+    """The 512-byte header block."""
+    header = bytearray(BLOCK_SIZE)
+    header[0], header[1] = 2, C3D_KEY
+    struct.pack_into(
+        "<HHHHH",
+        header,
+        2,
+        capture.marker_count,
+        capture.analog_channels * capture.analog_subframes,
+        1,
+        min(capture.frame_count, MAX_HEADER_FRAME),
+        0,
+    )
+    struct.pack_into("<f", header, 12, POINT_SCALE)
+    struct.pack_into("<HH", header, 16, data_block, capture.analog_subframes)
+    struct.pack_into("<f", header, 20, capture.frame_rate)
+    return bytes(header)
+
+
+def _parameter_section(capture: SyntheticCapture) -> bytes:
+    """The parameter blocks, padded to a whole number of blocks."""
+    frame_count = capture.frame_count
+    # The data block is only known once the parameter size is; it takes at
+    # most five bytes more than a placeholder, so two passes suffice.
+    data_start = 2
+    for _ in range(2):
+        records = _records(capture, data_start, frame_count)
+        size = 4 + sum(len(record) for record in records)
+        blocks = -(-size // BLOCK_SIZE)
+        data_start = 2 + blocks
+    preamble = bytes([1, C3D_KEY, blocks, PROCESSOR_INTEL])
+    # The last record points nowhere, which terminates the parameter list.
+    last = bytearray(records[-1])
+    offset_position = 2 + last[0]
+    last[offset_position : offset_position + 2] = struct.pack("<h", 0)
+    records[-1] = bytes(last)
+    return (preamble + b"".join(records)).ljust(blocks * BLOCK_SIZE, b"\0")
+
+
+def _records(
+    capture: SyntheticCapture, data_start: int, frame_count: int
+) -> list[bytes]:
+    """Group and parameter records of every group."""
+    channels = capture.analog_channels
+    end_field = [frame_count & 0xFFFF, frame_count >> 16]
+    # POINT:FRAMES is an unsigned 16-bit word stored in a signed parameter.
+    frames = min(frame_count, MAX_HEADER_FRAME)
+    frames_word = frames - 0x10000 if frames > MAX_INT16_PARAMETER else frames
+    labels = capture.marker_labels
+    label_records = [
+        _parameter(
+            1,
+            "LABELS" if index == 0 else f"LABELS{index + 1}",
+            _CHARACTER,
+            labels[offset : offset + MAX_PARAMETER_DIMENSION],
+        )
+        for index, offset in enumerate(
+            range(0, max(len(labels), 1), MAX_PARAMETER_DIMENSION)
+        )
+    ]
+    events = capture.event_times
+    return [
+        _group(1, "POINT"),
+        _parameter(1, "USED", _INTEGER, capture.marker_count),
+        _parameter(1, "SCALE", _FLOAT, POINT_SCALE),
+        _parameter(1, "RATE", _FLOAT, capture.frame_rate),
+        _parameter(1, "DATA_START", _INTEGER, data_start),
+        _parameter(1, "FRAMES", _INTEGER, frames_word),
+        *label_records,
+        _parameter(
+            1,
+            "DESCRIPTIONS",
+            _CHARACTER,
+            [""] * min(len(labels), MAX_PARAMETER_DIMENSION),
+        ),
+        _parameter(1, "UNITS", _CHARACTER, capture.units),
+        _group(2, "ANALOG"),
+        _parameter(2, "USED", _INTEGER, channels),
+        _parameter(2, "LABELS", _CHARACTER, capture.analog_labels),
+        _parameter(2, "DESCRIPTIONS", _CHARACTER, [""] * channels),
+        _parameter(2, "GEN_SCALE", _FLOAT, 1.0),
+        _parameter(2, "SCALE", _FLOAT, np.ones(channels)),
+        _parameter(2, "OFFSET", _INTEGER, np.zeros(channels, dtype=np.int64)),
+        _parameter(2, "UNITS", _CHARACTER, ["V"] * channels),
+        _parameter(2, "RATE", _FLOAT, capture.analog_rate),
+        _parameter(2, "FORMAT", _CHARACTER, "SIGNED"),
+        _parameter(2, "BITS", _INTEGER, 16),
+        _group(3, "TRIAL"),
+        _parameter(3, "ACTUAL_START_FIELD", _INTEGER, [1, 0]),
+        _parameter(3, "ACTUAL_END_FIELD", _INTEGER, end_field),
+        _group(4, "EVENT"),
+        _parameter(4, "USED", _INTEGER, len(events)),
+        _parameter(4, "LABELS", _CHARACTER, [label for label, _ in events]),
+        _parameter(4, "CONTEXTS", _CHARACTER, ["General"] * len(events)),
+        _parameter(
+            4,
+            "TIMES",
+            _FLOAT,
+            np.array([[0.0, time] for _, time in events]).reshape(-1, 2).T,
+        ),
+    ]
+
+
+def _group(group_id: int, name: str) -> bytes:
+    """A group record without description."""
+    return bytes([len(name), 256 - group_id]) + name.encode() + b"\x03\x00\x00"
+
+
+def _parameter(
+    group_id: int,
+    name: str,
+    data_type: int,
+    value: str | Sequence[str] | float | npt.ArrayLike,
+) -> bytes:
+    """A parameter record without description.
+
+    Character values are a single string or a list of strings; numeric values
+    are stored with their NumPy shape in Fortran order.
+    """
+    if data_type == _CHARACTER:
+        if isinstance(value, str):
+            payload = value.encode("latin-1")
+            dimensions: tuple[int, ...] = (len(payload),)
+        else:
+            strings = [str(text) for text in cast(Sequence[str], value)]
+            width = max((len(text) for text in strings), default=0)
+            payload = b"".join(text.ljust(width).encode("latin-1") for text in strings)
+            dimensions = (width, len(strings))
+    else:
+        array = np.asarray(value, dtype="<i2" if data_type == _INTEGER else "<f4")
+        payload = array.tobytes(order="F")
+        dimensions = array.shape if array.ndim else (1,)
+    if any(size > MAX_PARAMETER_DIMENSION for size in dimensions):
+        raise ValueError(f"Parameter {name} exceeds {MAX_PARAMETER_DIMENSION} values.")
+
+    body = (
+        struct.pack("<bB", data_type, len(dimensions))
+        + bytes(dimensions)
+        + payload
+        + b"\0"
+    )
+    return (
+        bytes([len(name), group_id])
+        + name.encode()
+        + struct.pack("<h", 2 + len(body))
+        + body
+    )
@@ -0,0 +1,221 @@
+"""Tests for the asyncio C3D loading API."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.c3d_async import AsyncC3DLoader, AsyncC3DReader
+from src.c3d_reader import C3DDataReader
+
+TOUR_AVERAGE = (
+    Path(__file__).resolve().parents[2]
+    / "matlab"
+    / "Data"
+    / "Gears C3D Files"
+    / "C3DExport Tour average.c3d"
+)
+IRON = TOUR_AVERAGE.with_name("C3DExport tour average iron.c3d")
+
+
+def _count_parses(monkeypatch: pytest.MonkeyPatch, delay: float = 0.0) -> list[int]:
+    """Record the number of concurrent parses each time one starts."""
+
+    original = C3DDataReader._parse
+    active: list[int] = []
+    starts: list[int] = []
+    lock = threading.Lock()
+
+    def counting_parse(self: C3DDataReader) -> Any:
+        with lock:
+            active.append(1)
+            starts.append(len(active))
+        try:
+            time.sleep(delay)
+            return original(self)
+        finally:
+            with lock:
+                active.pop()
+
+    monkeypatch.setattr(C3DDataReader, "_parse", counting_parse)
+    return starts
+
+
+def test_async_reader_matches_sync_reader() -> None:
+    """Awaitable accessors should return the same data as the sync reader."""
+
+    async def main() -> Any:
+        async with AsyncC3DLoader(backend="native") as loader:
+            reader = AsyncC3DReader(TOUR_AVERAGE, loader)
+            return await reader.get_metadata(), await reader.points_array()
+
+    metadata, points = asyncio.run(main())
+    expected = C3DDataReader(TOUR_AVERAGE, backend="native")
+
+    assert metadata == expected.get_metadata()
+    np.testing.assert_array_equal(
+        points.coordinates, expected.points_array().coordinates
+    )
+
+
+def test_concurrent_requests_for_one_file_are_coalesced(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Many readers of the same file should trigger a single parse."""
+
+    starts = _count_parses(monkeypatch, delay=0.05)
+
+    async def main() -> list[Any]:
+        async with AsyncC3DLoader(backend="native") as loader:
+            readers = [AsyncC3DReader(TOUR_AVERAGE, loader) for _ in range(8)]
+            return await asyncio.gather(*(r.points_array() for r in readers))
+
+    results = asyncio.run(main())
+
+    assert len(starts) == 1
+    assert all(r.coordinates.shape == results[0].coordinates.shape for r in results)
+
+
+def test_concurrent_loads_are_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """No more than ``max_concurrent_loads`` files should be parsed at once."""
+
+    starts = _count_parses(monkeypatch, delay=0.05)
+
+    async def main() -> None:
+        async with AsyncC3DLoader(
+            max_workers=4, max_concurrent_loads=1, backend="native"
+        ) as loader:
+            await asyncio.gather(loader.load(TOUR_AVERAGE), loader.load(IRON))
+
+    asyncio.run(main())
+
+    assert starts == [1, 1]
+
+
+def test_accessors_on_a_coalesced_reader_are_serialized(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Shared readers never run two accessors at once."""
+
+    original = C3DDataReader.points_array
+    active: dict[int, int] = {}
+    peaks: list[int] = []
+    lock = threading.Lock()
+
+    def tracked_points_array(self: C3DDataReader, *args: Any, **kwargs: Any) -> Any:
+        with lock:
+            active[id(self)] = active.get(id(self), 0) + 1
+            peaks.append(active[id(self)])
+        try:
+            time.sleep(0.01)
+            return original(self, *args, **kwargs)
+        finally:
+            with lock:
+                active[id(self)] -= 1
+
+    monkeypatch.setattr(C3DDataReader, "points_array", tracked_points_array)
+
+    async def main() -> None:
+        async with AsyncC3DLoader(max_workers=4, backend="native") as loader:
+            readers = [AsyncC3DReader(TOUR_AVERAGE, loader) for _ in range(6)]
+            await asyncio.gather(*(r.points_array() for r in readers))
+
+    asyncio.run(main())
+
+    assert len(peaks) == 6
+    assert max(peaks) == 1
+
+
+def test_retain_none_drops_data_after_each_access(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """With ``retain="none"`` readers re-decode within a slot instead of caching."""
+
+    starts = _count_parses(monkeypatch)
+
+    async def main() -> tuple[C3DDataReader | None, Any]:
+        async with AsyncC3DLoader(
+            max_concurrent_loads=1, backend="native", retain="none"
+        ) as loader:
+            reader = AsyncC3DReader(TOUR_AVERAGE, loader)
+            await reader.points_array()
+            points = await reader.points_array(markers="club")
+            return reader._reader, points
+
+    reader, points = asyncio.run(main())
+
+    assert reader is not None and reader._c3d_data is None
+    assert points.coordinates.shape[1] == 6
+    assert starts == [1, 1]
+
+
+def test_metadata_requests_share_the_load_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Header-only metadata reads also wait for a load slot."""
+
+    original = C3DDataReader.get_metadata
+    active: list[int] = []
+    peaks: list[int] = []
+    lock = threading.Lock()
+
+    def tracked_get_metadata(self: C3DDataReader) -> Any:
+        with lock:
+            active.append(1)
+            peaks.append(len(active))
+        try:
+            time.sleep(0.02)
+            return original(self)
+        finally:
+            with lock:
+                active.pop()
+
+    monkeypatch.setattr(C3DDataReader, "get_metadata", tracked_get_metadata)
+
+    async def main() -> None:
+        async with AsyncC3DLoader(
+            max_workers=4, max_concurrent_loads=1, backend="native"
+        ) as loader:
+            readers = [AsyncC3DReader(TOUR_AVERAGE, loader) for _ in range(4)]
+            await asyncio.gather(*(r.get_metadata() for r in readers))
+
+    asyncio.run(main())
+
+    assert peaks == [1, 1, 1, 1]
+
+
+def test_failed_load_propagates_and_is_not_cached(tmp_path: Path) -> None:
+    """Errors reach every waiter and a later retry parses again."""
+
+    missing = tmp_path / "missing.c3d"
+
+    async def main(
+        loader: AsyncC3DLoader,
+    ) -> tuple[C3DDataReader | BaseException, ...]:
+        return await asyncio.gather(
+            loader.load(missing), loader.load(missing), return_exceptions=True
+        )
+
+    loader = AsyncC3DLoader(backend="native")
+    try:
+        first = asyncio.run(main(loader))
+        second = asyncio.run(main(loader))
+    finally:
+        loader.close()
+
+    assert all(isinstance(error, FileNotFoundError) for error in first + second)
+
+
+def test_loader_rejects_invalid_limits() -> None:
+    """Executor sizes and load limits must be positive."""
+
+    with pytest.raises(ValueError):
+        AsyncC3DLoader(max_workers=0)
+    with pytest.raises(ValueError):
+        AsyncC3DLoader(max_concurrent_loads=0)
@@ -0,0 +1,107 @@
+"""Tests for the parallel multi-file C3D batch reader."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.c3d_batch import C3DBatchReader, read_many
+from src.c3d_reader import C3DDataReader
+
+EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+
+DATA_DIRECTORY = (
+    Path(__file__).resolve().parents[2] / "matlab" / "Data" / "Gears C3D Files"
+)
+CAPTURES = sorted(DATA_DIRECTORY.glob("*.c3d"))
+
+
+def test_batch_reader_matches_sequential_reads() -> None:
+    """Parallel results should equal single-file reads, in input order."""
+
+    progress: list[tuple[int, int]] = []
+    with C3DBatchReader(workers=2) as batch:
+        results = batch.read(
+            CAPTURES, progress=lambda done, total, _: progress.append((done, total))
+        )
+
+        assert [result.path for result in results] == CAPTURES
+        assert progress[-1] == (len(CAPTURES), len(CAPTURES))
+        for result in results:
+            assert result.ok
+            expected = C3DDataReader(result.path, backend="native").points_array()
+            assert result.points is not None
+            assert isinstance(result.points.coordinates, np.memmap)
+            np.testing.assert_array_equal(
+                result.points.coordinates, expected.coordinates
+            )
+            assert result.metadata is not None
+            assert result.metadata.marker_labels == expected.marker_labels
+        spill_directory = batch.spill_directory
+
+    assert not spill_directory.exists()
+
+
+def test_read_many_isolates_per_file_errors(tmp_path: Path) -> None:
+    """A broken capture should be reported without failing the batch."""
+
+    broken = tmp_path / "broken.c3d"
+    broken.write_bytes(b"not a c3d file")
+
+    results = read_many([broken, CAPTURES[0], tmp_path / "missing.c3d"], workers=2)
+
+    assert [result.ok for result in results] == [False, True, False]
+    assert results[0].error is not None and results[0].error.startswith("ValueError")
+    assert results[2].error is not None
+    assert results[2].error.startswith("FileNotFoundError")
+    assert results[1].points is not None
+    assert not isinstance(results[1].points.coordinates, np.memmap)
+
+
+def test_read_many_keeps_caller_spill_directory(tmp_path: Path) -> None:
+    """Spilled arrays stay memory-mapped when the caller owns the directory."""
+
+    results = read_many(CAPTURES[:1], workers=1, spill_directory=tmp_path)
+
+    assert results[0].analogs is not None
+    assert results[0].points is not None
+    assert isinstance(results[0].points.residuals, np.memmap)
+    assert any(tmp_path.iterdir())
+
+
+def test_repeated_reads_do_not_overwrite_mapped_spills(tmp_path: Path) -> None:
+    """Each read spills to its own subdirectory of a shared spill directory."""
+
+    capture = tmp_path / "capture.c3d"
+    capture.write_bytes(CAPTURES[0].read_bytes())
+    with C3DBatchReader(workers=1, spill_directory=tmp_path / "spill") as batch:
+        first = batch.read([capture])[0]
+        assert first.points is not None
+        expected = np.array(first.points.coordinates)
+        capture.write_bytes(CAPTURES[1].read_bytes())
+        second = batch.read([capture])[0]
+
+    assert second.points is not None
+    np.testing.assert_array_equal(first.points.coordinates, expected)
+    assert len(list((tmp_path / "spill").iterdir())) == 2
+
+
+@pytest.mark.skipif(not EZC3D_AVAILABLE, reason="ezc3d not installed")
+def test_batch_reader_supports_ezc3d_backend() -> None:
+    """Workers should honor the configured backend."""
+
+    results = read_many(CAPTURES[:1], workers=1, backend="ezc3d", markers=["WaistLeft"])
+
+    assert results[0].ok
+    assert results[0].points is not None
+    assert results[0].points.marker_labels == ["WaistLeft"]
+
+
+def test_batch_reader_rejects_invalid_worker_count() -> None:
+    """Worker counts below one are rejected."""
+
+    with pytest.raises(ValueError):
+        C3DBatchReader(workers=0)
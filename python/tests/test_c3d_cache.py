@@ -0,0 +1,154 @@
+"""Tests for the persistent C3D capture cache."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import c3d_cache
+from src.c3d_cache import C3DCache
+from src.c3d_native import C3DMemmap
+from src.c3d_reader import C3DDataReader
+from src.synthetic import SyntheticCapture, write_synthetic_c3d
+
+EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+
+TOUR_AVERAGE = (
+    Path(__file__).resolve().parents[2]
+    / "matlab"
+    / "Data"
+    / "Gears C3D Files"
+    / "C3DExport Tour average.c3d"
+)
+
+
+@pytest.fixture
+def capture_copy(tmp_path: Path) -> Path:
+    """Copy the tour-average capture so tests can modify it."""
+
+    destination = tmp_path / "capture.c3d"
+    shutil.copyfile(TOUR_AVERAGE, destination)
+    return destination
+
+
+def test_cache_round_trip_returns_memory_mapped_arrays(
+    tmp_path: Path, capture_copy: Path
+) -> None:
+    """Stored captures should come back as read-only memory maps."""
+
+    cache = C3DCache(tmp_path / "cache")
+    reader = C3DDataReader(capture_copy, backend="native")
+    cache.put(capture_copy, reader._load())
+
+    cached = cache.get(capture_copy)
+
+    assert cached is not None
+    assert isinstance(cached["data"]["points"], np.memmap)
+    np.testing.assert_array_equal(
+        cached["data"]["points"], reader._load()["data"]["points"]
+    )
+    np.testing.assert_array_equal(
+        cached["data"]["meta_points"]["residuals"][0].T,
+        C3DMemmap(capture_copy).residuals(),
+    )
+    assert cached["parameters"]["POINT"]["LABELS"]["value"][1] == "WaistLeft"
+
+
+def test_put_decodes_memory_mapped_captures_in_windows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Undecoded native blocks are written window by window, never in full."""
+
+    capture = SyntheticCapture(
+        frame_count=250, analog_channels=2, analog_subframes=4, gaps_per_marker=1
+    )
+    path = write_synthetic_c3d(tmp_path / "capture.c3d", capture)
+    monkeypatch.setattr(c3d_cache, "_WRITE_CHUNK_FRAMES", 100)
+    cache = C3DCache(tmp_path / "cache")
+    data = C3DDataReader(path, backend="native")._load()
+
+    cache.put(path, data)
+    cached = cache.get(path)
+
+    assert cached is not None
+    assert not any(data["data"].is_decoded(key) for key in data["data"])
+    memmap = C3DMemmap(path)
+    np.testing.assert_array_equal(cached["data"]["points"], memmap.points())
+    np.testing.assert_array_equal(cached["data"]["analogs"], memmap.analogs())
+    np.testing.assert_array_equal(
+        cached["data"]["meta_points"]["residuals"][0].T, memmap.residuals()
+    )
+
+
+@pytest.mark.skipif(not EZC3D_AVAILABLE, reason="ezc3d requires Python >=3.10")
+def test_reader_uses_cache_on_second_open(
+    tmp_path: Path, capture_copy: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A second reader of the same file should not parse it again."""
+
+    cache = C3DCache(tmp_path / "cache")
+    expected = C3DDataReader(capture_copy, cache=cache).points_dataframe()
+
+    def _fail_parse(self: C3DDataReader) -> None:
+        pytest.fail("capture was parsed despite a cache entry")
+
+    monkeypatch.setattr(C3DDataReader, "_parse", _fail_parse)
+    cached_reader = C3DDataReader(capture_copy, cache=cache)
+
+    pd.testing.assert_frame_equal(cached_reader.points_dataframe(), expected)
+    assert cached_reader.get_metadata().frame_count == 654
+
+
+def test_modified_file_misses_cache(tmp_path: Path, capture_copy: Path) -> None:
+    """Changing the file contents or mtime should invalidate the entry."""
+
+    cache = C3DCache(tmp_path / "cache")
+    cache.put(capture_copy, C3DDataReader(capture_copy, backend="native")._load())
+    assert cache.get(capture_copy) is not None
+
+    with capture_copy.open("r+b") as handle:
+        handle.seek(-4, os.SEEK_END)
+        handle.write(b"\x00\x00\x80\x3f")
+    stat = capture_copy.stat()
+    os.utime(capture_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert cache.get(capture_copy) is None
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+    """Entries beyond ``max_bytes`` should be evicted oldest-access first."""
+
+    captures = []
+    for index in range(3):
+        path = tmp_path / f"capture_{index}.c3d"
+        shutil.copyfile(TOUR_AVERAGE, path)
+        captures.append(path)
+
+    cache = C3DCache(tmp_path / "cache", max_bytes=10**9)
+    entries = [
+        cache.put(path, C3DDataReader(path, backend="native")._load())
+        for path in captures
+    ]
+    for age, entry in enumerate(entries):
+        os.utime(entry, ns=(age, age))
+    assert cache.get(captures[0]) is not None
+
+    cache.max_bytes = cache.size_bytes * 2 // 3
+    cache.evict()
+
+    assert cache.get(captures[0]) is not None
+    assert cache.get(captures[1]) is None
+    assert cache.get(captures[2]) is not None
+
+
+def test_cache_rejects_non_positive_size(tmp_path: Path) -> None:
+    """A zero byte budget is a configuration error."""
+
+    with pytest.raises(ValueError):
+        C3DCache(tmp_path, max_bytes=0)
@@ -0,0 +1,196 @@
+"""Tests for the native C3D header and parameter parser."""
+
+from __future__ import annotations
+
+import importlib.util
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.c3d_native import PROCESSOR_INTEL, C3DMemmap, read_c3d_parameters
+
+EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+
+DATA_DIRECTORY = (
+    Path(__file__).resolve().parents[2] / "matlab" / "Data" / ("Gears C3D Files")
+)
+TOUR_AVERAGE = DATA_DIRECTORY / "C3DExport Tour average.c3d"
+
+
+def _parameter_record(group_id: int, name: str, data_type: int, value: Any) -> bytes:
+    """Encode one parameter record with an Intel byte order."""
+
+    if data_type == -1:
+        strings = [value] if isinstance(value, str) else list(value)
+        width = max(len(text) for text in strings)
+        payload = b"".join(text.ljust(width).encode() for text in strings)
+        dimensions = [width] if isinstance(value, str) else [width, len(strings)]
+    else:
+        array = np.atleast_1d(np.asarray(value))
+        code = "<i2" if data_type == 2 else "<f4"
+        payload = array.astype(code).tobytes()
+        dimensions = [array.size]
+
+    body = bytes([data_type & 0xFF, len(dimensions), *dimensions]) + payload + b"\0"
+    return (
+        bytes([len(name), group_id])
+        + name.encode()
+        + struct.pack("<h", 2 + len(body))
+        + body
+    )
+
+
+def _write_integer_c3d(
+    path: Path, raw_points: np.ndarray[Any, Any], scale: float, rate: float
+) -> None:
+    """Write a minimal integer-format C3D file from ``(frames, markers, 4)`` words."""
+
+    frame_count, marker_count, _ = raw_points.shape
+    labels = [f"M{index}" for index in range(marker_count)]
+    records = [
+        bytes([5, 0xFF]) + b"POINT" + struct.pack("<h", 3) + b"\0",
+        _parameter_record(1, "USED", 2, marker_count),
+        _parameter_record(1, "SCALE", 4, scale),
+        _parameter_record(1, "RATE", 4, rate),
+        _parameter_record(1, "FRAMES", 2, frame_count),
+        _parameter_record(1, "DATA_START", 2, 3),
+        _parameter_record(1, "LABELS", -1, labels),
+        _parameter_record(1, "UNITS", -1, "mm"),
+        bytes([6, 0xFE]) + b"ANALOG" + struct.pack("<h", 3) + b"\0",
+        _parameter_record(2, "USED", 2, 0),
+        _parameter_record(2, "RATE", 4, rate),
+    ]
+    parameters = bytes([1, 0x50, 1, PROCESSOR_INTEL]) + b"".join(records)
+
+    header = bytearray(512)
+    header[0], header[1] = 2, 0x50
+    struct.pack_into("<HHHHH", header, 2, marker_count, 0, 1, frame_count, 0)
+    struct.pack_into("<f", header, 12, scale)
+    struct.pack_into("<HH", header, 16, 3, 1)
+    struct.pack_into("<f", header, 20, rate)
+
+    path.write_bytes(
+        bytes(header)
+        + parameters.ljust(512, b"\0")
+        + raw_points.astype("<i2").tobytes()
+    )
+
+
+def test_header_describes_tour_average_capture() -> None:
+    """The header block should expose the layout of the data section."""
+
+    header, _ = read_c3d_parameters(TOUR_AVERAGE)
+
+    assert header.processor == PROCESSOR_INTEL
+    assert header.point_count == 38
+    assert header.first_frame == 1
+    assert header.last_frame == 654
+    assert header.frame_rate == pytest.approx(360.0)
+    assert header.is_float
+    assert header.analog_channel_count == 0
+
+
+def test_parameters_expose_point_group() -> None:
+    """Parameter values should follow ezc3d's ``tree[group][name]`` layout."""
+
+    _, parameters = read_c3d_parameters(TOUR_AVERAGE)
+    point = parameters["POINT"]
+
+    assert point["LABELS"]["value"][1] == "WaistLeft"
+    assert point["UNITS"]["value"] == ["m"]
+    assert int(point["FRAMES"]["value"][0]) == 654
+    assert float(point["RATE"]["value"][0]) == pytest.approx(360.0)
+
+
+@pytest.mark.skipif(not EZC3D_AVAILABLE, reason="ezc3d requires Python >=3.10")
+@pytest.mark.parametrize(
+    "file_name", sorted(p.name for p in DATA_DIRECTORY.glob("*.c3d"))
+)
+def test_parameters_match_ezc3d(file_name: str) -> None:
+    """Every parameter ezc3d reads from disk should decode identically."""
+
+    import ezc3d
+
+    _, parameters = read_c3d_parameters(DATA_DIRECTORY / file_name)
+    expected = ezc3d.c3d(str(DATA_DIRECTORY / file_name))["parameters"]
+
+    for group_name in parameters:
+        for name, entry in parameters[group_name].items():
+            expected_value = expected[group_name][name]["value"]
+            if isinstance(expected_value, list):
+                assert entry["value"] == expected_value
+            else:
+                np.testing.assert_allclose(entry["value"], expected_value)
+                assert np.shape(entry["value"]) == np.shape(expected_value)
+
+
+def test_read_parameters_rejects_non_c3d_file(tmp_path: Path) -> None:
+    """Files without the C3D key byte should raise ValueError."""
+
+    path = tmp_path / "not_a_capture.c3d"
+    path.write_bytes(b"\x00" * 1024)
+
+    with pytest.raises(ValueError):
+        read_c3d_parameters(path)
+
+
+def test_read_parameters_missing_file_raises(tmp_path: Path) -> None:
+    """Missing files should raise FileNotFoundError."""
+
+    with pytest.raises(FileNotFoundError):
+        read_c3d_parameters(tmp_path / "missing.c3d")
+
+
+def test_memmap_exposes_zero_copy_point_view() -> None:
+    """Raw point samples should be a strided view into the mapped file."""
+
+    memmap = C3DMemmap(TOUR_AVERAGE)
+
+    assert memmap.raw_points.shape == (654, 38, 4)
+    assert isinstance(memmap.raw_points.base, np.memmap) or isinstance(
+        memmap.raw_points, np.memmap
+    )
+    assert not memmap.raw_points.flags.writeable
+
+
+@pytest.mark.skipif(not EZC3D_AVAILABLE, reason="ezc3d requires Python >=3.10")
+@pytest.mark.parametrize(
+    "file_name", sorted(p.name for p in DATA_DIRECTORY.glob("*.c3d"))
+)
+def test_memmap_points_match_ezc3d(file_name: str) -> None:
+    """Decoded points and analogs should be identical to ezc3d's arrays."""
+
+    import ezc3d
+
+    memmap = C3DMemmap(DATA_DIRECTORY / file_name)
+    expected = ezc3d.c3d(str(DATA_DIRECTORY / file_name))["data"]
+
+    np.testing.assert_array_equal(memmap.points(), expected["points"])
+    np.testing.assert_array_equal(memmap.analogs(), expected["analogs"])
+    np.testing.assert_array_equal(
+        memmap.points(100, 120), expected["points"][:, :, 100:120]
+    )
+
+
+def test_memmap_scales_integer_points_and_masks_invalid(tmp_path: Path) -> None:
+    """Integer data should be scaled lazily and negative residuals masked."""
+
+    raw = np.zeros((3, 2, 4), dtype=np.int16)
+    raw[:, :, :3] = np.arange(18, dtype=np.int16).reshape(3, 2, 3)
+    raw[:, :, 3] = 5 << 8 | 0b11  # residual 5 in the high byte, camera mask low
+    raw[1, 1, 3] = -1
+    path = tmp_path / "integer.c3d"
+    _write_integer_c3d(path, raw, scale=0.5, rate=100.0)
+
+    memmap = C3DMemmap(path)
+    points = memmap.points()
+
+    assert memmap.raw_points.dtype == np.dtype("<i2")
+    np.testing.assert_allclose(points[:3, 0, :], raw[:, 0, :3].T * 0.5)
+    assert np.isnan(points[:3, 1, 1]).all()
+    np.testing.assert_allclose(points[3], 1.0)
+    np.testing.assert_allclose(memmap.residuals()[0], [2.5, 2.5])
+    assert memmap.residuals()[1, 1] == -1.0
@@ -3,25 +3,33 @@
 from __future__ import annotations
 
 import importlib.util
+import re
 import warnings
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
+import pandas as pd
 import pytest
 
+from src.c3d_native import C3DMemmap
 from src.c3d_reader import C3DDataReader, load_tour_average_reader
 from src.c3d_reader import C3DEvent
+from src.synthetic import SyntheticCapture, synthetic_points, write_synthetic_c3d
 
 # Skip tests if ezc3d is not available (e.g., Python 3.9)
 EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+ZSTANDARD_AVAILABLE = importlib.util.find_spec("zstandard") is not None
 
 pytestmark = pytest.mark.skipif(
     not EZC3D_AVAILABLE,
     reason="ezc3d requires Python >=3.10",
 )
 
+BACKENDS = ["native", "ezc3d"]
+
 EXPECTED_MARKER_COUNT = 38
 EXPECTED_FRAME_COUNT = 654
 EXPECTED_FRAME_RATE_HZ = 360.0
@@ -35,6 +43,17 @@ def _tour_average_reader() -> C3DDataReader:
     return load_tour_average_reader(repository_root)
 
 
+def _loaded_data(reader: C3DDataReader) -> dict[str, Any]:
+    """The reader's ezc3d-style data mapping, which must already be loaded."""
+    assert reader._c3d_data is not None
+    return reader._c3d_data
+
+
+def _is_loaded(reader: C3DDataReader) -> bool:
+    """Whether the reader currently holds decoded capture data."""
+    return reader._c3d_data is not None
+
+
 def _stub_reader_with_points(
     *,
     frame_count: int = 2,
@@ -47,12 +66,17 @@ def _stub_reader_with_points(
     """Create a stubbed reader with synthetic point data for isolated testing."""
 
     points = np.zeros((4, len(marker_labels), frame_count))
+    residuals = np.zeros((1, len(marker_labels), frame_count))
     analogs = (
         analog_array if analog_array is not None else np.zeros((1, 0, frame_count))
     )
     reader = C3DDataReader(Path("synthetic"))
     reader._c3d_data = {
-        "data": {"points": points, "analogs": analogs},
+        "data": {
+            "points": points,
+            "meta_points": {"residuals": residuals},
+            "analogs": analogs,
+        },
         "parameters": {
             "POINT": {
                 "LABELS": {"value": list(marker_labels)},
@@ -130,12 +154,79 @@ def test_marker_subset_and_unit_conversion() -> None:
     assert finite_mm == pytest.approx(finite_m * 1000.0)
 
 
-def test_residual_filtering_sets_noisy_points_to_nan() -> None:
+def test_residual_filtering_sets_noisy_points_to_nan(tmp_path: Path) -> None:
     """Test that residual filtering correctly sets noisy points to NaN."""
+    capture = SyntheticCapture(frame_count=50, gaps_per_marker=0)
+    reader = C3DDataReader(write_synthetic_c3d(tmp_path / "capture.c3d", capture))
+    residuals = reader.points_dataframe()["residual"]
+    threshold = float(residuals.median())
+    dataframe = reader.points_dataframe(residual_nan_threshold=threshold)
+
+    noisy = residuals > threshold
+    assert noisy.any() and not noisy.all()
+    assert dataframe.loc[noisy, ["x", "y", "z"]].isna().all().all()
+    assert dataframe.loc[~noisy, ["x", "y", "z"]].notna().all().all()
+
+
+def test_residual_filtering_keeps_tracked_samples_of_the_export() -> None:
+    """The tour-average export stores a residual of 0 for every tracked sample."""
     reader = _tour_average_reader()
-    dataframe = reader.points_dataframe(residual_nan_threshold=0.5)
+    unfiltered = reader.points_dataframe()
+    lenient = reader.points_dataframe(residual_nan_threshold=0.5)
+    strict = reader.points_dataframe(residual_nan_threshold=-0.5)
+
+    pd.testing.assert_frame_equal(lenient, unfiltered)
+    assert strict[["x", "y", "z"]].isna().all().all()
+
+
+def test_points_array_residuals_come_from_residual_words(tmp_path: Path) -> None:
+    """Residuals are the stored per-sample values, not the homogeneous row."""
+    capture = SyntheticCapture(frame_count=50, gaps_per_marker=1)
+    path = write_synthetic_c3d(tmp_path / "capture.c3d", capture)
+    reader = C3DDataReader(path, backend="native")
+
+    point_array = reader.points_array()
+    gaps = np.isnan(point_array.coordinates).any(axis=2)
+    present = point_array.residuals[~gaps]
+
+    assert not np.all(present == 1.0)
+    np.testing.assert_allclose(point_array.residuals, C3DMemmap(path).residuals())
+    assert (point_array.residuals[gaps] == -1.0).all()
+    threshold = float(np.median(present))
+    filtered = reader.points_array(residual_nan_threshold=threshold)
+    blanked = np.isnan(filtered.coordinates).any(axis=2)
+    np.testing.assert_array_equal(blanked, gaps | (point_array.residuals > threshold))
+
+
+def test_points_array_residuals_agree_across_backends() -> None:
+    """Both backends report the export's residuals: 0 when tracked, -1 in gaps."""
+    repository_root = Path(__file__).resolve().parents[2]
+    native, parsed = (
+        load_tour_average_reader(repository_root, backend=backend).points_array()
+        for backend in BACKENDS
+    )
+
+    gaps = np.isnan(native.coordinates).any(axis=2)
+    np.testing.assert_array_equal(native.residuals, parsed.residuals)
+    assert gaps.any() and not np.all(native.residuals[~gaps] == 1.0)
+    np.testing.assert_array_equal(native.residuals, np.where(gaps, -1.0, 0.0))
 
-    assert dataframe[["x", "y", "z"]].isna().all().all()
+
+def test_synthetic_residuals_agree_across_backends(tmp_path: Path) -> None:
+    """Non-zero residuals decode, and so filter, the same on both backends."""
+    capture = SyntheticCapture(frame_count=50, gaps_per_marker=1)
+    path = write_synthetic_c3d(tmp_path / "capture.c3d", capture)
+    _, expected = synthetic_points(capture)
+    readers = [C3DDataReader(path, backend=backend) for backend in BACKENDS]
+
+    for reader in readers:
+        np.testing.assert_allclose(reader.points_array().residuals, expected)
+    threshold = float(np.median(expected[expected > 0]))
+    native, parsed = (
+        reader.points_dataframe(residual_nan_threshold=threshold) for reader in readers
+    )
+    pd.testing.assert_frame_equal(native, parsed)
+    assert native["x"].isna().any() and native["x"].notna().any()
 
 
 def test_points_dataframe_missing_file_raises_file_not_found(tmp_path: Path) -> None:
@@ -254,6 +345,333 @@ def test_analog_export_writes_empty_structure(tmp_path: Path) -> None:
     assert contents[0].split(",") == ["sample", "time", "channel", "value"]
 
 
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+@pytest.mark.parametrize("suffix", ["parquet", "feather", "arrow"])
+def test_export_points_columnar_round_trip(tmp_path: Path, suffix: str) -> None:
+    """Parquet and Arrow IPC exports should round-trip with encoded marker labels."""
+
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    reader = _tour_average_reader()
+    path = reader.export_points(tmp_path / f"points.{suffix}")
+
+    table = pq.read_table(path) if suffix == "parquet" else feather.read_table(path)
+    assert str(table.schema.field("marker").type).startswith("dictionary")
+    pd.testing.assert_frame_equal(
+        table.to_pandas().astype({"marker": object}),
+        reader.points_dataframe().astype({"marker": object}),
+    )
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow not installed")
+def test_export_points_parquet_options(tmp_path: Path) -> None:
+    """float32, compression and row groups should be honored by Parquet export."""
+
+    import pyarrow.parquet as pq
+
+    reader = _tour_average_reader()
+    path = reader.export_points(
+        tmp_path / "points.parquet",
+        compression="zstd",
+        float32=True,
+        row_group_size=5000,
+    )
+
+    parquet_file = pq.ParquetFile(path)
+    schema = parquet_file.schema_arrow
+    assert str(schema.field("x").type) == "float"
+    assert str(schema.field("time").type) == "double"
+    assert parquet_file.num_row_groups == -(-parquet_file.metadata.num_rows // 5000)
+    assert parquet_file.metadata.row_group(0).column(2).compression == "ZSTD"
+
+
+def test_export_points_rejects_compression_for_text_formats(tmp_path: Path) -> None:
+    """Compression codecs only apply to the columnar formats."""
+
+    reader = _stub_reader_with_points()
+
+    with pytest.raises(ValueError):
+        reader.export_points(tmp_path / "points.csv", compression="zstd")
+
+
+def test_points_dataframe_compact_mode_matches_default() -> None:
+    """Compact tables should hold the same values with smaller dtypes."""
+
+    reader = _tour_average_reader()
+    default = reader.points_dataframe()
+    compact = reader.points_dataframe(compact=True, float32=True)
+
+    assert isinstance(compact["marker"].dtype, pd.CategoricalDtype)
+    assert compact["frame"].dtype == np.int32
+    assert compact[["x", "y", "z", "residual"]].dtypes.eq(np.float32).all()
+    assert compact["time"].dtype == np.float64
+    assert compact.memory_usage(deep=True).sum() * 2 < (
+        default.memory_usage(deep=True).sum()
+    )
+    np.testing.assert_array_equal(compact["marker"].astype(object), default["marker"])
+    np.testing.assert_allclose(compact["x"], default["x"], rtol=1e-6)
+    np.testing.assert_array_equal(compact["time"], default["time"])
+
+
+def test_analog_dataframe_compact_mode_handles_duplicate_labels() -> None:
+    """Repeated channel labels should map onto a single category."""
+
+    reader = _stub_reader_with_points(
+        frame_count=2,
+        marker_labels=("M1",),
+        analog_array=np.array([[[1.0, 2.0], [3.0, 4.0]]]),
+        analog_parameters={"LABELS": {"value": ["Fz", "Fz"]}},
+    )
+
+    analog_df = reader.analog_dataframe(compact=True, float32=True)
+
+    assert list(analog_df["channel"].cat.categories) == ["Fz"]
+    assert analog_df["sample"].dtype == np.int32
+    assert analog_df["value"].dtype == np.float32
+    assert analog_df["value"].tolist() == [1.0, 3.0, 2.0, 4.0]
+
+
+def test_export_points_csv_sanitizes_categorical_labels(tmp_path: Path) -> None:
+    """The CSV sanitizer should escape formula-like categorical labels."""
+
+    reader = _stub_reader_with_points(marker_labels=("=cmd", "Safe"))
+    dataframe = reader.points_dataframe(compact=True)
+
+    path = reader._export_dataframe(dataframe, tmp_path / "points.csv", None)
+
+    exported = pd.read_csv(path)
+    assert set(exported["marker"]) == {"'=cmd", "Safe"}
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "points.csv",
+        "points.csv.gz",
+        pytest.param(
+            "points.csv.zst",
+            marks=pytest.mark.skipif(
+                not ZSTANDARD_AVAILABLE, reason="zstandard not installed"
+            ),
+        ),
+    ],
+)
+def test_stream_points_matches_export_points(tmp_path: Path, file_name: str) -> None:
+    """Streaming CSV output should be byte-identical to the in-memory export."""
+
+    reader = _tour_average_reader()
+    expected = reader.export_points(tmp_path / "expected.csv").read_text()
+
+    path = reader.stream_points(tmp_path / file_name, chunk_frames=100)
+
+    dataframe = pd.read_csv(path)
+    assert dataframe.equals(pd.read_csv(tmp_path / "expected.csv"))
+    if path.suffix == ".csv":
+        assert path.read_text() == expected
+
+
+def test_stream_points_ndjson_matches_records(tmp_path: Path) -> None:
+    """NDJSON output should hold one record per tidy row with the same columns."""
+
+    reader = _stub_reader_with_points(frame_count=5, marker_labels=("B", "=A"))
+
+    path = reader.stream_points(tmp_path / "points.ndjson", chunk_frames=2)
+
+    streamed = pd.read_json(path, lines=True)
+    expected = reader.points_dataframe()
+    assert list(streamed.columns) == list(expected.columns)
+    assert streamed["marker"].tolist() == expected["marker"].tolist()
+    np.testing.assert_allclose(streamed["time"], expected["time"])
+
+
+def test_stream_analog_writes_header_without_channels(tmp_path: Path) -> None:
+    """Captures without analog data should still stream a CSV header."""
+
+    reader = _stub_reader_with_points()
+
+    path = reader.stream_analog(tmp_path / "analog.csv")
+
+    assert path.read_text() == reader.export_analog(tmp_path / "a.csv").read_text()
+
+
+def test_stream_points_rejects_unknown_format(tmp_path: Path) -> None:
+    """Only line-oriented formats can be streamed."""
+
+    reader = _stub_reader_with_points()
+
+    with pytest.raises(ValueError):
+        reader.stream_points(tmp_path / "points.npz")
+    with pytest.raises(ValueError):
+        reader.stream_points(tmp_path / "points.csv", compression="bz2")
+
+
+def test_reader_context_manager_releases_native_memmap() -> None:
+    """Leaving the ``with`` block should drop data and unmap the file."""
+
+    repository_root = Path(__file__).resolve().parents[2]
+    with load_tour_average_reader(repository_root, backend="native") as reader:
+        expected = np.array(reader.points_array().coordinates)
+        native = reader._native
+        assert native is not None
+
+    assert reader._c3d_data is None
+    assert reader._native is None
+    assert native.raw_points.size == 0
+    assert reader.get_metadata().frame_count == EXPECTED_FRAME_COUNT
+    np.testing.assert_array_equal(reader.points_array().coordinates, expected)
+
+
+def test_retain_arrays_drops_parser_object() -> None:
+    """``retain="arrays"`` should keep only plain NumPy data and metadata groups."""
+
+    repository_root = Path(__file__).resolve().parents[2]
+    full = load_tour_average_reader(repository_root)
+    slim = C3DDataReader(full.file_path, retain="arrays")
+
+    np.testing.assert_array_equal(
+        slim.points_array().coordinates, full.points_array().coordinates
+    )
+    assert type(slim._c3d_data).__module__ == "src.c3d_reader"
+    assert set(_loaded_data(slim)["parameters"]) <= {"POINT", "ANALOG", "EVENT"}
+    assert set(_loaded_data(slim)["data"]) == {"points", "meta_points", "analogs"}
+    np.testing.assert_array_equal(
+        slim.points_array().residuals, full.points_array().residuals
+    )
+    assert slim.get_metadata() == full.get_metadata()
+
+
+def test_retain_none_releases_after_each_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    """``retain="none"`` should drop data after calls but hold it while iterating."""
+
+    parses: list[Path] = []
+    original_parse = C3DDataReader._parse
+
+    def counting_parse(self: C3DDataReader) -> Any:
+        parses.append(self.file_path)
+        return original_parse(self)
+
+    monkeypatch.setattr(C3DDataReader, "_parse", counting_parse)
+    repository_root = Path(__file__).resolve().parents[2]
+    path = load_tour_average_reader(repository_root).file_path
+    reader = C3DDataReader(path, backend="native", retain="none")
+
+    reader.points_array()
+    assert reader._c3d_data is None
+    chunks = list(reader.iter_points_chunks(chunk_frames=100))
+
+    assert len(chunks) == 7
+    assert len(parses) == 2
+    assert reader._c3d_data is None
+
+
+def test_analog_array_matches_tidy_analog_values(tmp_path: Path) -> None:
+    """The array accessor holds the samples of the tidy table, subframes inline."""
+
+    capture = SyntheticCapture(frame_count=20, analog_channels=2, analog_subframes=3)
+    reader = C3DDataReader(write_synthetic_c3d(tmp_path / "capture.c3d", capture))
+
+    analogs = reader.analog_array()
+    window = reader.analog_array(start_frame=5, end_frame=10)
+    dataframe = reader.analog_dataframe()
+
+    assert analogs.shape == (1, 2, 60)
+    np.testing.assert_array_equal(window, analogs[:, :, 15:30])
+    np.testing.assert_allclose(
+        analogs[0].T, dataframe["value"].to_numpy().reshape(-1, 2)
+    )
+
+
+def test_retain_none_releases_after_analog_accessors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Phase and aligned analog accessors also drop data with ``retain="none"``."""
+
+    parses: list[Path] = []
+    original_parse = C3DDataReader._parse
+
+    def counting_parse(self: C3DDataReader) -> Any:
+        parses.append(self.file_path)
+        return original_parse(self)
+
+    monkeypatch.setattr(C3DDataReader, "_parse", counting_parse)
+    capture = SyntheticCapture(frame_count=120, analog_channels=2, analog_subframes=4)
+    path = write_synthetic_c3d(tmp_path / "capture.c3d", capture)
+    reader = C3DDataReader(path, backend="native", retain="none")
+
+    phases = reader.phase_analogs()
+    assert reader._c3d_data is None and reader._native is None
+    assert sum(view.shape[2] for view in phases.values()) > 0
+    assert len(parses) == 1
+
+    aligned = reader.aligned_streams()
+    assert reader._c3d_data is None and reader._native is None
+    assert aligned.analogs.shape[1] == 2
+    assert len(parses) == 2
+
+
+def test_reader_rejects_unknown_retain_mode() -> None:
+    """Unsupported retain modes should be rejected at construction."""
+
+    with pytest.raises(ValueError):
+        C3DDataReader(Path("synthetic"), retain="some")
+
+
+def test_select_markers_supports_globs_regex_and_sets() -> None:
+    """Marker selection should resolve globs, regexes and named sets in file order."""
+
+    reader = _tour_average_reader()
+
+    assert reader.select_markers("club") == [
+        "Marker_2:2:1",
+        "Marker_2:2:2",
+        "Marker_2:2:3",
+        "Marker_3:3:1",
+        "Marker_3:3:2",
+        "Marker_3:3:3",
+    ]
+    assert reader.select_markers("Waist*") == [
+        "WaistLeft",
+        "WaistRight",
+        "WaistLBack",
+        "WaistRBack",
+    ]
+    assert reader.select_markers(re.compile(r"Toe(In|Out)$"))[:2] == [
+        "LToeIn",
+        "LToeOut",
+    ]
+    # Exact labels win over glob interpretation of "*".
+    assert reader.select_markers(["Uname*37", "HeadTop", "Missing"]) == [
+        "HeadTop",
+        "Uname*37",
+    ]
+
+
+def test_points_array_accepts_marker_patterns_and_caches_indices() -> None:
+    """Pattern selections should match explicit lists and be resolved once."""
+
+    reader = _tour_average_reader()
+    explicit = reader.points_array(markers=reader.select_markers("L*"))
+    patterned = reader.points_array(markers="L*")
+
+    assert patterned.marker_labels == explicit.marker_labels
+    np.testing.assert_array_equal(patterned.coordinates, explicit.coordinates)
+    assert reader._marker_indices("L*") is reader._marker_indices("L*")
+
+
+def test_custom_marker_sets_extend_defaults() -> None:
+    """Reader-specific marker sets may reference other sets and globs."""
+
+    reader = _stub_reader_with_points(marker_labels=("LHand", "RHand", "Head"))
+    reader.marker_sets["hands"] = ("?Hand",)
+    reader.marker_sets["upper"] = ("hands", "Head")
+
+    dataframe = reader.points_dataframe(markers="upper")
+
+    assert sorted(dataframe["marker"].unique()) == ["Head", "LHand", "RHand"]
+    assert reader.select_markers("hands") == ["LHand", "RHand"]
+
+
 def test_export_points_requires_inferable_format(tmp_path: Path) -> None:
     """Exporting without a known extension should raise a ValueError."""
 
@@ -274,7 +692,7 @@ def test_get_events_parses_event_times() -> None:
     """Event parsing should produce trimmed labels with finite times only."""
 
     reader = _stub_reader_with_points()
-    reader._c3d_data["parameters"]["EVENT"] = {
+    _loaded_data(reader)["parameters"]["EVENT"] = {
         "LABELS": {"value": [" Foot Strike", "Follow Through "]},
         "TIMES": {"value": [[0.0, 1.2], [0.5, 1.7]]},
     }
@@ -296,7 +714,7 @@ def test_analog_dataframe_fills_default_labels_without_rate() -> None:
         ]
     )
     reader = _stub_reader_with_points(frame_count=3, marker_labels=("M1",))
-    reader._c3d_data["data"]["analogs"] = analog_array
+    _loaded_data(reader)["data"]["analogs"] = analog_array
 
     analog_df = reader.analog_dataframe()
 
@@ -336,7 +754,7 @@ def test_get_events_handles_missing_times() -> None:
     """Event labels without time data should return an empty list."""
 
     reader = _stub_reader_with_points()
-    reader._c3d_data["parameters"]["EVENT"] = {"LABELS": {"value": ["A", "B"]}}
+    _loaded_data(reader)["parameters"]["EVENT"] = {"LABELS": {"value": ["A", "B"]}}
 
     assert reader._get_events() == []
 
@@ -377,3 +795,240 @@ def test_points_dataframe_handles_zero_frame_rate() -> None:
         assert len(runtime_warnings) == 0
 
     assert "time" not in dataframe.columns
+
+
+def test_get_metadata_reads_header_without_decoding_data(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Metadata should come from the parameter section alone."""
+
+    reader = _tour_average_reader()
+    monkeypatch.setattr(
+        reader, "_load", lambda: pytest.fail("data section was decoded")
+    )
+
+    metadata = reader.get_metadata()
+
+    assert reader._c3d_data is None
+    assert metadata.marker_count == EXPECTED_MARKER_COUNT
+    assert metadata.frame_count == EXPECTED_FRAME_COUNT
+    assert metadata.analog_count == EXPECTED_ANALOG_COUNT
+
+
+def test_header_only_metadata_matches_full_load() -> None:
+    """Header-only metadata must agree with metadata from a full ezc3d load."""
+
+    header_only = _tour_average_reader().get_metadata()
+
+    loaded_reader = _tour_average_reader()
+    loaded_reader._load()
+    full = loaded_reader.get_metadata()
+
+    assert header_only == full
+
+
+def test_points_dataframe_loads_data_after_metadata_query() -> None:
+    """A data accessor after a metadata query should trigger the full load."""
+
+    reader = _tour_average_reader()
+    reader.get_metadata()
+    assert not _is_loaded(reader)
+
+    dataframe = reader.points_dataframe()
+
+    assert _is_loaded(reader)
+    assert dataframe.shape[0] == EXPECTED_FRAME_COUNT * EXPECTED_MARKER_COUNT
+
+
+def test_native_backend_matches_ezc3d_backend() -> None:
+    """The memory-mapped backend should produce identical tidy DataFrames."""
+
+    repository_root = Path(__file__).resolve().parents[2]
+    native_reader = load_tour_average_reader(repository_root, backend="native")
+    ezc3d_reader = _tour_average_reader()
+
+    pd.testing.assert_frame_equal(
+        native_reader.points_dataframe(target_units="mm"),
+        ezc3d_reader.points_dataframe(target_units="mm"),
+    )
+    pd.testing.assert_frame_equal(
+        native_reader.analog_dataframe(), ezc3d_reader.analog_dataframe()
+    )
+    assert native_reader.get_metadata() == ezc3d_reader.get_metadata()
+
+
+def test_reader_rejects_unknown_backend() -> None:
+    """Unknown backends should fail fast with ValueError."""
+
+    with pytest.raises(ValueError):
+        C3DDataReader(Path("capture.c3d"), backend="pyc3d")
+
+
+def test_native_backend_missing_file_raises_file_not_found(tmp_path: Path) -> None:
+    """The native backend should report missing files like the ezc3d backend."""
+
+    reader = C3DDataReader(tmp_path / "does_not_exist.c3d", backend="native")
+
+    with pytest.raises(FileNotFoundError):
+        reader.points_dataframe()
+
+
+def test_points_array_returns_frame_major_views() -> None:
+    """Unfiltered point arrays should be read-only views of the loaded block."""
+
+    reader = _tour_average_reader()
+    point_array = reader.points_array()
+    loaded_points = reader._load()["data"]["points"]
+
+    assert point_array.coordinates.shape == (
+        EXPECTED_FRAME_COUNT,
+        EXPECTED_MARKER_COUNT,
+        3,
+    )
+    assert point_array.residuals.shape == (EXPECTED_FRAME_COUNT, EXPECTED_MARKER_COUNT)
+    assert np.shares_memory(point_array.coordinates, loaded_points)
+    assert not point_array.coordinates.flags.writeable
+    assert point_array.label_index["WaistLeft"] == 1
+    assert point_array.time[1] == pytest.approx(1 / EXPECTED_FRAME_RATE_HZ)
+
+
+def test_points_array_matches_tidy_dataframe() -> None:
+    """Array and tidy outputs should agree for filters, thresholds and units."""
+
+    reader = _tour_average_reader()
+    options: dict[str, Any] = {
+        "markers": ["WaistRight", "WaistLeft"],
+        "target_units": "mm",
+    }
+    point_array = reader.points_array(**options)
+    dataframe = reader.points_dataframe(include_time=False, **options)
+
+    assert point_array.marker_labels == ["WaistLeft", "WaistRight"]
+    assert point_array.units == "mm"
+    for label in point_array.marker_labels:
+        expected = dataframe[dataframe["marker"] == label][["x", "y", "z"]]
+        np.testing.assert_array_equal(point_array.marker(label), expected.to_numpy())
+
+
+def test_aligned_streams_rejects_unknown_point_rate() -> None:
+    """A zero point rate is reported as a ValueError, not a ZeroDivisionError."""
+    reader = _stub_reader_with_points(frame_count=20, point_rate=0)
+
+    with pytest.raises(ValueError, match="rates must be positive"):
+        reader.aligned_streams()
+
+
+def test_points_array_applies_residual_threshold() -> None:
+    """Noisy samples should become NaN without modifying the loaded data."""
+
+    reader = _stub_reader_with_points(frame_count=2)
+    _loaded_data(reader)["data"]["meta_points"]["residuals"][0, 0, 1] = 2.0
+
+    point_array = reader.points_array(residual_nan_threshold=1.0)
+
+    assert np.isnan(point_array.coordinates[1, 0]).all()
+    assert np.isfinite(point_array.coordinates[0]).all()
+    assert _loaded_data(reader)["data"]["points"][0, 0, 1] == 0.0
+
+
+def test_points_dataframe_frame_window_keeps_absolute_frames() -> None:
+    """Frame windows should return absolute frame numbers and times."""
+
+    reader = _tour_average_reader()
+    full = reader.points_dataframe()
+    window = reader.points_dataframe(start_frame=100, end_frame=110)
+
+    assert window["frame"].min() == 100
+    assert window["frame"].max() == 109
+    assert len(window) == 10 * EXPECTED_MARKER_COUNT
+    expected = full[(full["frame"] >= 100) & (full["frame"] < 110)]
+    pd.testing.assert_frame_equal(window, expected.reset_index(drop=True))
+
+
+@pytest.mark.parametrize("backend", ["ezc3d", "native"])
+def test_iter_points_chunks_concatenate_to_full_table(backend: str) -> None:
+    """Chunked point reads should reproduce the full tidy table."""
+
+    repository_root = Path(__file__).resolve().parents[2]
+    reader = load_tour_average_reader(repository_root, backend=backend)
+
+    chunks = list(reader.iter_points_chunks(chunk_frames=100, target_units="mm"))
+
+    assert len(chunks) == 7
+    assert all(chunk["frame"].nunique() <= 100 for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True),
+        reader.points_dataframe(target_units="mm"),
+    )
+
+
+def test_native_chunks_do_not_decode_full_capture() -> None:
+    """The native backend should only decode the requested frame windows."""
+
+    repository_root = Path(__file__).resolve().parents[2]
+    reader = load_tour_average_reader(repository_root, backend="native")
+
+    for _ in reader.iter_points_chunks(chunk_frames=200):
+        pass
+
+    assert not reader._load()["data"].is_decoded("points")
+
+
+def test_analog_windows_and_chunks_keep_sample_indices() -> None:
+    """Analog windows should keep absolute sample numbers across chunks."""
+
+    analog_array = np.arange(24, dtype=float).reshape(2, 3, 4)
+    analog_parameters = {"LABELS": {"value": ["A", "B", "C"]}, "RATE": {"value": [200]}}
+    reader = _stub_reader_with_points(
+        frame_count=4,
+        analog_array=analog_array,
+        analog_parameters=analog_parameters,
+    )
+
+    full = reader.analog_dataframe()
+    window = reader.analog_dataframe(start_frame=1, end_frame=3)
+    chunks = list(reader.iter_analog_chunks(chunk_frames=3))
+
+    assert window["sample"].tolist()[0] == 2
+    pd.testing.assert_frame_equal(
+        window, full[full["sample"].between(2, 5)].reset_index(drop=True)
+    )
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), full)
+
+
+def test_frame_window_rejects_invalid_ranges() -> None:
+    """Negative starts, inverted windows and empty chunks should raise."""
+
+    reader = _stub_reader_with_points(frame_count=3)
+
+    with pytest.raises(ValueError):
+        reader.points_dataframe(start_frame=-1)
+    with pytest.raises(ValueError):
+        reader.points_array(start_frame=2, end_frame=1)
+    with pytest.raises(ValueError):
+        next(reader.iter_points_chunks(chunk_frames=0))
+
+
+def test_analog_windows_match_between_backends(tmp_path: Path) -> None:
+    """Subframe-interleaved analog windows should agree across backends."""
+
+    import ezc3d
+
+    capture = ezc3d.c3d()
+    capture["parameters"]["POINT"]["RATE"]["value"] = [100]
+    capture["parameters"]["POINT"]["LABELS"]["value"] = ("M1",)
+    capture["parameters"]["POINT"]["UNITS"]["value"] = ["m"]
+    capture["data"]["points"] = np.ones((4, 1, 10))
+    capture["parameters"]["ANALOG"]["RATE"]["value"] = [400]
+    capture["parameters"]["ANALOG"]["LABELS"]["value"] = ("Fx", "Fy")
+    capture["data"]["analogs"] = np.random.default_rng(0).random((1, 2, 40))
+    path = tmp_path / "analog.c3d"
+    capture.write(str(path))
+
+    ezc3d_window = C3DDataReader(path).analog_dataframe(start_frame=3, end_frame=5)
+    native_window = C3DDataReader(path, backend="native").analog_dataframe(
+        start_frame=3, end_frame=5
+    )
+
+    assert ezc3d_window["sample"].tolist()[::2] == list(range(12, 20))
+    pd.testing.assert_frame_equal(native_window, ezc3d_window)
@@ -117,3 +117,31 @@ def test_c3d_viewer_open_file_ux(qapp: QApplication) -> None:
                                 call(f"Loaded {filename} successfully."),
                             ]
                             mock_show_message.assert_has_calls(expected_calls)
+
+
+def test_marker_statistics_come_from_the_kinematics_engine() -> None:
+    """Viewer statistics and the analysis panel share one kinematics pass."""
+    import numpy as np
+    from apps.c3d_viewer import C3DDataModel, MarkerData, compute_marker_statistics
+
+    time = np.arange(200) / 100.0
+    positions = {
+        "club": np.stack([np.sin(time), time**2, np.zeros_like(time)], axis=1),
+        "hand": np.stack([time, np.cos(time), time], axis=1),
+    }
+    model = C3DDataModel(
+        filepath="swing.c3d",
+        markers={
+            name: MarkerData(name=name, position=pos) for name, pos in positions.items()
+        },
+        point_rate=100.0,
+        point_time=time,
+    )
+
+    kinematics = model.kinematics()
+    assert kinematics is not None and model.kinematics() is kinematics
+    summary = kinematics.summary()
+    for name, pos in positions.items():
+        statistics = compute_marker_statistics(time, pos)
+        for key, value in statistics.items():
+            assert value == pytest.approx(summary.loc[name, key])
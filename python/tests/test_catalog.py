@@ -0,0 +1,106 @@
+"""Tests for the SQLite capture metadata catalog."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.c3d_reader import C3DDataReader, C3DEvent, load_tour_average_reader
+from src.catalog import C3DCatalog
+
+
+def _library(tmp_path: Path) -> Path:
+    """Two copies of the tour-average capture in nested player folders."""
+
+    source = load_tour_average_reader().file_path
+    root = tmp_path / "library"
+    for folder in ("player_a/2019-03-14", "player_b"):
+        (root / folder).mkdir(parents=True)
+        shutil.copy(source, root / folder / "swing.c3d")
+    return root
+
+
+def test_refresh_indexes_and_updates_incrementally(tmp_path: Path) -> None:
+    """Only new, modified and deleted files change the catalog."""
+
+    root = _library(tmp_path)
+    database = tmp_path / "catalog.sqlite"
+
+    with C3DCatalog(database) as catalog:
+        first = catalog.refresh(root)
+        assert len(first.added) == 2 and len(catalog) == 2
+
+        second = catalog.refresh(root)
+        assert second.unchanged == 2 and not second.added and not second.updated
+
+        touched = root / "player_b" / "swing.c3d"
+        os.utime(touched, ns=(0, touched.stat().st_mtime_ns + 10**9))
+        (root / "player_a" / "2019-03-14" / "swing.c3d").unlink()
+        (root / "broken.c3d").write_bytes(b"not a capture")
+        third = catalog.refresh(root)
+
+    assert third.updated == [touched.resolve()]
+    assert len(third.removed) == 1
+    assert list(third.failed) == [(root / "broken.c3d").resolve()]
+    with C3DCatalog(database) as reopened:
+        assert [entry.path for entry in reopened] == [touched.resolve()]
+
+
+def test_refresh_skips_files_deleted_during_the_walk(tmp_path: Path) -> None:
+    """A capture removed mid-refresh is dropped instead of aborting the run."""
+
+    root = _library(tmp_path)
+    later = (root / "player_b" / "swing.c3d").resolve()
+
+    with C3DCatalog(tmp_path / "catalog.sqlite") as catalog:
+        catalog.refresh(root)
+        report = catalog.refresh(
+            root, progress=lambda *_: later.unlink(missing_ok=True)
+        )
+
+        assert report.removed == [later]
+        assert report.unchanged == 1 and not report.failed
+        assert len(catalog) == 1 and later not in {entry.path for entry in catalog}
+
+
+def test_query_filters_on_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Rate, marker, event and folder criteria are combined with AND."""
+
+    root = _library(tmp_path)
+    original = C3DDataReader.get_metadata
+
+    def with_events(reader: C3DDataReader) -> object:
+        metadata = original(reader)
+        if "player_a" in str(reader.file_path):
+            events = [C3DEvent("Ball Impact", 1.3), C3DEvent("Top", 1.1)]
+            return replace(metadata, events=events)
+        return metadata
+
+    monkeypatch.setattr(C3DDataReader, "get_metadata", with_events)
+
+    with C3DCatalog(":memory:") as catalog:
+        catalog.refresh(root)
+        reference = load_tour_average_reader().get_metadata()
+
+        assert len(catalog.query(frame_rate=360.0, markers=["Marker_2:2:1"])) == 2
+        assert catalog.query(frame_rate=120.0) == []
+        assert catalog.query(markers=["Marker_2:2:1", "NoSuchMarker"]) == []
+        impact = catalog.query(frame_rate=360.0, events=["impact"])
+        assert [entry.path.parent.parent.name for entry in impact] == ["player_a"]
+        assert len(catalog.query(under=root / "player_b")) == 1
+        entry = catalog.query(min_duration=1.0)[0]
+        assert entry.duration == pytest.approx(
+            reference.frame_count / reference.frame_rate
+        )
+
+        stored = catalog.metadata(impact[0].path)
+        assert stored.marker_labels == reference.marker_labels
+        assert [event.label for event in stored.events] == ["Top", "Ball Impact"]
+        with pytest.raises(KeyError):
+            catalog.metadata(root / "missing.c3d")
@@ -0,0 +1,110 @@
+"""Tests for banded dynamic time warping."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.c3d_reader import load_tour_average_reader
+from src.dtw import align_point_arrays, dtw, envelope, lb_keogh, nearest, warp
+
+
+def _naive_dtw(x: np.ndarray, y: np.ndarray, radius: int) -> float:
+    """Reference O(n * m) Python implementation of banded DTW."""
+
+    cost = np.full((len(x) + 1, len(y) + 1), np.inf)
+    cost[0, 0] = 0.0
+    for i in range(1, len(x) + 1):
+        for j in range(1, len(y) + 1):
+            if abs(i - j) > radius:
+                continue
+            distance = np.linalg.norm(x[i - 1] - y[j - 1])
+            cost[i, j] = distance + min(
+                cost[i - 1, j - 1], cost[i - 1, j], cost[i, j - 1]
+            )
+    return float(cost[-1, -1])
+
+
+@pytest.mark.parametrize(
+    ("length_x", "length_y", "radius"),
+    [(30, 30, 3), (25, 40, 2), (40, 25, 100), (1, 4, 0)],
+)
+def test_dtw_matches_naive_reference(length_x: int, length_y: int, radius: int) -> None:
+    """The vectorized kernel agrees with the cell-by-cell recursion."""
+
+    rng = np.random.default_rng(7)
+    x = rng.normal(size=(length_x, 3))
+    y = rng.normal(size=(length_y, 3))
+
+    result = dtw(x, y, radius)
+
+    expected_radius = max(radius, abs(length_x - length_y))
+    assert result.radius == expected_radius
+    assert result.distance == pytest.approx(_naive_dtw(x, y, expected_radius))
+    assert result.path is not None
+    assert tuple(result.path[0]) == (0, 0)
+    assert tuple(result.path[-1]) == (length_x - 1, length_y - 1)
+    assert (np.abs(result.path[:, 0] - result.path[:, 1]) <= expected_radius).all()
+    assert (np.diff(result.path, axis=0) >= 0).all()
+
+
+def test_dtw_recovers_time_shift() -> None:
+    """A delayed copy of a signal is aligned at zero cost."""
+
+    time = np.linspace(0, 1, 120)
+    x = np.sin(2 * np.pi * time)[:, None]
+    y = np.concatenate([np.zeros((10, 1)), x[:-10]])
+    x = np.concatenate([np.zeros((1, 1)), x[1:]])
+
+    result = dtw(x, y, radius=15)
+
+    assert result.distance < dtw(x, y, radius=0).distance
+    assert result.path is not None
+    warped = warp(y, result.path, len(x))
+    assert warped.shape == x.shape
+    np.testing.assert_allclose(warped[20:-20], x[20:-20], atol=0.05)
+    with pytest.raises(ValueError):
+        dtw(x, np.full((5, 1), np.nan))
+
+
+def test_lb_keogh_is_a_lower_bound() -> None:
+    """LB_Keogh never exceeds the DTW distance within the same band."""
+
+    rng = np.random.default_rng(11)
+    query = np.cumsum(rng.normal(size=(60, 2)), axis=0)
+    lower, upper = envelope(query, 4)
+
+    assert (lower <= query).all() and (upper >= query).all()
+    for _ in range(10):
+        candidate = np.cumsum(rng.normal(size=(rng.integers(55, 66), 2)), axis=0)
+        bound = lb_keogh(candidate, query, 4)
+        assert bound <= dtw(candidate, query, 4, return_path=False).distance + 1e-9
+
+
+def test_nearest_matches_brute_force() -> None:
+    """Pruned search returns the same neighbours as ranking every candidate."""
+
+    rng = np.random.default_rng(5)
+    query = np.cumsum(rng.normal(size=(50, 3)), axis=0)
+    candidates = [query + rng.normal(scale=s, size=query.shape) for s in range(1, 9)]
+    candidates.append(query[::-1].copy())
+
+    found = nearest(query, candidates, radius=5, k=3)
+
+    distances = [dtw(c, query, 5, return_path=False).distance for c in candidates]
+    expected = sorted(enumerate(distances), key=lambda item: item[1])[:3]
+    assert [index for index, _ in found] == [index for index, _ in expected]
+    np.testing.assert_allclose([d for _, d in found], [d for _, d in expected])
+
+
+def test_align_point_arrays_on_capture() -> None:
+    """Whole captures align on their shared markers."""
+
+    reader = load_tour_average_reader()
+    points, _ = reader.fill_gaps(markers="Waist*")
+
+    result = align_point_arrays(points, points)
+
+    assert result.distance == pytest.approx(0.0)
+    assert result.path is not None
+    np.testing.assert_array_equal(result.path[:, 0], result.path[:, 1])
@@ -0,0 +1,119 @@
+"""Tests for time-normalized trial ensemble averaging."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.c3d_reader import C3DPointArray, load_tour_average_reader
+from src.ensemble import (
+    EnsembleAccumulator,
+    ensemble_average,
+    ensemble_from_files,
+    time_normalize,
+)
+
+ANCHORS = {"address": 0.0, "top": 60.0, "impact": 80.0, "finish": 100.0}
+
+
+def _trial(frame_count: int, labels: list[str], scale: float = 1.0) -> C3DPointArray:
+    """Linear ramps from 0 to ``scale`` over the trial, one per marker axis."""
+
+    ramp = np.linspace(0.0, scale, frame_count)
+    coordinates = np.repeat(ramp[:, None, None], len(labels) * 3, axis=1).reshape(
+        frame_count, len(labels), 3
+    )
+    return C3DPointArray(
+        coordinates=coordinates,
+        residuals=np.zeros((frame_count, len(labels))),
+        marker_labels=labels,
+        label_index={label: idx for idx, label in enumerate(labels)},
+        frame_rate=100.0,
+        units="m",
+    )
+
+
+def test_time_normalize_uniform_and_piecewise() -> None:
+    """Events land exactly on their anchor percent."""
+
+    frames = np.arange(201, dtype=np.float64)
+
+    uniform = time_normalize(frames, samples=11)
+    piecewise = time_normalize(frames, 11, [20, 120, 200], [0.0, 50.0, 100.0])
+
+    np.testing.assert_allclose(uniform, np.arange(0, 201, 20))
+    assert piecewise[0] == 20
+    assert piecewise[5] == 120
+    assert piecewise[-1] == 200
+    np.testing.assert_allclose(piecewise[:6], np.linspace(20, 120, 6))
+    with pytest.raises(ValueError):
+        time_normalize(frames, 11, [20, 120], [0.0])
+    with pytest.raises(ValueError):
+        time_normalize(frames, 11, [120, 20], [0.0, 100.0])
+
+
+def test_ensemble_statistics_across_trials() -> None:
+    """Trials of different length are averaged on the common phase axis."""
+
+    labels = ["a", "b"]
+    trials = (
+        _trial(n, labels, scale) for n, scale in [(50, 1.0), (80, 2.0), (120, 3.0)]
+    )
+
+    result = ensemble_average(trials, samples=21, percentiles=(50.0,))
+
+    assert result.trials is not None and result.trials.shape == (3, 21, 2, 3)
+    np.testing.assert_allclose(result.mean[-1], 2.0)
+    np.testing.assert_allclose(result.std[-1], 1.0)
+    np.testing.assert_allclose(result.percentiles[50.0], result.mean)
+    np.testing.assert_allclose(result.mean, np.nanmean(result.trials, axis=0))
+    assert result.trial_count == 3
+
+
+def test_accumulator_matches_markers_by_label_and_gaps() -> None:
+    """Missing markers and gaps are excluded from the per-sample counts."""
+
+    accumulator = EnsembleAccumulator(samples=11, keep_trials=False)
+    accumulator.add(_trial(40, ["a", "b"], 1.0))
+    gapped = _trial(40, ["b", "c"], 3.0)
+    gapped.coordinates[:20] = np.nan
+    accumulator.add(gapped)
+
+    result = accumulator.result(percentiles=())
+
+    assert result.marker_labels == ["a", "b"]
+    assert result.count[:, 0].tolist() == [1] * 11
+    assert result.count[-1, 1] == 2 and result.count[0, 1] == 1
+    np.testing.assert_allclose(result.mean[-1, 1], 2.0)
+    assert np.isnan(result.std[0, 1]).all()
+    assert result.trials is None
+    with pytest.raises(ValueError):
+        accumulator.result()
+
+
+def test_anchored_ensemble_requires_events() -> None:
+    """Anchored ensembles need every anchor event of each trial."""
+
+    accumulator = EnsembleAccumulator(samples=6, anchors={"top": 50.0, "end": 0.0})
+    trial = _trial(100, ["a"])
+
+    normalized = accumulator.add(trial, {"end": 0, "top": 80})
+
+    assert normalized[-1, 0, 0] == pytest.approx(trial.coordinates[80, 0, 0])
+    with pytest.raises(KeyError):
+        accumulator.add(trial, {"top": 80})
+
+
+def test_ensemble_from_files_streams_captures() -> None:
+    """Captures are loaded one at a time and anchored on swing events."""
+
+    reader = load_tour_average_reader()
+
+    result = ensemble_from_files(
+        [reader.file_path, reader.file_path], anchors=ANCHORS, markers="club"
+    )
+
+    assert result.mean.shape == (101, 6, 3)
+    assert result.trial_count == 2
+    np.testing.assert_allclose(result.percentiles[5.0], result.mean, equal_nan=True)
+    assert np.nanmax(result.std) == pytest.approx(0.0)
@@ -0,0 +1,86 @@
+"""Tests for zero-phase batch filtering of marker trajectories."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from src.c3d_reader import load_tour_average_reader
+from src.filtering import FilterSpec, design_sos, filter_trajectories
+
+SAMPLE_RATE_HZ = 200.0
+
+
+def _noisy_block(frame_count: int = 400) -> tuple[np.ndarray, np.ndarray]:
+    """Slow sinusoids per marker/axis plus a 60 Hz disturbance."""
+
+    time = np.arange(frame_count) / SAMPLE_RATE_HZ
+    phases = np.arange(6).reshape(2, 3)
+    clean = np.sin(2 * np.pi * 1.5 * time[:, None, None] + phases)
+    noise = 0.2 * np.sin(2 * np.pi * 60.0 * time)[:, None, None]
+    return clean + noise, clean
+
+
+def test_filter_matches_per_column_sosfiltfilt() -> None:
+    """Filtering the block at once should equal filtering column by column."""
+
+    noisy, _ = _noisy_block()
+    spec = FilterSpec(cutoff=10.0, order=4)
+
+    filtered = filter_trajectories(noisy, SAMPLE_RATE_HZ, spec)
+
+    sos = signal.butter(4, 10.0, fs=SAMPLE_RATE_HZ, output="sos")
+    for marker in range(noisy.shape[1]):
+        for axis in range(3):
+            expected = signal.sosfiltfilt(sos, noisy[:, marker, axis])
+            np.testing.assert_allclose(filtered[:, marker, axis], expected)
+
+
+def test_filter_removes_noise_and_preserves_gaps() -> None:
+    """Gaps should be bridged for filtering and restored in the output."""
+
+    noisy, clean = _noisy_block()
+    noisy[100:110, 0] = np.nan
+    noisy[:5, 1, 2] = np.nan
+
+    filtered = filter_trajectories(noisy, SAMPLE_RATE_HZ, FilterSpec(cutoff=10.0))
+
+    np.testing.assert_array_equal(np.isnan(filtered), np.isnan(noisy))
+    interior = slice(150, -40)
+    assert np.nanmax(np.abs(filtered[interior] - clean[interior])) < 0.02
+
+
+def test_design_sos_is_cached_and_validated() -> None:
+    """SOS designs are reused per spec and reject cutoffs above Nyquist."""
+
+    spec = FilterSpec(kind="bessel", cutoff=(5.0, 20.0), btype="bandpass")
+
+    assert design_sos(spec, SAMPLE_RATE_HZ) is design_sos(spec, SAMPLE_RATE_HZ)
+    assert not design_sos(spec, SAMPLE_RATE_HZ).flags.writeable
+    with pytest.raises(ValueError):
+        design_sos(FilterSpec(cutoff=150.0), SAMPLE_RATE_HZ)
+    with pytest.raises(ValueError):
+        FilterSpec(kind="kalman")
+    with pytest.raises(ValueError):
+        FilterSpec(btype="notch")
+
+
+def test_reader_filtered_points_are_memoized_per_spec() -> None:
+    """Repeated requests reuse results until the reader is closed."""
+
+    reader = load_tour_average_reader()
+
+    first = reader.filtered_points(cutoff=10.0, markers="Waist*")
+    again = reader.filtered_points(cutoff=10.0, markers=["Waist*"])
+    other = reader.filtered_points(cutoff=6.0, markers="Waist*")
+
+    assert first is again
+    assert other is not first
+    assert first.marker_labels == reader.select_markers("Waist*")
+    assert not first.coordinates.flags.writeable
+    raw = reader.points_array(markers="Waist*").coordinates
+    assert np.nanmax(np.abs(first.coordinates - raw)) < 0.01
+
+    reader.close()
+    assert reader.filtered_points(cutoff=10.0, markers="Waist*") is not first
@@ -0,0 +1,128 @@
+"""Tests for vectorized marker gap filling."""
+
+from __future__ import annotations
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from src.c3d_reader import load_tour_average_reader
+from src.gap_filling import fill_gaps, gap_bounds
+
+
+def _rigid_cluster(frame_count: int = 120) -> npt.NDArray[np.float64]:
+    """Four markers of a rigid body rotating and translating smoothly."""
+
+    body = np.array(
+        [[0.0, 0.0, 0.0], [0.1, 0.0, 0.0], [0.0, 0.2, 0.0], [0.05, 0.05, 0.15]]
+    )
+    angles = np.linspace(0.0, np.pi / 2, frame_count)
+    cos, sin = np.cos(angles), np.sin(angles)
+    rotation = np.zeros((frame_count, 3, 3))
+    rotation[:, 0, 0], rotation[:, 0, 1] = cos, -sin
+    rotation[:, 1, 0], rotation[:, 1, 1] = sin, cos
+    rotation[:, 2, 2] = 1.0
+    translation = np.stack(
+        [np.linspace(0, 1, frame_count), np.zeros(frame_count), np.sin(angles)],
+        axis=1,
+    )
+    cluster: npt.NDArray[np.float64] = (
+        np.einsum("fij,mj->fmi", rotation, body) + translation[:, np.newaxis]
+    )
+    return cluster
+
+
+def test_gap_bounds_marks_bracketing_frames() -> None:
+    """Previous/following valid frames should bracket every gap."""
+
+    missing = np.array([[True], [False], [True], [True], [False], [True]])
+
+    previous, following = gap_bounds(missing)
+
+    assert previous[:, 0].tolist() == [-1, 1, 1, 1, 4, 4]
+    assert following[:, 0].tolist() == [1, 1, 4, 4, 4, 6]
+
+
+def test_linear_fill_is_exact_for_linear_motion_and_respects_max_gap() -> None:
+    """Linear filling should reproduce straight lines and skip long gaps."""
+
+    frames = np.arange(20, dtype=float)
+    coordinates = np.stack([frames, 2 * frames, -frames], axis=1)[:, np.newaxis]
+    coordinates = np.repeat(coordinates, 2, axis=1)
+    expected = coordinates.copy()
+    coordinates[3:5, 0] = np.nan
+    coordinates[8:15, 1] = np.nan
+    coordinates[0, 1] = np.nan
+
+    filled, report = fill_gaps(coordinates, "linear", max_gap=3)
+
+    np.testing.assert_allclose(filled[3:5, 0], expected[3:5, 0])
+    assert np.isnan(filled[8:15, 1]).all()
+    assert np.isnan(filled[0, 1]).all()
+    assert report.filled_counts.tolist() == [2, 0]
+    assert report.unfilled_counts.tolist() == [0, 8]
+    assert report.to_dataframe()["filled"].tolist() == [2, 0]
+
+
+def test_cubic_fill_groups_markers_with_identical_gaps() -> None:
+    """Cubic splines should reproduce smooth curves for every grouped marker."""
+
+    time = np.linspace(0, 1, 60)
+    curve = np.stack([time**2, time**3, np.ones_like(time)], axis=1)
+    coordinates = np.stack([curve, 2 * curve, curve + 1], axis=1)
+    expected = coordinates.copy()
+    coordinates[20:26, :2] = np.nan
+    coordinates[40:42, 2] = np.nan
+
+    filled, report = fill_gaps(coordinates, "cubic")
+
+    np.testing.assert_allclose(filled, expected, atol=1e-6)
+    assert report.filled_counts.tolist() == [6, 6, 2]
+
+
+def test_rigid_fill_reconstructs_marker_from_donors() -> None:
+    """Rigid-body filling should recover a marker hidden at the capture edges."""
+
+    expected = _rigid_cluster()
+    coordinates = expected.copy()
+    coordinates[:10, 3] = np.nan
+    coordinates[50:80, 3] = np.nan
+
+    filled, report = fill_gaps(coordinates, "rigid", marker_labels=["A", "B", "C", "D"])
+
+    np.testing.assert_allclose(filled, expected, atol=1e-9)
+    assert report.filled_counts.tolist() == [0, 0, 0, 40]
+
+
+def test_fill_gaps_validates_arguments() -> None:
+    """Unknown methods, negative gaps and bad shapes are rejected."""
+
+    coordinates = np.zeros((4, 2, 3))
+
+    with pytest.raises(ValueError):
+        fill_gaps(coordinates, "spline")
+    with pytest.raises(ValueError):
+        fill_gaps(coordinates, max_gap=-1)
+    with pytest.raises(ValueError):
+        fill_gaps(np.zeros((4, 2)))
+
+
+def test_reader_fill_gaps_rebuilds_club_marker() -> None:
+    """The reader should fill residual-flagged club gaps from the club cluster."""
+
+    reader = load_tour_average_reader()
+    original, _ = reader.fill_gaps("cubic", markers="club")
+    club = reader.select_markers("club")
+    observed = np.asarray(~np.isnan(original.coordinates).any(axis=2))
+    target = club.index("Marker_2:2:2")
+    frames = np.flatnonzero(observed[:, target])[200:230]
+    coordinates = np.array(original.coordinates)
+    coordinates[frames, target] = np.nan
+
+    filled, report = fill_gaps(coordinates, "rigid", marker_labels=club)
+
+    assert report.filled[frames, target].all()
+    np.testing.assert_allclose(
+        filled[frames, target], original.coordinates[frames, target], atol=1e-3
+    )
+    assert not original.coordinates.flags.writeable
@@ -0,0 +1,165 @@
+"""Tests for the Gears .gpcap streaming reader."""
+
+from __future__ import annotations
+
+import shutil
+import struct
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.gpcap_reader import GpcapReader, read_capture_info, read_session
+
+SESSION_DIRECTORY = (
+    Path(__file__).resolve().parents[2]
+    / "matlab"
+    / "Data"
+    / "Gears C3D Files"
+    / "Gears Capture Files"
+    / "Dieter Olson"
+    / "2019-03-14"
+)
+
+
+def _varint(value: int) -> bytes:
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def _field(number: int, value: int | float | bytes) -> bytes:
+    if isinstance(value, bytes):
+        return _varint(number << 3 | 2) + _varint(len(value)) + value
+    if isinstance(value, float):
+        return _varint(number << 3 | 5) + struct.pack("<f", value)
+    return _varint(number << 3) + _varint(value)
+
+
+def _marker(segment: int, index: int, xyz: tuple[float, float, float]) -> bytes:
+    coordinates = b"".join(
+        _field(axis, value) for axis, value in zip((1, 2, 3), xyz, strict=True)
+    )
+    return coordinates + _field(6, segment) + _field(7, segment) + _field(8, index)
+
+
+def _skeleton(names: list[str]) -> bytes:
+    blob = b"ASKL" + struct.pack("<III", 1, 1, len(names))
+    blob += struct.pack("<I", 8) + "Skeleton".encode("utf-16-le")
+    for index, name in enumerate(names, start=1):
+        blob += struct.pack("<III", 0, index, len(name)) + name.encode("utf-16-le")
+    return _field(1, len(names)) + _field(2, blob)
+
+
+def _write_capture(path: Path) -> None:
+    """Three frames: a head marker missing once and a club marker appearing late."""
+
+    header = (
+        _field(1, b"capture")
+        + _field(2, 3)
+        + _field(3, 100)
+        + _field(7, _field(3, b"Ada") + _field(5, b"Lovelace"))
+        + _field(9, _field(3, 0.01) + _field(4, 0.02) + _field(5, 0.03))
+        + _field(14, _skeleton(["WaistLeft", "HeadTop"]))
+    )
+    frames = [
+        [_marker(1, 2, (0.0, 1.5, 0.0)), _marker(1, 1, (0.1, 1.0, 0.0))],
+        [_marker(1, 1, (0.2, 1.0, 0.0)), _marker(0, 0, (9.0, 9.0, 9.0))],
+        [
+            _marker(3, 1, (0.5, 0.5, 0.5)),
+            _marker(1, 1, (0.3, 1.0, 0.0)),
+            _marker(1, 2, (0.0, 1.6, 0.0)),
+        ],
+    ]
+    records = b""
+    for index, markers in enumerate(frames):
+        body = b"".join(_field(4, marker) for marker in markers)
+        time = _field(1, index / 100) if index else b""
+        records += _field(15, time + _field(14, _field(1, 7) + body))
+    path.write_bytes(header + records)
+
+
+def test_synthetic_capture_decodes_into_point_layout(tmp_path: Path) -> None:
+    """Labels follow the skeleton, gaps are NaN and late markers are appended."""
+
+    path = tmp_path / "1 Capture.gpcap"
+    _write_capture(path)
+    reader = GpcapReader(path)
+
+    points = reader.points_array()
+    frames = list(reader.iter_frames())
+
+    assert points.marker_labels == ["WaistLeft", "HeadTop", "Marker_3:3:1"]
+    assert points.coordinates.shape == (3, 3, 3)
+    np.testing.assert_allclose(points.marker("WaistLeft")[:, 0], [0.1, 0.2, 0.3])
+    assert np.isnan(points.marker("HeadTop")[1]).all()
+    assert points.residuals[1, 1] == -1.0
+    assert np.isnan(points.marker("Marker_3:3:1")[:2]).all()
+    assert [frame.time for frame in frames] == pytest.approx([0.0, 0.01, 0.02])
+    assert frames[1].labels == ["WaistLeft"]
+    info = reader.info
+    assert info.player == "Ada Lovelace"
+    assert info.frame_rate == 100.0
+    assert [event.label for event in info.events] == ["Top", "Impact"]
+
+    path.write_bytes(path.read_bytes()[:-5])
+    with pytest.raises(ValueError, match="Truncated"):
+        GpcapReader(path).points_array()
+    # A marker block encoded as a varint is rejected, even under python -O.
+    path.write_bytes(_field(3, 100) + _field(15, _field(14, 7)))
+    with pytest.raises(ValueError, match="length-delimited field 14"):
+        list(GpcapReader(path).iter_frames())
+
+
+def test_shipped_capture_matches_c3d_export_layout() -> None:
+    """A real capture decodes to the 34 labeled markers of the C3D export."""
+
+    reader = GpcapReader(SESSION_DIRECTORY / "1 Capture.gpcap")
+
+    metadata = reader.get_metadata()
+    points = reader.points_array()
+    sidecar = read_capture_info(SESSION_DIRECTORY / "1 Capture.info")
+
+    assert metadata.frame_rate == 240.0
+    assert metadata.frame_count == 364
+    assert metadata.units == "m"
+    assert metadata.marker_count == reader.info.marker_count == 34
+    assert metadata.marker_labels[0] == "WaistLeft"
+    assert metadata.marker_labels[-1] == "Marker_3:3:3"
+    assert sidecar.capture_id == reader.info.capture_id
+    assert sidecar.player == reader.info.player == "Dieter Olson"
+    assert sidecar.duration == pytest.approx(metadata.duration, abs=1e-3)
+    # The stored impact time is the peak speed of the clubhead markers.
+    club = points.marker("Marker_3:3:1")
+    peak = int(np.nanargmax(np.linalg.norm(np.diff(club, axis=0), axis=1)))
+    impact = {event.label: event.time for event in metadata.events}["Impact"]
+    assert abs(peak - impact * metadata.frame_rate) <= 2
+
+
+def test_read_session_isolates_failures(tmp_path: Path) -> None:
+    """Captures are returned in number order and a bad file does not abort."""
+
+    for number in (2, 10):
+        name = f"{number} Capture.gpcap"
+        shutil.copy(SESSION_DIRECTORY / name, tmp_path / name)
+    (tmp_path / "3 Capture.gpcap").write_bytes(b"\xff\xff")
+    progress: list[int] = []
+
+    results = read_session(
+        tmp_path, workers=2, progress=lambda done, total, _: progress.append(done)
+    )
+
+    assert [result.path.name for result in results] == [
+        "2 Capture.gpcap",
+        "3 Capture.gpcap",
+        "10 Capture.gpcap",
+    ]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].points is not None and results[0].points.frame_count == 385
+    assert sorted(progress) == [1, 2, 3]
@@ -3,6 +3,9 @@
 import importlib.util
 import logging
 import random
+import subprocess
+import sys
+from pathlib import Path
 
 import numpy as np
 import pytest
@@ -137,6 +140,38 @@ class TestModuleImports:
         assert C3DEvent is not None
         assert callable(load_tour_average_reader)
 
+    def test_package_exports_load_lazily(self) -> None:
+        """Importing the package defers the reader and pandas to first use."""
+        code = (
+            "import sys, src\n"
+            "assert 'src.c3d_reader' not in sys.modules\n"
+            "assert 'pandas' not in sys.modules\n"
+            "from src import C3DDataReader\n"
+            "assert C3DDataReader is sys.modules['src.c3d_reader'].C3DDataReader\n"
+            "assert set(src.__all__) <= set(dir(src))\n"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parents[1],
+            check=True,
+        )
+
+    def test_package_exports_raise_when_unimportable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An unimportable reader raises on access instead of yielding None."""
+        import src
+
+        # Registered so the cached export is restored after the test.
+        monkeypatch.delitem(vars(src), "C3DEvent", raising=False)
+        monkeypatch.setitem(sys.modules, "src.c3d_reader", None)
+
+        with pytest.raises(ImportError):
+            src.C3DEvent  # noqa: B018
+        assert "C3DEvent" not in vars(src)
+        with pytest.raises(AttributeError):
+            src.not_an_export  # noqa: B018
+
 
 class TestCrossModuleFunctionality:
     """Test functionality that spans multiple modules."""
@@ -0,0 +1,119 @@
+"""Tests for vectorized marker kinematics."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.c3d_reader import load_tour_average_reader
+from src.kinematics import compute_kinematics, derivative
+
+FRAME_RATE_HZ = 100.0
+
+
+def _polynomial_block(frame_count: int = 200) -> tuple[np.ndarray, np.ndarray]:
+    """Cubic trajectories for two markers, whose jerk is constant."""
+
+    time = np.arange(frame_count) / FRAME_RATE_HZ
+    scales = np.arange(1.0, 7.0).reshape(2, 3)
+    return scales * time[:, None, None] ** 3, scales
+
+
+@pytest.mark.parametrize("method", ["central", "savgol"])
+def test_derivatives_of_cubic_trajectories(method: str) -> None:
+    """Velocity, acceleration and jerk of a cubic match the analytic values."""
+
+    positions, scales = _polynomial_block()
+    time = np.arange(positions.shape[0]) / FRAME_RATE_HZ
+
+    result = compute_kinematics(positions, FRAME_RATE_HZ, method=method)
+
+    interior = slice(10, -10)
+    velocity = 3 * scales * time[:, None, None] ** 2
+    acceleration = 6 * scales * time[:, None, None]
+    np.testing.assert_allclose(
+        result.velocity[interior], velocity[interior], rtol=1e-3, atol=1e-3
+    )
+    np.testing.assert_allclose(
+        result.acceleration[interior], acceleration[interior], rtol=1e-3, atol=1e-6
+    )
+    np.testing.assert_allclose(
+        result.jerk[interior], np.broadcast_to(6 * scales, velocity.shape)[interior]
+    )
+    assert not result.velocity.flags.writeable
+
+
+def test_derivative_matches_per_marker_gradient() -> None:
+    """Differentiating the block equals differentiating each marker alone."""
+
+    rng = np.random.default_rng(3)
+    positions = rng.normal(size=(50, 4, 3))
+
+    velocity = derivative(positions, FRAME_RATE_HZ)
+
+    for marker in range(positions.shape[1]):
+        expected = np.gradient(
+            positions[:, marker], 1 / FRAME_RATE_HZ, axis=0, edge_order=2
+        )
+        np.testing.assert_allclose(velocity[:, marker], expected)
+    with pytest.raises(ValueError):
+        derivative(positions, FRAME_RATE_HZ, method="spline")
+    with pytest.raises(ValueError):
+        derivative(positions, 0.0)
+
+
+def test_savgol_rejects_short_captures_and_low_polyorder() -> None:
+    """A window longer than the capture or a fit below the order is an error."""
+
+    positions, _ = _polynomial_block(frame_count=8)
+
+    with pytest.raises(ValueError, match="longer than the 8 available"):
+        derivative(positions, FRAME_RATE_HZ, method="savgol", window_length=11)
+    with pytest.raises(ValueError, match="polyorder 2 is below"):
+        derivative(positions, FRAME_RATE_HZ, 3, "savgol", window_length=5, polyorder=2)
+
+
+def test_summary_reports_path_length_and_peak_speed() -> None:
+    """The summary covers every marker, including ones that are never seen."""
+
+    frames = np.arange(20, dtype=np.float64)
+    positions = np.zeros((20, 3, 3))
+    positions[:, 0, 0] = frames  # constant speed of FRAME_RATE_HZ
+    positions[:, 1, 1] = np.where(frames < 10, 0.0, (frames - 10) ** 2)
+    positions[:, 2] = np.nan
+
+    result = compute_kinematics(
+        positions, FRAME_RATE_HZ, marker_labels=["a", "b", "c"], first_frame=5
+    )
+    summary = result.summary()
+
+    assert list(summary.index) == ["a", "b", "c"]
+    assert summary.loc["a", "path_length"] == pytest.approx(19.0)
+    assert summary.loc["a", "max_speed"] == pytest.approx(FRAME_RATE_HZ)
+    assert summary.loc["b", "peak_frame"] == 19 + 5
+    assert summary.loc["b", "peak_time"] == pytest.approx(24 / FRAME_RATE_HZ)
+    assert summary.loc["c", "peak_frame"] == -1
+    assert np.isnan(summary.loc["c", "max_speed"])
+    np.testing.assert_array_equal(result.marker("b", "speed"), result.speed[:, 1])
+    with pytest.raises(ValueError):
+        result.marker("a", "snap")
+
+
+def test_reader_kinematics_are_memoized() -> None:
+    """The reader caches kinematics per argument combination until closed."""
+
+    reader = load_tour_average_reader()
+
+    first = reader.kinematics(markers="club")
+    again = reader.kinematics(markers=["club"])
+    smoothed = reader.kinematics("savgol", markers="club", filter_cutoff=20.0)
+
+    assert first is again
+    assert smoothed is not first
+    assert first.marker_labels == reader.select_markers("club")
+    summary = first.summary()
+    assert (summary["max_speed"] > 0).all()
+    assert np.nanmax(smoothed.speed) < np.nanmax(first.speed)
+
+    reader.close()
+    assert reader.kinematics(markers="club") is not first
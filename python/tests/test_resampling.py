@@ -0,0 +1,99 @@
+"""Tests for point/analog resampling and stream alignment."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.c3d_reader import load_tour_average_reader
+from src.resampling import align_streams, rate_ratio, resample, resample_points
+
+POINT_RATE_HZ = 100.0
+ANALOG_RATE_HZ = 1000.0
+
+
+def test_rate_ratio_reduces_fractions() -> None:
+    """Rates are converted to the smallest integer up/down factors."""
+
+    assert rate_ratio(1000.0, 100.0) == (1, 10)
+    assert rate_ratio(360.0, 1080.0) == (3, 1)
+    assert rate_ratio(120.0, 100.0) == (5, 6)
+    with pytest.raises(ValueError):
+        rate_ratio(0.0, 100.0)
+
+
+def test_decimation_suppresses_aliasing() -> None:
+    """Content above the new Nyquist frequency is filtered out, not folded in."""
+
+    time = np.arange(2000) / ANALOG_RATE_HZ
+    slow = np.sin(2 * np.pi * 5.0 * time)
+    fast = np.sin(2 * np.pi * 190.0 * time)  # would alias to 10 Hz at 100 Hz
+    analogs = np.column_stack([slow + fast, 2 * slow])
+
+    decimated = resample(analogs, ANALOG_RATE_HZ, POINT_RATE_HZ)
+
+    assert decimated.shape == (200, 2)
+    expected = np.sin(2 * np.pi * 5.0 * time[::10])
+    interior = slice(10, -10)
+    np.testing.assert_allclose(decimated[interior, 0], expected[interior], atol=0.02)
+    np.testing.assert_allclose(
+        decimated[interior, 1], 2 * expected[interior], atol=0.02
+    )
+
+
+def test_resample_points_preserves_gaps() -> None:
+    """Upsampled trajectories stay NaN where the source frames were missing."""
+
+    time = np.arange(100) / POINT_RATE_HZ
+    coordinates = np.stack(
+        [np.sin(2 * np.pi * time + phase) for phase in range(6)], axis=1
+    ).reshape(100, 2, 3)
+    coordinates[40:45, 1] = np.nan
+
+    upsampled = resample_points(coordinates, POINT_RATE_HZ, ANALOG_RATE_HZ)
+
+    assert upsampled.shape == (1000, 2, 3)
+    assert not np.isnan(upsampled[:, 0]).any()
+    assert np.isnan(upsampled[400:440, 1]).all()
+    assert not np.isnan(upsampled[460:, 1]).any()
+    fine_time = np.arange(1000) / ANALOG_RATE_HZ
+    np.testing.assert_allclose(
+        upsampled[50:-50, 0, 0], np.sin(2 * np.pi * fine_time[50:-50]), atol=1e-3
+    )
+
+
+def test_align_streams_to_each_target() -> None:
+    """Both streams end up with the same length and timebase."""
+
+    points = np.zeros((100, 3, 3))
+    analogs = np.ones((1000, 4))
+
+    to_points = align_streams(points, POINT_RATE_HZ, analogs, ANALOG_RATE_HZ)
+    to_analogs = align_streams(
+        points, POINT_RATE_HZ, analogs, ANALOG_RATE_HZ, target="analogs"
+    )
+    common = align_streams(points, POINT_RATE_HZ, analogs, ANALOG_RATE_HZ, 250.0)
+
+    assert to_points.points.shape == (100, 3, 3)
+    assert to_points.analogs.shape == (100, 4)
+    np.testing.assert_allclose(to_points.analogs, 1.0)
+    assert to_analogs.points.shape == (1000, 3, 3)
+    assert to_analogs.rate == ANALOG_RATE_HZ
+    assert common.sample_count == 250
+    np.testing.assert_allclose(np.diff(common.time), 1 / 250.0)
+    with pytest.raises(ValueError):
+        align_streams(points, POINT_RATE_HZ, analogs, ANALOG_RATE_HZ, "force")
+
+
+def test_reader_aligned_streams() -> None:
+    """The reader aligns its own streams and keeps marker labels."""
+
+    reader = load_tour_average_reader()
+
+    aligned = reader.aligned_streams(720.0, markers="club")
+
+    metadata = reader.get_metadata()
+    assert aligned.rate == 720.0
+    assert aligned.sample_count == 2 * metadata.frame_count
+    assert aligned.marker_labels == reader.select_markers("club")
+    assert aligned.analogs.shape == (aligned.sample_count, 0)
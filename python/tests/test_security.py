@@ -75,3 +75,28 @@ def test_csv_injection_allowed_when_requested(tmp_path: Path) -> None:
     # Should be the raw malicious label
     assert actual_label == malicious_label
     assert not str(actual_label).startswith("'")
+
+
+def test_vectorized_sanitizer_matches_per_cell_semantics() -> None:
+    """The vectorized sanitizer should escape exactly what the scalar one does."""
+    values = ["=cmd", "+1", "-2", "@x", "safe", "'=quoted", 3, None, np.nan, ""]
+    series = pd.Series(values, dtype=object)
+
+    sanitized = C3DDataReader._sanitize_series(series)
+    expected = series.apply(C3DDataReader._sanitize_for_csv)
+
+    pd.testing.assert_series_equal(sanitized, expected)
+
+
+def test_vectorized_sanitizer_escapes_categories() -> None:
+    """Categorical columns are sanitized per category, including collisions."""
+    renamed = C3DDataReader._sanitize_series(
+        pd.Series(["=a", "b", "=a"], dtype="category")
+    )
+    collided = C3DDataReader._sanitize_series(
+        pd.Series(["=a", "'=a"], dtype="category")
+    )
+
+    assert isinstance(renamed.dtype, pd.CategoricalDtype)
+    assert renamed.tolist() == ["'=a", "b", "'=a"]
+    assert collided.tolist() == ["'=a", "'=a"]
@@ -0,0 +1,106 @@
+"""Tests for swing phase segmentation."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.c3d_reader import load_tour_average_reader
+from src.segmentation import (
+    detect_swing_events,
+    event_frames_from_times,
+    segment_swing,
+)
+
+FRAME_RATE_HZ = 100.0
+
+
+def _speed_profile() -> np.ndarray:
+    """Rest, backswing hump, pause at the top, fast downswing and slowdown."""
+
+    return np.concatenate(
+        [
+            np.full(20, 0.01),
+            np.sin(np.linspace(0, np.pi, 60)) * 3.0 + 0.1,
+            np.linspace(0.1, 20.0, 30),
+            np.linspace(19.0, 0.0, 40),
+            np.zeros(10),
+        ]
+    )
+
+
+def test_event_labels_are_normalized_to_frames() -> None:
+    """Aliases map onto the key events and times round to frame indices."""
+
+    events = [
+        ("Address", 0.1),
+        ("Top of Backswing", 0.504),
+        ("Ball-Impact", 0.8),
+        ("Foot Strike", 0.9),
+        ("Finish", 5.0),
+        ("impact", 0.95),
+    ]
+
+    frames = event_frames_from_times(events, FRAME_RATE_HZ, frame_count=200)
+
+    assert frames == {"address": 10, "top": 50, "impact": 80, "finish": 199}
+
+
+def test_segment_swing_builds_phases_and_durations() -> None:
+    """Phases are half-open, include the finish frame and skip missing events."""
+
+    segmentation = segment_swing(
+        {"address": 10, "top": 50, "impact": 80, "finish": 120}, FRAME_RATE_HZ
+    )
+
+    assert segmentation.phase_names == ["backswing", "downswing", "follow_through"]
+    assert segmentation.durations() == pytest.approx(
+        {"backswing": 0.4, "downswing": 0.3, "follow_through": 0.41}
+    )
+    values = np.arange(200 * 2).reshape(200, 2)
+    views = segmentation.slice_frames(values)
+    assert np.shares_memory(views["downswing"], values)
+    np.testing.assert_array_equal(views["downswing"], values[50:80])
+
+    partial = segment_swing({"top": 50, "impact": 80}, FRAME_RATE_HZ)
+    assert partial.phase_names == ["downswing"]
+    with pytest.raises(KeyError):
+        partial.phase("backswing")
+
+
+def test_detect_swing_events_from_speed() -> None:
+    """Impact is the peak, the top the pause before it, address the last rest."""
+
+    speed = _speed_profile()
+    speed[100] = np.nan
+
+    events = detect_swing_events(speed)
+
+    assert events["impact"] == 109
+    assert events["top"] == 80
+    address = events["address"]
+    assert 20 <= address < 30
+    assert speed[address] <= 1.0 < speed[address + 1]
+    assert 140 <= events["finish"] < 160
+    with pytest.raises(ValueError):
+        detect_swing_events(np.full(10, np.nan))
+
+
+def test_reader_phase_slices_share_memory() -> None:
+    """Without labeled events, phases are detected and sliced without copies."""
+
+    reader = load_tour_average_reader()
+
+    segmentation = reader.segment_swing()
+    phases = reader.phase_points(segmentation)
+    full = reader.points_array()
+
+    assert segmentation.source == "detected"
+    assert list(phases) == ["backswing", "downswing", "follow_through"]
+    frames = segmentation.event_frames
+    assert frames["address"] < frames["top"] < frames["impact"] < frames["finish"]
+    downswing = phases["downswing"]
+    assert downswing.first_frame == frames["top"]
+    assert np.shares_memory(downswing.coordinates, full.coordinates)
+    assert downswing.frame_count == frames["impact"] - frames["top"]
+    assert set(reader.phase_analogs(segmentation)) == set(phases)
@@ -0,0 +1,93 @@
+"""Tests for the synthetic C3D capture generator."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.c3d_native import C3DMemmap
+from src.c3d_reader import C3DDataReader
+from src.synthetic import (
+    SyntheticCapture,
+    synthetic_analogs,
+    synthetic_points,
+    write_synthetic_c3d,
+)
+
+EZC3D_AVAILABLE = importlib.util.find_spec("ezc3d") is not None
+BACKENDS = ["native"] + (["ezc3d"] if EZC3D_AVAILABLE else [])
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_written_capture_reads_back_exactly(tmp_path: Path, backend: str) -> None:
+    """Points, gaps, analog subframes and events survive a round trip."""
+
+    capture = SyntheticCapture(
+        frame_count=300, analog_channels=3, analog_subframes=4, gaps_per_marker=2
+    )
+    path = write_synthetic_c3d(tmp_path / "capture.c3d", capture)
+
+    reader = C3DDataReader(path, backend=backend)
+    metadata = reader.get_metadata()
+    points = reader.points_array()
+    analogs = reader.analog_dataframe()
+    coordinates, residuals = synthetic_points(capture)
+
+    assert metadata.marker_labels == capture.marker_labels
+    assert metadata.frame_count == 300
+    assert metadata.analog_labels == ["Channel_1", "Channel_2", "Channel_3"]
+    assert metadata.analog_rate == pytest.approx(capture.analog_rate)
+    assert [event.label for event in metadata.events] == [
+        "Address",
+        "Top",
+        "Impact",
+        "Finish",
+    ]
+    assert metadata.events[2].time == pytest.approx(0.7 * capture.duration)
+    np.testing.assert_allclose(points.coordinates, coordinates, rtol=1e-6)
+    assert np.isnan(coordinates).any()
+    assert len(analogs) == 300 * 4 * 3
+    np.testing.assert_allclose(
+        analogs["value"].to_numpy().reshape(-1, 3), synthetic_analogs(capture)
+    )
+    np.testing.assert_allclose(C3DMemmap(path).residuals(), residuals)
+
+
+def test_output_is_deterministic_and_independent_of_chunking(tmp_path: Path) -> None:
+    """The same specification yields the same bytes; the seed changes them."""
+
+    capture = SyntheticCapture(frame_count=200, analog_channels=2, gaps_per_marker=1)
+
+    first = write_synthetic_c3d(tmp_path / "a.c3d", capture).read_bytes()
+    chunked = write_synthetic_c3d(tmp_path / "b.c3d", capture, chunk_samples=50)
+    reseeded = SyntheticCapture(frame_count=200, analog_channels=2, seed=1)
+
+    assert chunked.read_bytes() == first
+    assert write_synthetic_c3d(tmp_path / "c.c3d", reseeded).read_bytes() != first
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_long_and_wide_captures_exceed_header_limits(
+    tmp_path: Path, backend: str
+) -> None:
+    """Over 65535 frames and over 255 marker labels are read in full."""
+
+    long_capture = SyntheticCapture(marker_count=2, frame_count=70_000, events=())
+    wide_capture = SyntheticCapture(marker_count=300, frame_count=5)
+    long_path = write_synthetic_c3d(tmp_path / "long.c3d", long_capture)
+    wide_path = write_synthetic_c3d(tmp_path / "wide.c3d", wide_capture)
+
+    long_reader = C3DDataReader(long_path, backend=backend)
+    wide_reader = C3DDataReader(wide_path, backend=backend)
+
+    assert long_reader.get_metadata().frame_count == 70_000
+    tail = long_reader.points_array().coordinates[-3:]
+    np.testing.assert_allclose(tail, synthetic_points(long_capture, 69_997)[0])
+    labels = wide_reader.get_metadata().marker_labels
+    assert len(labels) == 300
+    assert labels[:2] == ["WaistLeft", "WaistRight"]
+    assert labels[-1] == "Synthetic_300"
+    assert wide_reader.points_array().coordinates.shape == (5, 300, 3)